@@ -0,0 +1,430 @@
+"""A local stand-in for the Spotify Web API, for offline benchmarks and load tests.
+
+Serves synthetic playlists of any size, recently-played history, track
+lookups, recommendations and playlist writes, with Spotify's pagination
+(`offset`/`limit`/`next`, `before` cursors), configurable latency and
+injected 429 responses. Every request is counted per endpoint.
+
+Playlist contents are deterministic: a playlist whose ID contains
+`size<N>` (e.g. `gymsize10000`; spotipy only accepts base62 IDs) has N
+tracks, any other ID gets `playlist_size` tracks. Tracks are
+drawn from a catalogue of `catalogue_size` IDs, so playlists overlap the
+way real sources do. Writes replace the synthetic contents and bump the
+snapshot_id. The `fields` filter is honoured for ID-only item fetches;
+other field lists get full objects.
+
+In-process, with a spotipy client pointed at it:
+
+    with FakeSpotify(FakeSpotifyConfig(latency_ms=30)) as fake:
+        spotify = fake.client()
+        spotify.playlist_items("mixsize10000", limit=100)
+        fake.stats()  # {"GET /v1/playlists/{playlist_id}/items": 1}
+
+As a subprocess, for load-testing the app with SPOTIFY_API_PREFIX set to
+the printed URL:
+
+    python -m benchmarks.fake_spotify [--port 8900] [--latency-ms 50] [--throttle-every 200]
+"""
+import argparse
+import asyncio
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import spotipy
+import uvicorn
+from fastapi import Body, Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+_MAX_PAGE = 100  # Spotify's maximum for playlist items
+_MAX_RECENT_PAGE = 50
+_PLAY_INTERVAL_MS = 200_000  # spacing of the synthetic listening history
+_SIZED_ID_RE = re.compile(r"size(\d+)")
+
+
+@dataclass
+class FakeSpotifyConfig:
+    playlist_size: int = 1_000  # tracks of a playlist whose ID carries no size
+    catalogue_size: int = 1_000_000  # distinct track IDs playlists draw from
+    recently_played: int = 500  # plays in the listening history
+    latency_ms: float = 0.0  # added to every response
+    jitter_ms: float = 0.0  # random extra latency, up to this much
+    throttle_every: int = 0  # answer every Nth request with 429 (0 = never)
+    retry_after: int = 1  # Retry-After seconds of an injected 429
+    seed: int = 0  # varies the generated contents
+
+
+class _Throttled(Exception):
+    pass
+
+
+def _track_id(index: int) -> str:
+    return f"fake{index:018d}"  # 22 characters, like a real Spotify ID
+
+
+def _track(index: int) -> dict:
+    artist = index % 5_000
+    track_id = _track_id(index)
+    return {
+        "id": track_id,
+        "name": f"Track {index}",
+        "artists": [{"id": f"artist{artist}", "name": f"Artist {artist}"}],
+        "duration_ms": 120_000 + (index * 7_919) % 240_000,
+        "uri": f"spotify:track:{track_id}",
+        "album": {"name": f"Album {index // 12}", "images": []},
+    }
+
+
+def _index_of(track_id: str) -> int:
+    track_id = track_id.rsplit(":", 1)[-1]
+    return int(track_id[4:]) if track_id.startswith("fake") and track_id[4:].isdigit() else 0
+
+
+def _item(track_id: str, ids_only: bool) -> dict:
+    if ids_only:
+        return {"track": {"id": track_id}}
+    return {"added_at": "2024-01-01T00:00:00Z", "track": _track(_index_of(track_id))}
+
+
+class FakeSpotifyState:
+    """The server's data and request counts."""
+
+    def __init__(self, config: FakeSpotifyConfig) -> None:
+        self.config = config
+        self.calls: Counter[str] = Counter()
+        self.throttled = 0
+        self.written: dict[str, list[str]] = {}  # playlist ID -> track IDs
+        self._generated: dict[str, list[str]] = {}
+        self.versions: Counter[str] = Counter()
+        self.history_end_ms = int(time.time() * 1000)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._rng = random.Random(config.seed)
+
+    def playlist_track_ids(self, playlist_id: str) -> list[str]:
+        if playlist_id in self.written:
+            return self.written[playlist_id]
+        if playlist_id not in self._generated:
+            match = _SIZED_ID_RE.search(playlist_id)
+            size = int(match.group(1)) if match else self.config.playlist_size
+            salt = f"{self.config.seed}:{playlist_id}:"
+            self._generated[playlist_id] = [
+                _track_id(zlib.crc32(f"{salt}{i}".encode()) % self.config.catalogue_size)
+                for i in range(size)
+            ]
+        return self._generated[playlist_id]
+
+    def playlist_items(
+        self, playlist_id: str, offset: int, limit: int, fields: str | None = None
+    ) -> tuple[list[dict], int]:
+        """One page of playlist items and the playlist's total."""
+        track_ids = self.playlist_track_ids(playlist_id)
+        ids_only = bool(fields) and "track(id)" in fields
+        return [_item(t, ids_only) for t in track_ids[offset:offset + limit]], len(track_ids)
+
+    def snapshot_id(self, playlist_id: str) -> str:
+        return f"{playlist_id}-v{self.versions[playlist_id]}"
+
+    def record(self, endpoint: str) -> bool:
+        """Count a request; False if it should be answered with 429."""
+        with self._lock:
+            self._requests += 1
+            throttle = (
+                self.config.throttle_every > 0
+                and self._requests % self.config.throttle_every == 0
+            )
+            if throttle:
+                self.throttled += 1
+            else:
+                self.calls[endpoint] += 1
+            return not throttle
+
+    def delay(self) -> float:
+        jitter = self._rng.uniform(0, self.config.jitter_ms) if self.config.jitter_ms else 0.0
+        return (self.config.latency_ms + jitter) / 1000
+
+    def write(self, playlist_id: str, track_ids: list[str]) -> dict:
+        self.written[playlist_id] = track_ids
+        self.versions[playlist_id] += 1
+        return {"snapshot_id": self.snapshot_id(playlist_id)}
+
+
+def _page(request: Request, items: list, total: int, offset: int, limit: int) -> dict:
+    following = offset + limit
+    next_url = (
+        str(request.url.include_query_params(offset=following, limit=limit))
+        if following < total else None
+    )
+    return {
+        "href": str(request.url),
+        "items": items,
+        "limit": limit,
+        "offset": offset,
+        "total": total,
+        "next": next_url,
+    }
+
+
+def create_app(config: FakeSpotifyConfig | None = None) -> FastAPI:
+    """The fake Web API as an ASGI app, mounted under /v1 like the real one."""
+    state = FakeSpotifyState(config or FakeSpotifyConfig())
+
+    async def gate(request: Request) -> FakeSpotifyState:
+        endpoint = f"{request.method} {request.scope['route'].path}"
+        if not state.record(endpoint):
+            raise _Throttled()
+        if delay := state.delay():
+            await asyncio.sleep(delay)
+        return state
+
+    app = FastAPI(title="Fake Spotify Web API")
+    app.state.fake = state
+
+    @app.exception_handler(_Throttled)
+    async def throttled(request: Request, exc: _Throttled) -> JSONResponse:
+        return JSONResponse(
+            {"error": {"status": 429, "message": "API rate limit exceeded"}},
+            status_code=429,
+            headers={"Retry-After": str(state.config.retry_after)},
+        )
+
+    @app.get("/_fake/stats")
+    async def stats() -> dict:
+        return {"calls": dict(state.calls), "throttled": state.throttled}
+
+    @app.get("/v1/me")
+    async def me(s: FakeSpotifyState = Depends(gate)) -> dict:
+        return {"id": "fake_user", "display_name": "Fake User", "email": None, "images": []}
+
+    @app.get("/v1/tracks/{track_id}")
+    async def track(track_id: str, s: FakeSpotifyState = Depends(gate)) -> dict:
+        return _track(_index_of(track_id))
+
+    @app.get("/v1/tracks")
+    async def tracks(ids: str, s: FakeSpotifyState = Depends(gate)) -> dict:
+        return {"tracks": [_track(_index_of(i)) for i in ids.split(",") if i]}
+
+    @app.get("/v1/playlists/{playlist_id}")
+    async def playlist(playlist_id: str, s: FakeSpotifyState = Depends(gate)) -> dict:
+        return {
+            "id": playlist_id,
+            "name": f"Playlist {playlist_id}",
+            "snapshot_id": s.snapshot_id(playlist_id),
+            "tracks": {"total": len(s.playlist_track_ids(playlist_id))},
+            "images": [],
+            "owner": {"display_name": "Fake User"},
+        }
+
+    @app.get("/v1/playlists/{playlist_id}/items")
+    @app.get("/v1/playlists/{playlist_id}/tracks")
+    async def playlist_items(
+        request: Request,
+        playlist_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        fields: str | None = None,
+        s: FakeSpotifyState = Depends(gate),
+    ) -> dict:
+        limit = max(1, min(limit, _MAX_PAGE))
+        items, total = s.playlist_items(playlist_id, offset, limit, fields)
+        return _page(request, items, total, offset, limit)
+
+    @app.put("/v1/playlists/{playlist_id}/items")
+    @app.put("/v1/playlists/{playlist_id}/tracks")
+    async def replace_items(
+        playlist_id: str, body: dict = Body(...), s: FakeSpotifyState = Depends(gate)
+    ) -> dict:
+        return s.write(playlist_id, [u.rsplit(":", 1)[-1] for u in body.get("uris", [])])
+
+    @app.post("/v1/playlists/{playlist_id}/items", status_code=201)
+    @app.post("/v1/playlists/{playlist_id}/tracks", status_code=201)
+    async def add_items(
+        playlist_id: str, body: list | dict = Body(...), s: FakeSpotifyState = Depends(gate)
+    ) -> dict:
+        uris = body if isinstance(body, list) else body.get("uris", [])
+        current = list(s.playlist_track_ids(playlist_id))
+        return s.write(playlist_id, current + [u.rsplit(":", 1)[-1] for u in uris])
+
+    @app.delete("/v1/playlists/{playlist_id}/items")
+    @app.delete("/v1/playlists/{playlist_id}/tracks")
+    async def remove_items(
+        playlist_id: str, body: dict = Body(...), s: FakeSpotifyState = Depends(gate)
+    ) -> dict:
+        removed = {
+            i["uri"].rsplit(":", 1)[-1] for i in body.get("items", body.get("tracks", []))
+        }
+        current = s.playlist_track_ids(playlist_id)
+        return s.write(playlist_id, [t for t in current if t not in removed])
+
+    @app.get("/v1/me/player/recently-played")
+    async def recently_played(
+        request: Request,
+        limit: int = 50,
+        before: int | None = None,
+        s: FakeSpotifyState = Depends(gate),
+    ) -> dict:
+        limit = max(1, min(limit, _MAX_RECENT_PAGE))
+        # Play k happened k intervals before the history's end, newest first
+        first = 0 if before is None else max(
+            0, (s.history_end_ms - before) // _PLAY_INTERVAL_MS + 1
+        )
+        plays = range(first, min(first + limit, s.config.recently_played))
+        items = []
+        for k in plays:
+            played_ms = s.history_end_ms - k * _PLAY_INTERVAL_MS
+            index = zlib.crc32(f"{s.config.seed}:play:{k}".encode()) % s.config.catalogue_size
+            items.append({
+                "track": _track(index),
+                "played_at": datetime.fromtimestamp(played_ms / 1000, timezone.utc)
+                .isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            })
+        oldest = s.history_end_ms - (plays[-1] * _PLAY_INTERVAL_MS) if plays else None
+        has_more = bool(plays) and plays[-1] + 1 < s.config.recently_played
+        return {
+            "href": str(request.url),
+            "items": items,
+            "limit": limit,
+            "cursors": {"before": str(oldest)} if oldest else None,
+            "next": str(request.url.include_query_params(before=oldest, limit=limit))
+            if has_more else None,
+        }
+
+    @app.get("/v1/recommendations")
+    async def recommendations(
+        limit: int = 20, seed_tracks: str = "", s: FakeSpotifyState = Depends(gate)
+    ) -> dict:
+        rng = random.Random(f"{s.config.seed}:{seed_tracks}")
+        count = max(1, min(limit, 100))
+        return {"tracks": [_track(rng.randrange(s.config.catalogue_size)) for _ in range(count)]}
+
+    @app.get("/v1/me/playlists")
+    async def my_playlists(
+        request: Request, limit: int = 50, offset: int = 0, s: FakeSpotifyState = Depends(gate)
+    ) -> dict:
+        total = 40
+        items = [
+            {
+                "id": f"mine{i}",
+                "name": f"My playlist {i}",
+                "tracks": {"total": s.config.playlist_size},
+                "images": [],
+                "owner": {"display_name": "Fake User"},
+            }
+            for i in range(offset, min(offset + limit, total))
+        ]
+        return _page(request, items, total, offset, limit)
+
+    @app.get("/v1/me/top/tracks")
+    @app.get("/v1/me/tracks")
+    async def my_tracks(
+        request: Request, limit: int = 20, offset: int = 0, s: FakeSpotifyState = Depends(gate)
+    ) -> dict:
+        total = 200
+        items = [_track(i) for i in range(offset, min(offset + limit, total))]
+        if request.url.path.endswith("/me/tracks"):
+            items = [{"added_at": "2024-01-01T00:00:00Z", "track": t} for t in items]
+        return _page(request, items, total, offset, limit)
+
+    @app.get("/v1/search")
+    async def search(
+        request: Request, q: str, limit: int = 10, offset: int = 0,
+        s: FakeSpotifyState = Depends(gate),
+    ) -> dict:
+        total = 1_000
+        base = zlib.crc32(q.encode()) % s.config.catalogue_size
+        items = [
+            _track((base + i) % s.config.catalogue_size)
+            for i in range(offset, min(offset + limit, total))
+        ]
+        return {"tracks": _page(request, items, total, offset, limit)}
+
+    return app
+
+
+class FakeSpotify:
+    """Runs the fake API on a local port in a background thread."""
+
+    def __init__(self, config: FakeSpotifyConfig | None = None, port: int = 0) -> None:
+        self.app = create_app(config)
+        self._server = uvicorn.Server(
+            uvicorn.Config(self.app, host="127.0.0.1", port=port, log_level="warning")
+        )
+        self._thread: threading.Thread | None = None
+
+    @property
+    def state(self) -> FakeSpotifyState:
+        return self.app.state.fake
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as a client prefix, ending in /v1/."""
+        port = self._server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1/"
+
+    def start(self) -> "FakeSpotify":
+        self._thread = threading.Thread(target=self._server.run, name="fake-spotify", daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("Fake Spotify server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeSpotify":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def client(self, client_class: type[spotipy.Spotify] = spotipy.Spotify, **kwargs) -> spotipy.Spotify:
+        """A spotipy client (or subclass, e.g. RateLimitedSpotify) talking to this server."""
+        spotify = client_class(auth="fake-token", **kwargs)
+        spotify.prefix = self.url
+        return spotify
+
+    def stats(self) -> dict[str, int]:
+        """Requests served per endpoint (429s not included)."""
+        return dict(self.state.calls)
+
+    def reset_stats(self) -> None:
+        self.state.calls.clear()
+        self.state.throttled = 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--playlist-size", type=int, default=FakeSpotifyConfig.playlist_size)
+    parser.add_argument("--recently-played", type=int, default=FakeSpotifyConfig.recently_played)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=int, default=FakeSpotifyConfig.retry_after)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = FakeSpotifyConfig(
+        playlist_size=args.playlist_size,
+        recently_played=args.recently_played,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_every=args.throttle_every,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    print(f"SPOTIFY_API_PREFIX=http://127.0.0.1:{args.port}/v1/", flush=True)
+    uvicorn.run(create_app(config), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Per-row cost of persisting generation history: ORM unit of work vs bulk insert.
+
+Usage:
+    python -m benchmarks.history_insert [--sizes 1000 10000 50000]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from playlist_generator.database import Base
+from playlist_generator.models.history import GenerationHistory, GenerationHistoryTrack
+from playlist_generator.models.user import User
+from playlist_generator.services.generation import TrackInfo, _persist_history
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+
+
+async def _orm_per_row(history: GenerationHistory, tracks: list[TrackInfo], db: AsyncSession) -> None:
+    """The previous implementation: one ORM object per track."""
+    db.add(history)
+    await db.flush()
+    for i, track in enumerate(tracks):
+        db.add(GenerationHistoryTrack(
+            generation_id=history.id,
+            spotify_track_id=track.spotify_id,
+            track_name=track.name,
+            artist_name=track.artist,
+            duration_ms=track.duration_ms,
+            is_discovery=1 if track.is_discovery else 0,
+            position=i,
+        ))
+    await db.commit()
+
+
+async def _time_strategy(strategy, size: int, db_path: str) -> float:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        user = User(
+            spotify_user_id="bench",
+            access_token="x",
+            refresh_token="x",
+            token_expires_at=0,
+        )
+        db.add(user)
+        await db.commit()
+
+        tracks = [
+            TrackInfo(f"track{i:022d}", f"Track {i}", f"Artist {i % 500}", 200_000)
+            for i in range(size)
+        ]
+        history = GenerationHistory(
+            user_id=user.id, target_playlist_id="bench", track_count=size
+        )
+        start = time.perf_counter()
+        await strategy(history, tracks, db)
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return elapsed
+
+
+async def run(sizes: list[int]) -> list[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        for size in sizes:
+            orm = await _time_strategy(_orm_per_row, size, db_path)
+            bulk = await _time_strategy(_persist_history, size, db_path)
+            rows.append({
+                "rows": size,
+                "orm_total_s": orm,
+                "bulk_total_s": bulk,
+                "orm_us_per_row": orm / size * 1e6,
+                "bulk_us_per_row": bulk / size * 1e6,
+                "speedup": orm / bulk if bulk else float("inf"),
+            })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}  {'orm µs/row':>11}  {'bulk µs/row':>11}  {'speedup':>7}")
+    for row in asyncio.run(run(args.sizes)):
+        print(
+            f"{row['rows']:>8}  {row['orm_us_per_row']:>11.1f}  "
+            f"{row['bulk_us_per_row']:>11.1f}  {row['speedup']:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""Per-stage cost of the generation pipeline at growing candidate pool sizes.
+
+Times each stage of `services.generation` against a mocked Spotify (the
+fake API's synthetic playlists, served in-process without HTTP), reporting
+wall time, tracemalloc peak and Spotify calls per stage:
+
+    collect         _gather_base_pool and storing its snapshots, cold caches
+    collect_cached  the same again, snapshots unchanged
+    blacklist       _gather_blacklist and storing its checks, first compile
+    filter          excluding the blacklist from the pool
+    shuffle         _select_tracks over the whole pool, no limits
+    limits          _select_tracks with a long minutes limit
+    select          _select_tracks with a typical track limit
+    history         _persist_history of the shuffled pool
+    pool_save       candidate_pool.save
+    pool_load       candidate_pool.load
+
+Each repeat starts from a fresh database and empty playlist caches; wall
+times are the median over repeats. tracemalloc slows allocation-heavy
+stages, so pass --no-memory for timings comparable to production.
+Results are written as JSON for regression tracking.
+
+Usage:
+    python -m benchmarks.pipeline [--sizes 1000 10000 100000] [--repeat 3]
+        [--output results.json] [--latency-ms 0] [--http] [--no-memory]
+"""
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.fake_spotify import FakeSpotify, FakeSpotifyConfig, FakeSpotifyState
+from playlist_generator.config import settings
+from playlist_generator.database import Base
+from playlist_generator.models.base_list import BasePlaylist, BaseTrack
+from playlist_generator.models.blacklist import BlacklistPlaylist, BlacklistTrack
+from playlist_generator.models.history import GenerationHistory
+from playlist_generator.models.user import User
+from playlist_generator.services import candidate_pool, playlist_cache
+from playlist_generator.services import generation as gen
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+STAGES = [
+    "collect", "collect_cached", "blacklist", "filter", "shuffle",
+    "limits", "select", "history", "pool_save", "pool_load",
+]
+_PLAYLIST_SIZE = 10_000  # largest base playlist; bigger pools are split
+_SELECT_TRACKS = 200
+_LIMIT_MINUTES = 600
+
+
+class MockSpotify:
+    """The spotipy methods generation uses, answered from the fake API's data.
+
+    Calls are counted per method. `latency_ms` is slept in the calling
+    (executor) thread, as a network round trip would be.
+    """
+
+    def __init__(self, state: FakeSpotifyState, latency_ms: float = 0.0) -> None:
+        self._state = state
+        self._latency = latency_ms / 1000
+        self._calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def _record(self, method: str) -> None:
+        with self._lock:
+            self._calls[method] += 1
+        if self._latency:
+            time.sleep(self._latency)
+
+    def calls(self) -> Counter[str]:
+        with self._lock:
+            return Counter(self._calls)
+
+    def playlist(self, playlist_id, fields=None, market=None, additional_types=("track",)):
+        self._record("playlist")
+        return {
+            "id": playlist_id,
+            "name": playlist_id,
+            "snapshot_id": self._state.snapshot_id(playlist_id),
+            "tracks": {"total": len(self._state.playlist_track_ids(playlist_id))},
+        }
+
+    def playlist_tracks(self, playlist_id, fields=None, limit=100, offset=0, market=None,
+                        additional_types=("track",)):
+        self._record("playlist_tracks")
+        return self._page(playlist_id, fields, limit, offset)
+
+    def next(self, result):
+        self._record("next")
+        if not result.get("next"):
+            return None
+        url = urlparse(result["next"])
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        return self._page(
+            url.path.strip("/"), query.get("fields"), int(query["limit"]), int(query["offset"])
+        )
+
+    def _page(self, playlist_id: str, fields: str | None, limit: int, offset: int) -> dict:
+        items, total = self._state.playlist_items(playlist_id, offset, limit, fields)
+        following = offset + limit
+        query = urlencode({"offset": following, "limit": limit, "fields": fields or ""})
+        return {
+            "items": items,
+            "total": total,
+            "next": f"mock:///{playlist_id}?{query}" if following < total else None,
+        }
+
+
+class _HttpSpotify:
+    """A spotipy client on the fake API over HTTP, counted by the server."""
+
+    def __init__(self, fake: FakeSpotify) -> None:
+        self._fake = fake
+        self.client = fake.client()
+
+    def calls(self) -> Counter[str]:
+        return Counter(self._fake.stats())
+
+
+def _base_playlist_ids(size: int) -> tuple[int, list[str]]:
+    """Individual base tracks and base playlist IDs adding up to `size` tracks."""
+    individual = min(100, size // 10)
+    remaining = size - individual
+    playlist_ids = []
+    while remaining > 0:
+        n = min(remaining, _PLAYLIST_SIZE)
+        playlist_ids.append(f"base{len(playlist_ids)}size{n}")
+        remaining -= n
+    return individual, playlist_ids
+
+
+async def _seed(db: AsyncSession, size: int, state: FakeSpotifyState) -> tuple[User, list[str]]:
+    user = User(spotify_user_id="bench", access_token="x", refresh_token="x", token_expires_at=0)
+    db.add(user)
+    await db.flush()
+
+    individual, playlist_ids = _base_playlist_ids(size)
+    for i in range(individual):
+        db.add(BaseTrack(
+            user_id=user.id,
+            spotify_track_id=f"single{i:016d}",
+            track_name=f"Single {i}",
+            artist_name="Artist",
+            duration_ms=200_000,
+        ))
+    for i, playlist_id in enumerate(playlist_ids):
+        db.add(BasePlaylist(user_id=user.id, spotify_playlist_id=playlist_id, added_at=i))
+
+    # A tenth of the pool blocked through a playlist, some more individually
+    blacklist_ids = [f"blocksize{max(1, size // 10)}"]
+    for playlist_id in blacklist_ids:
+        db.add(BlacklistPlaylist(user_id=user.id, spotify_playlist_id=playlist_id))
+    for i in range(min(50, individual)):
+        db.add(BlacklistTrack(user_id=user.id, spotify_track_id=f"single{i * 2:016d}"))
+    await db.commit()
+
+    # Generate the synthetic contents up front, outside the timed stages
+    for playlist_id in playlist_ids + blacklist_ids:
+        state.playlist_track_ids(playlist_id)
+    return user, playlist_ids
+
+
+async def _stage(results: dict, name: str, spotify, fn, *args, **kwargs):
+    """Run one stage, recording its wall time, memory peak and Spotify calls."""
+    gc.collect()
+    before = spotify.calls()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    wall = time.perf_counter() - start
+    calls = spotify.calls() - before
+    results[name] = {
+        "wall_s": wall,
+        "peak_bytes": tracemalloc.get_traced_memory()[1] - baseline
+        if tracemalloc.is_tracing() else None,
+        "spotify_calls": sum(calls.values()),
+        "spotify_calls_by_endpoint": dict(sorted(calls.items())),
+    }
+    return result
+
+
+async def _collect(user_id: str, spotify, db):
+    sources = await gen._load_sources(user_id, db)
+    pool = await gen._gather_base_pool(sources, spotify)
+    await gen._store_sources(sources, db)
+    return pool
+
+
+async def _blacklist(user_id: str, spotify, db):
+    sources = await gen._load_sources(user_id, db)
+    blocked = await gen._gather_blacklist(sources, spotify)
+    await gen._store_sources(sources, db)
+    return blocked
+
+
+async def _run_once(size: int, db_path: str, config: FakeSpotifyConfig, http: bool) -> dict:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    playlist_cache.shared.clear()
+
+    fake = FakeSpotify(config).start() if http else None
+    state = fake.state if fake else FakeSpotifyState(config)
+    counter = _HttpSpotify(fake) if fake else MockSpotify(state, config.latency_ms)
+    spotify = counter.client if fake else counter
+
+    stages: dict[str, dict] = {}
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            user, _ = await _seed(db, size, state)
+
+            pool = await _stage(stages, "collect", counter, _collect, user.id, spotify, db)
+            await _stage(stages, "collect_cached", counter, _collect, user.id, spotify, db)
+            blocked = await _stage(stages, "blacklist", counter, _blacklist, user.id, spotify, db)
+            filtered = await _stage(stages, "filter", counter, pool.exclude, blocked)
+
+            async def no_discovery(count: int) -> gen.TrackPool:
+                return gen.TrackPool()
+
+            shuffled = await _stage(
+                stages, "shuffle", counter, gen._select_tracks, filtered, 0, no_discovery, None, None
+            )
+            await _stage(
+                stages, "limits", counter,
+                gen._select_tracks, filtered, 0, no_discovery, None, _LIMIT_MINUTES * 60_000,
+            )
+            await _stage(
+                stages, "select", counter,
+                gen._select_tracks, filtered, 0, no_discovery, _SELECT_TRACKS, None,
+            )
+
+            history = GenerationHistory(
+                user_id=user.id, target_playlist_id="bench", track_count=len(shuffled)
+            )
+            await _stage(stages, "history", counter, gen._persist_history, history, shuffled.to_tracks(), db)
+            await _stage(stages, "pool_save", counter, candidate_pool.save, user.id, filtered, time.time(), db)
+            await _stage(stages, "pool_load", counter, candidate_pool.load, user.id, db)
+    finally:
+        if fake:
+            fake.stop()
+        await engine.dispose()
+
+    return {"pool_tracks": len(pool), "filtered_tracks": len(filtered), "stages": stages}
+
+
+def _aggregate(size: int, runs: list[dict]) -> dict:
+    stages = {}
+    for name in STAGES:
+        samples = [run["stages"][name] for run in runs]
+        peaks = [s["peak_bytes"] for s in samples if s["peak_bytes"] is not None]
+        stages[name] = {
+            "wall_s": statistics.median(s["wall_s"] for s in samples),
+            "wall_s_runs": [s["wall_s"] for s in samples],
+            "peak_bytes": max(peaks) if peaks else None,
+            "spotify_calls": samples[0]["spotify_calls"],
+            "spotify_calls_by_endpoint": samples[0]["spotify_calls_by_endpoint"],
+        }
+    return {
+        "size": size,
+        "pool_tracks": runs[0]["pool_tracks"],
+        "filtered_tracks": runs[0]["filtered_tracks"],
+        "stages": stages,
+    }
+
+
+async def run(
+    sizes: list[int],
+    repeat: int = 1,
+    latency_ms: float = 0.0,
+    http: bool = False,
+    memory: bool = True,
+) -> dict:
+    if memory:
+        tracemalloc.start()
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "bench.db")
+            for size in sizes:
+                # Catalogue of 4x the pool: playlists overlap, as real sources do
+                config = FakeSpotifyConfig(catalogue_size=max(4 * size, 1_000), latency_ms=latency_ms)
+                runs = [await _run_once(size, db_path, config, http) for _ in range(repeat)]
+                rows.append(_aggregate(size, runs))
+    finally:
+        if memory:
+            tracemalloc.stop()
+
+    return {
+        "benchmark": "pipeline",
+        "created_at": time.time(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "options": {
+            "repeat": repeat,
+            "latency_ms": latency_ms,
+            "transport": "http" if http else "in-process",
+            "tracemalloc": memory,
+            "playlist_page_concurrency": settings.PLAYLIST_PAGE_CONCURRENCY,
+            "playlist_fetch_concurrency": settings.PLAYLIST_FETCH_CONCURRENCY,
+        },
+        "results": rows,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added to every Spotify call")
+    parser.add_argument("--http", action="store_true", help="go through the fake API over HTTP")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(
+        args.sizes, max(1, args.repeat), args.latency_ms, args.http, not args.no_memory
+    ))
+
+    print(f"{'size':>8}  {'stage':<15}  {'wall ms':>9}  {'peak KiB':>9}  {'calls':>6}")
+    for row in report["results"]:
+        for name, stage in row["stages"].items():
+            peak = f"{stage['peak_bytes'] / 1024:>9.0f}" if stage["peak_bytes"] is not None else f"{'-':>9}"
+            print(
+                f"{row['size']:>8}  {name:<15}  {stage['wall_s'] * 1000:>9.1f}  "
+                f"{peak}  {stage['spotify_calls']:>6}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 import { configureHtmx } from "./htmx-setup";
 import { initFlashMessages } from "./flash";
 import { initConfirmDialogs } from "./confirm";
+import { initProgressStreams } from "./progress";
 
 /** Boot all frontend behaviors. */
 function init(): void {
   configureHtmx();
   initFlashMessages();
   initConfirmDialogs();
+  initProgressStreams();
 }
 
 if (document.readyState === "loading") {
@@ -0,0 +1,94 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import { formatProgress, initProgressStreams } from "./progress";
+
+class FakeEventSource {
+  static CLOSED = 2;
+  static last: FakeEventSource;
+  readyState = 1;
+  onerror: (() => void) | null = null;
+  listeners: Record<string, (evt: MessageEvent) => void> = {};
+
+  constructor(public url: string) {
+    FakeEventSource.last = this;
+  }
+
+  addEventListener(type: string, listener: (evt: MessageEvent) => void): void {
+    this.listeners[type] = listener;
+  }
+
+  emit(type: string, data: unknown): void {
+    this.listeners[type](new MessageEvent(type, { data: JSON.stringify(data) }));
+  }
+
+  close(): void {
+    this.readyState = FakeEventSource.CLOSED;
+  }
+}
+
+function createForm(): HTMLFormElement {
+  const form = document.createElement("form");
+  form.setAttribute("data-sse-stream", "/api/generate/stream");
+  form.setAttribute("data-sse-target", "#result");
+  const input = document.createElement("input");
+  input.name = "target_id";
+  input.value = "t1";
+  form.appendChild(input);
+  document.body.appendChild(form);
+  return form;
+}
+
+describe("progress streams", () => {
+  beforeEach(() => {
+    document.body.replaceChildren();
+    const result = document.createElement("div");
+    result.id = "result";
+    document.body.appendChild(result);
+    vi.stubGlobal("EventSource", FakeEventSource);
+    initProgressStreams();
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+  });
+
+  it("formats known stages and ignores unknown ones", () => {
+    expect(formatProgress("pool_loaded", { tracks: 120 })).toBe("Loaded 120 candidate tracks");
+    expect(formatProgress("chunk_written", { chunk: 1, chunks: 3 })).toBeNull();
+    expect(formatProgress("unknown", {})).toBeNull();
+  });
+
+  it("streams the form as query params and shows each stage", () => {
+    createForm().dispatchEvent(new Event("submit", { bubbles: true, cancelable: true }));
+
+    expect(FakeEventSource.last.url).toBe("/api/generate/stream?target_id=t1");
+    FakeEventSource.last.emit("playlists_fetched", { playlists: 2, tracks: 40 });
+
+    expect(document.querySelector("#result li")?.textContent).toBe(
+      "Fetched 40 tracks from 2 playlists",
+    );
+  });
+
+  it("swaps in the final HTML and closes the stream", () => {
+    createForm().dispatchEvent(new Event("submit", { bubbles: true, cancelable: true }));
+    const source = FakeEventSource.last;
+
+    source.emit("done", { html: "<p>Preview</p>" });
+
+    expect(document.querySelector("#result")?.innerHTML).toBe("<p>Preview</p>");
+    expect(source.readyState).toBe(FakeEventSource.CLOSED);
+  });
+
+  it("does not stream when the confirm dialog is cancelled", () => {
+    const form = createForm();
+    const button = document.createElement("button");
+    button.setAttribute("data-confirm", "Sure?");
+    form.appendChild(button);
+    vi.spyOn(window, "confirm").mockReturnValue(false);
+    const before = FakeEventSource.last;
+
+    form.dispatchEvent(new Event("submit", { bubbles: true, cancelable: true }));
+
+    expect(FakeEventSource.last).toBe(before);
+  });
+});
@@ -0,0 +1,89 @@
+let initialized = false;
+
+const STAGE_LABELS: Record<string, (data: Record<string, number>) => string> = {
+  playlists_fetched: (d) => `Fetched ${d.tracks} tracks from ${d.playlists} playlists`,
+  blacklist_built: (d) => `Blacklist ready (${d.blocked} blocked tracks)`,
+  pool_loaded: (d) => `Loaded ${d.tracks} candidate tracks`,
+  discovery_fetched: (d) => `Found ${d.tracks} of ${d.requested} discovery tracks`,
+};
+
+/** Human-readable line for a generation progress event, or null for unknown stages. */
+export function formatProgress(stage: string, data: Record<string, number>): string | null {
+  const label = STAGE_LABELS[stage];
+  return label ? label(data) : null;
+}
+
+/**
+ * Submit forms with [data-sse-stream] over an EventSource instead of HTMX,
+ * showing each pipeline stage as it completes and swapping in the final HTML
+ * into the [data-sse-target] element.
+ */
+export function initProgressStreams(): void {
+  if (initialized) return;
+  initialized = true;
+
+  document.body.addEventListener("submit", (evt) => {
+    const form = evt.target as HTMLFormElement;
+    const url = form.getAttribute("data-sse-stream");
+    if (!url) return;
+
+    evt.preventDefault();
+    const message = form.querySelector("[data-confirm]")?.getAttribute("data-confirm");
+    if (message && !window.confirm(message)) return;
+
+    const target = document.querySelector<HTMLElement>(form.getAttribute("data-sse-target") ?? "");
+    if (!target) return;
+
+    const params = new URLSearchParams();
+    new FormData(form).forEach((value, key) => params.append(key, String(value)));
+    streamInto(target, `${url}?${params}`);
+  });
+}
+
+function streamInto(target: HTMLElement, url: string): void {
+  const log = document.createElement("ul");
+  log.className = "progress-log text-muted text-small";
+  target.replaceChildren(log);
+
+  const source = new EventSource(url);
+  for (const stage of Object.keys(STAGE_LABELS)) {
+    source.addEventListener(stage, ((evt: MessageEvent) => {
+      const line = document.createElement("li");
+      line.textContent = formatProgress(stage, JSON.parse(evt.data));
+      log.appendChild(line);
+    }) as EventListener);
+  }
+
+  source.addEventListener("done", ((evt: MessageEvent) => {
+    source.close();
+    swapHtml(target, JSON.parse(evt.data).html);
+  }) as EventListener);
+
+  source.addEventListener("failed", ((evt: MessageEvent) => {
+    source.close();
+    const alert = document.createElement("div");
+    alert.className = "alert alert-danger";
+    alert.textContent = JSON.parse(evt.data).message;
+    target.replaceChildren(alert);
+  }) as EventListener);
+
+  // Server-sent `failed` is handled above; this is a dropped connection
+  source.onerror = () => {
+    if (source.readyState === EventSource.CLOSED) return;
+    source.close();
+    const alert = document.createElement("div");
+    alert.className = "alert alert-danger";
+    alert.textContent = "Lost connection to the server.";
+    target.replaceChildren(alert);
+  };
+}
+
+function swapHtml(target: HTMLElement, html: string): void {
+  const htmx = (window as Window & { htmx?: { swap: (t: Element, c: string, s: object) => void } }).htmx;
+  if (htmx) {
+    // Goes through HTMX so hx-* attributes are processed and htmx:afterSwap fires
+    htmx.swap(target, html, { swapStyle: "innerHTML" });
+  } else {
+    target.innerHTML = html;
+  }
+}
@@ -0,0 +1,99 @@
+"""Small asyncio helpers for running Spotify I/O concurrently."""
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int | None = None,
+    return_exceptions: bool = False,
+) -> list[T]:
+    """Await all awaitables with at most `limit` in flight at once.
+
+    Results are returned in the same order as the input, regardless of
+    completion order. A limit of None (or < 1) means unbounded.
+    """
+    aws = list(aws)
+    if not aws:
+        return []
+    if not limit or limit < 1 or limit >= len(aws):
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(_run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+async def iter_completed(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: int | None = None,
+) -> AsyncIterator[T | BaseException]:
+    """Yield results as they complete, starting at most `limit` at a time.
+
+    Each factory is only called when a slot frees up, so breaking out of
+    the loop early never starts the remaining work; anything still in
+    flight is cancelled. Exceptions are yielded, not raised.
+    """
+    pending = iter(factories)
+    in_flight: set[asyncio.Future] = set()
+
+    def _fill() -> None:
+        while not limit or limit < 1 or len(in_flight) < limit:
+            factory = next(pending, None)
+            if factory is None:
+                return
+            in_flight.add(asyncio.ensure_future(factory()))
+
+    try:
+        _fill()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                yield future.exception() or future.result()
+            _fill()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight call.
+
+    The first caller for a key starts the work; callers arriving while it
+    runs await the same result (or exception). Nothing is cached: once the
+    call finishes the next caller starts a fresh one. A waiter being
+    cancelled does not cancel the shared call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0  # calls that joined one already in flight
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()  # retrieved, even if every waiter went away
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
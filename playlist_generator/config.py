@@ -29,5 +29,42 @@ class Settings(BaseSettings):
     # Optional: OpenAI for enhanced features (cover art, smart discovery, name generation)
     OPENAI_API_KEY: str = ""
 
+    # Generation tuning
+    PLAYLIST_FETCH_CONCURRENCY: int = 8  # max source playlists fetched at once (1 = serial)
+    PLAYLIST_PAGE_CONCURRENCY: int = 4  # max pages of one playlist fetched at once (1 = follow `next`)
+    RECOMMENDATION_CONCURRENCY: int = 4  # max recommendation seed batches requested at once
+    BLACKLIST_SNAPSHOT_TTL_SECONDS: int = 3600  # how often compiled blacklist playlists are rechecked
+    PLAYLIST_MEMORY_CACHE_BYTES: int = 64 * 1024 * 1024  # in-memory playlist contents shared by all users
+    PLAYLIST_MEMORY_CACHE_TTL_SECONDS: int = 3600  # how long an in-memory playlist snapshot is kept
+    BATCH_WRITE_CONCURRENCY: int = 4  # target playlists written at once by a batch generation
+    GENERATION_WORKERS: int = 2  # background workers running queued generation jobs
+    PREVIEW_TTL_SECONDS: int = 900  # how long execute can reuse a preview result
+    PREVIEW_MAX_ENTRIES: int = 256  # stored preview results kept in memory
+
+    # Spotify rate limiting (shared by every user and worker in the process)
+    SPOTIFY_RATE_PER_SECOND: float = 10.0  # sustained Spotify requests per second
+    SPOTIFY_RATE_BURST: int = 20  # requests allowed back to back after an idle spell
+    SPOTIFY_BACKGROUND_RESERVE: int = 5  # tokens background calls leave for interactive ones
+    SPOTIFY_RATE_LIMIT_RETRIES: int = 3  # retries of a call answered with 429
+    SPOTIFY_API_PREFIX: str = "https://api.spotify.com/v1/"  # Web API base URL, e.g. a local benchmarks.fake_spotify
+    SPOTIFY_ASYNC_CLIENT: bool = False  # use the native async httpx client instead of spotipy in threads
+    SPOTIFY_HTTP_MAX_CONNECTIONS: int = 20  # pooled keep-alive connections of the async client
+
+    # Thread pools for blocking work
+    SPOTIFY_EXECUTOR_WORKERS: int = 16  # threads running spotipy calls
+    IMAGE_EXECUTOR_WORKERS: int = 2  # threads running Pillow work (not network calls)
+
+    # Stored candidate pools
+    CANDIDATE_POOL_REFRESH_ENABLED: bool = True  # rebuild stored pools in the background in this process
+    CANDIDATE_POOL_MAX_AGE_SECONDS: int = 6 * 3600  # older stored pools are rebuilt before use
+    CANDIDATE_POOL_IDLE_SECONDS: int = 7 * 24 * 3600  # pools unused this long are not refreshed
+    CANDIDATE_POOL_POLL_SECONDS: int = 15  # how often edited and ageing pools are looked for
+
+    # Scheduled regeneration
+    SCHEDULER_ENABLED: bool = True  # run the scheduler loop in this process
+    SCHEDULER_POLL_SECONDS: int = 30  # how often due schedules are checked
+    SCHEDULER_CONCURRENCY: int = 2  # scheduled generations running at once
+    SCHEDULER_JITTER_SECONDS: int = 300  # random delay spreading runs that share a slot
+
 
 settings = Settings()
@@ -0,0 +1,102 @@
+"""Minimal five-field cron expressions: minute hour day-of-month month day-of-week.
+
+Supports `*`, numbers, ranges (`1-5`), lists (`1,15`), steps (`*/15`, `0-30/10`)
+and the `@hourly`, `@daily`, `@weekly` and `@monthly` shortcuts. Day of week
+runs 0-6 from Sunday (7 is also Sunday). As in cron, when both day fields are
+restricted a day matches if either does.
+"""
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+_SHORTCUTS = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+_BOUNDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+_SEARCH_DAYS = 366 * 5  # covers Feb 29 schedules
+
+
+class CronError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Cron:
+    minutes: tuple[int, ...]
+    hours: tuple[int, ...]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    any_day: bool
+    any_weekday: bool
+
+    def _matches_day(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        dom = day.day in self.days
+        dow = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day:
+            return dow
+        if self.any_weekday:
+            return dom
+        return dom or dow
+
+    def next_after(self, after: datetime) -> datetime:
+        """The first matching minute strictly after `after`, in its timezone."""
+        start = (after + timedelta(minutes=1)).replace(second=0, microsecond=0)
+        day = start.replace(hour=0, minute=0)
+        for _ in range(_SEARCH_DAYS):
+            if self._matches_day(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = datetime.combine(day.date(), time(hour, minute), after.tzinfo)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise CronError("Schedule never matches")
+
+
+def _parse_field(field: str, low: int, high: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        try:
+            step = int(step_text) if step_text else 1
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(v) for v in base.split("-", 1))
+            else:
+                start = int(base)
+                end = high if step_text else start
+        except ValueError:
+            raise CronError(f"Invalid cron field: {field!r}") from None
+        if step < 1 or start < low or end > high or start > end:
+            raise CronError(f"Cron field out of range: {field!r}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse(expression: str) -> Cron:
+    """Parse a cron expression. Raises CronError if it is invalid."""
+    expression = _SHORTCUTS.get(expression.strip().lower(), expression)
+    fields = expression.split()
+    if len(fields) != 5:
+        raise CronError("Expected 5 fields: minute hour day month weekday")
+
+    minutes, hours, days, months, weekdays = (
+        _parse_field(f, low, high) for f, (low, high) in zip(fields, _BOUNDS)
+    )
+    if 7 in weekdays:
+        weekdays = (weekdays - {7}) | {0}
+    return Cron(
+        minutes=tuple(sorted(minutes)),
+        hours=tuple(sorted(hours)),
+        days=frozenset(days),
+        months=frozenset(months),
+        weekdays=frozenset(weekdays),
+        any_day=fields[2] == "*",
+        any_weekday=fields[4] == "*",
+    )
@@ -1,12 +1,12 @@
 import logging
 from typing import Annotated
 
-import spotipy
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.database import get_db
 from playlist_generator.models.user import User
+from playlist_generator.services.spotify_api import SpotifyClient
 from playlist_generator.services.spotify_auth import get_spotify_client
 
 logger = logging.getLogger(__name__)
@@ -43,6 +43,6 @@ async def get_current_user_or_none(
 async def get_spotify(
     user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> spotipy.Spotify:
+) -> SpotifyClient:
     """Get a Spotify client with a valid token for the current user."""
     return await get_spotify_client(user, db)
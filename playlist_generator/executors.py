@@ -0,0 +1,110 @@
+"""Named, bounded thread pools for blocking work.
+
+`asyncio.to_thread` shares the loop's default executor between everything,
+so one user's long sync can starve everyone else's requests. Blocking work
+goes to a dedicated pool instead — `spotify` for spotipy I/O, `image` for
+CPU-bound Pillow work — each with its own size limit. Work beyond the
+limit waits in the pool's queue, which is exposed as metrics.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from playlist_generator.config import settings
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """A thread pool of at most `max_workers` threads that counts its queue."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._queue_seconds = 0.0
+        self._max_queue_seconds = 0.0
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix=self.name)
+            return self._pool
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run `fn(*args, **kwargs)` in this pool and await its result.
+
+        The caller's context variables are carried into the worker thread,
+        as asyncio.to_thread does.
+        """
+        submitted = time.perf_counter()
+        context = contextvars.copy_context()
+        dequeued = False  # whoever flips this first takes the job off the queue count
+
+        def work() -> T:
+            nonlocal dequeued
+            started = time.perf_counter()
+            with self._lock:
+                if not dequeued:
+                    dequeued = True
+                    self._queued -= 1
+                self._running += 1
+                self._queue_seconds += started - submitted
+                self._max_queue_seconds = max(self._max_queue_seconds, started - submitted)
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor(), work)
+        finally:
+            # Cancelled before a worker picked it up: it will never run
+            with self._lock:
+                if not dequeued:
+                    dequeued = True
+                    self._queued -= 1
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self._running,
+                "queued": self._queued,
+                "completed": self._completed,
+                "avg_queue_ms": round(
+                    1000 * self._queue_seconds / self._completed, 1
+                ) if self._completed else 0.0,
+                "max_queue_ms": round(1000 * self._max_queue_seconds, 1),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+spotify = BoundedExecutor("spotify", settings.SPOTIFY_EXECUTOR_WORKERS)
+image = BoundedExecutor("image", settings.IMAGE_EXECUTOR_WORKERS)
+
+
+def metrics() -> dict[str, dict]:
+    return {pool.name: pool.metrics() for pool in (spotify, image)}
+
+
+def shutdown() -> None:
+    for pool in (spotify, image):
+        pool.shutdown()
@@ -9,9 +9,13 @@ from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import HTMLResponse
 
+from playlist_generator import executors
 from playlist_generator.config import settings
 from playlist_generator.database import engine, Base
-from playlist_generator.routers import auth, pages, base_list, blacklist, targets, generation, cover_image, spotify_browse, skips
+from playlist_generator.routers import auth, pages, base_list, blacklist, targets, generation, cover_image, spotify_browse, skips, schedules, metrics
+from playlist_generator.services import jobs, spotify_api
+from playlist_generator.services.pool_refresher import refresher
+from playlist_generator.services.scheduler import scheduler
 
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +57,7 @@ generation.set_templates(templates)
 cover_image.set_templates(templates)
 spotify_browse.set_templates(templates)
 skips.set_templates(templates)
+schedules.set_templates(templates)
 
 
 @asynccontextmanager
@@ -61,8 +66,18 @@ async def lifespan(app: FastAPI):
     os.makedirs("data", exist_ok=True)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await jobs.queue.start()
+    if settings.SCHEDULER_ENABLED:
+        await scheduler.start()
+    if settings.CANDIDATE_POOL_REFRESH_ENABLED:
+        await refresher.start()
     logger.info("Database ready. Startup complete.")
     yield
+    await scheduler.stop()
+    await refresher.stop()
+    await jobs.queue.stop()
+    await spotify_api.aclose()
+    executors.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -94,6 +109,8 @@ app.include_router(generation.router)
 app.include_router(cover_image.router)
 app.include_router(spotify_browse.router)
 app.include_router(skips.router)
+app.include_router(schedules.router)
+app.include_router(metrics.router)
 app.include_router(pages.router)
 
 
@@ -1,10 +1,13 @@
 from playlist_generator.models.user import User
 from playlist_generator.models.base_list import BaseTrack, BasePlaylist
-from playlist_generator.models.blacklist import BlacklistTrack, BlacklistPlaylist
+from playlist_generator.models.blacklist import BlacklistTrack, BlacklistPlaylist, CompiledBlacklistSource
 from playlist_generator.models.target import TargetPlaylist
 from playlist_generator.models.cover_image import CoverImageConfig
 from playlist_generator.models.history import GenerationHistory, GenerationHistoryTrack
-from playlist_generator.models.track_cache import TrackCache, PlayHistory
+from playlist_generator.models.job import GenerationJob
+from playlist_generator.models.schedule import GenerationSchedule, ScheduleRun
+from playlist_generator.models.candidate_pool import CandidatePoolTrack, CandidatePoolState
+from playlist_generator.models.track_cache import TrackCache, PlayHistory, PlaylistSnapshot, PlaylistSnapshotTrack
 
 __all__ = [
     "User",
@@ -12,10 +15,18 @@ __all__ = [
     "BasePlaylist",
     "BlacklistTrack",
     "BlacklistPlaylist",
+    "CompiledBlacklistSource",
     "TargetPlaylist",
     "CoverImageConfig",
     "GenerationHistory",
     "GenerationHistoryTrack",
+    "GenerationJob",
+    "GenerationSchedule",
+    "ScheduleRun",
+    "CandidatePoolTrack",
+    "CandidatePoolState",
     "TrackCache",
     "PlayHistory",
+    "PlaylistSnapshot",
+    "PlaylistSnapshotTrack",
 ]
@@ -1,7 +1,7 @@
 import uuid
 import time
 
-from sqlalchemy import String, Float, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Integer, Float, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from playlist_generator.database import Base
@@ -44,3 +44,25 @@ class BlacklistPlaylist(Base):
     added_at: Mapped[float] = mapped_column(Float, default=time.time)
 
     user: Mapped["User"] = relationship(back_populates="blacklist_playlists")  # type: ignore[name-defined]  # noqa: F821
+
+
+class CompiledBlacklistSource(Base):
+    """Blocked track IDs contributed by one blacklist source, kept up to date
+    so generation can load the whole blacklist with a single query.
+
+    A row with spotify_playlist_id NULL holds the individually blacklisted
+    tracks; every other row mirrors one BlacklistPlaylist at `snapshot_id`.
+    """
+    __tablename__ = "compiled_blacklist_sources"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    spotify_playlist_id: Mapped[str | None] = mapped_column(String(50))
+    snapshot_id: Mapped[str | None] = mapped_column(String(100))
+    track_ids: Mapped[str] = mapped_column(Text, default="")  # space-separated Spotify IDs
+    track_count: Mapped[int] = mapped_column(Integer, default=0)
+    checked_at: Mapped[float] = mapped_column(Float, default=0.0)
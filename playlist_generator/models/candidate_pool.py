@@ -0,0 +1,38 @@
+import time
+
+from sqlalchemy import String, Integer, Float, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from playlist_generator.database import Base
+
+
+class CandidatePoolTrack(Base):
+    """One track of a user's materialized candidate pool, in pool order.
+
+    The pool is the base list plus the tracks of its playlists, minus the
+    blacklist. Rows are keyed by (user_id, position) so the whole pool is
+    one indexed range read.
+    """
+    __tablename__ = "user_candidate_pool"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    spotify_track_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    track_name: Mapped[str | None] = mapped_column(String(500))
+    artist_name: Mapped[str | None] = mapped_column(String(500))
+    duration_ms: Mapped[int | None] = mapped_column(Integer)
+
+
+class CandidatePoolState(Base):
+    """When a user's candidate pool was built, last edited and last used."""
+    __tablename__ = "user_candidate_pool_state"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    track_count: Mapped[int] = mapped_column(Integer, default=0)
+    built_at: Mapped[float] = mapped_column(Float, nullable=False)  # when the sources were read
+    changed_at: Mapped[float] = mapped_column(Float, default=0.0)  # last base list/blacklist edit
+    used_at: Mapped[float] = mapped_column(Float, default=time.time)  # last preview served from it
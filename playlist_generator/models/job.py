@@ -0,0 +1,39 @@
+import uuid
+import time
+
+from sqlalchemy import String, Integer, Float, Text, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from playlist_generator.database import Base
+
+
+class GenerationJob(Base):
+    """A queued playlist generation, run by the background worker pool."""
+
+    __tablename__ = "generation_jobs"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    # Jobs submitted together share a batch_id and run with one pool collection
+    batch_id: Mapped[str | None] = mapped_column(String(36), index=True)
+    target_playlist_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    target_playlist_name: Mapped[str | None] = mapped_column(String(500))
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    max_tracks_param: Mapped[int | None] = mapped_column(Integer)
+    max_minutes_param: Mapped[int | None] = mapped_column(Integer)
+    discovery_mode: Mapped[str | None] = mapped_column(String(20))
+    discovery_value: Mapped[float | None] = mapped_column(Float)
+    # Result, filled in when the job finishes
+    generation_id: Mapped[str | None] = mapped_column(String(36))
+    track_count: Mapped[int | None] = mapped_column(Integer)
+    total_duration_ms: Mapped[int | None] = mapped_column(Integer)
+    discovery_count: Mapped[int | None] = mapped_column(Integer)
+    stage_timings: Mapped[str | None] = mapped_column(Text)  # JSON: {stage: seconds}
+    error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[float] = mapped_column(Float, default=time.time)
+    started_at: Mapped[float | None] = mapped_column(Float)
+    finished_at: Mapped[float | None] = mapped_column(Float)
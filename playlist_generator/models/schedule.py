@@ -0,0 +1,54 @@
+import uuid
+import time
+
+from sqlalchemy import String, Integer, Float, Text, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from playlist_generator.database import Base
+
+
+class GenerationSchedule(Base):
+    """Regenerates a target playlist on a cron schedule."""
+
+    __tablename__ = "generation_schedules"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    target_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("target_playlists.id", ondelete="CASCADE"),
+        nullable=False, unique=True,
+    )
+    cron: Mapped[str] = mapped_column(String(100), nullable=False)
+    timezone: Mapped[str] = mapped_column(String(64), nullable=False, default="UTC")
+    enabled: Mapped[int] = mapped_column(Integer, default=1)
+    max_tracks_param: Mapped[int | None] = mapped_column(Integer)
+    max_minutes_param: Mapped[int | None] = mapped_column(Integer)
+    discovery_mode: Mapped[str | None] = mapped_column(String(20))
+    discovery_value: Mapped[float | None] = mapped_column(Float)
+    next_run_at: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+    last_run_at: Mapped[float | None] = mapped_column(Float)
+    created_at: Mapped[float] = mapped_column(Float, default=time.time)
+
+
+class ScheduleRun(Base):
+    """One scheduled generation attempt — the schedule's run log."""
+
+    __tablename__ = "schedule_runs"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    schedule_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("generation_schedules.id", ondelete="CASCADE"),
+        nullable=False, index=True,
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="running")
+    generation_id: Mapped[str | None] = mapped_column(String(36))
+    track_count: Mapped[int | None] = mapped_column(Integer)
+    error: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[float] = mapped_column(Float, default=time.time)
+    finished_at: Mapped[float | None] = mapped_column(Float)
@@ -41,3 +41,48 @@ class PlayHistory(Base):
     play_percentage: Mapped[float | None] = mapped_column(Float)
     was_skipped: Mapped[int] = mapped_column(Integer, default=0)
     recorded_at: Mapped[float] = mapped_column(Float, default=time.time)
+
+
+class PlaylistSnapshot(Base):
+    """Cached contents of a Spotify playlist at a given snapshot_id.
+
+    Shared across users: a playlist's contents only change when Spotify
+    issues a new snapshot_id, so a matching snapshot can be served locally.
+    """
+    __tablename__ = "playlist_snapshots"
+    __table_args__ = (
+        UniqueConstraint("spotify_playlist_id", "snapshot_id", name="uq_playlist_snapshot"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    spotify_playlist_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    snapshot_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    track_count: Mapped[int] = mapped_column(Integer, default=0)
+    fetched_at: Mapped[float] = mapped_column(Float, default=time.time)
+
+    tracks: Mapped[list["PlaylistSnapshotTrack"]] = relationship(
+        back_populates="snapshot",
+        cascade="all, delete-orphan",
+        order_by="PlaylistSnapshotTrack.position",
+    )
+
+
+class PlaylistSnapshotTrack(Base):
+    """A single track of a cached playlist snapshot, in playlist order."""
+    __tablename__ = "playlist_snapshot_tracks"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    playlist_snapshot_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("playlist_snapshots.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    spotify_track_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    track_name: Mapped[str | None] = mapped_column(String(500))
+    artist_name: Mapped[str | None] = mapped_column(String(500))
+    duration_ms: Mapped[int | None] = mapped_column(Integer)
+
+    snapshot: Mapped["PlaylistSnapshot"] = relationship(back_populates="tracks")
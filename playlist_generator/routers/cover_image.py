@@ -11,6 +11,7 @@ from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import HTMLResponse, Response
 
+from playlist_generator import executors
 from playlist_generator.database import get_db
 from playlist_generator.dependencies import get_current_user, get_spotify
 from playlist_generator.models.target import TargetPlaylist
@@ -44,6 +45,14 @@ def _load_preview(user_id: str) -> Image.Image | None:
     return None
 
 
+def _store_and_render(user_id: str, img: Image.Image) -> bytes:
+    """Save the full image as the user's preview; return a small JPEG of it."""
+    _save_preview(user_id, img)
+    preview = img.copy()
+    preview.thumbnail((600, 600))
+    return cover_service.image_to_jpeg_bytes(preview)
+
+
 def _img_to_html(jpeg_bytes: bytes) -> str:
     b64 = base64.b64encode(jpeg_bytes).decode()
     return (
@@ -62,18 +71,15 @@ async def preview_image(
     font_name: Annotated[str, Form()] = "Roboto-Black.ttf",
 ) -> HTMLResponse:
     """Generate a preview image, cache it, and return as HTML."""
-    img = cover_service.generate_image(
+    img = await executors.image.run(
+        cover_service.generate_image,
         text=text,
         font_size=font_size,
         bg_color=bg_color,
         text_color=text_color,
         font_name=font_name,
     )
-    _save_preview(user.id, img)
-    # Show a smaller version for preview
-    preview = img.copy()
-    preview.thumbnail((600, 600))
-    return HTMLResponse(_img_to_html(cover_service.image_to_jpeg_bytes(preview)))
+    return HTMLResponse(_img_to_html(await executors.image.run(_store_and_render, user.id, img)))
 
 
 @router.post("/preview-ai")
@@ -87,10 +93,7 @@ async def preview_ai_image(
         return HTMLResponse(
             '<div class="alert alert-warning">OpenAI not configured or generation failed</div>'
         )
-    _save_preview(user.id, img)
-    preview = img.copy()
-    preview.thumbnail((600, 600))
-    return HTMLResponse(_img_to_html(cover_service.image_to_jpeg_bytes(preview)))
+    return HTMLResponse(_img_to_html(await executors.image.run(_store_and_render, user.id, img)))
 
 
 @router.post("/upload/{target_id}")
@@ -105,7 +108,7 @@ async def upload_image(
     if not target or target.user_id != user.id:
         return HTMLResponse('<div class="alert alert-danger">Invalid target</div>')
 
-    img = _load_preview(user.id)
+    img = await executors.image.run(_load_preview, user.id)
     if img is None:
         return HTMLResponse(
             '<div class="alert alert-warning">No preview found. Generate a preview first.</div>'
@@ -0,0 +1,21 @@
+"""Parsers for the optional numeric fields of generation forms."""
+
+
+def parse_optional_int(value: str | None) -> int | None:
+    if not value or not value.strip():
+        return None
+    try:
+        v = int(value)
+        return v if v > 0 else None
+    except ValueError:
+        return None
+
+
+def parse_optional_float(value: str | None) -> float | None:
+    if not value or not value.strip():
+        return None
+    try:
+        v = float(value)
+        return v if v > 0 else None
+    except ValueError:
+        return None
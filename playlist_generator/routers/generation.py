@@ -1,4 +1,8 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
+from itertools import zip_longest
 from typing import Annotated
 
 import spotipy
@@ -6,13 +10,17 @@ from fastapi import APIRouter, Depends, Form, Request
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import HTMLResponse, Response
+from starlette.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 
-from playlist_generator.database import get_db
+from playlist_generator.database import async_session_factory, get_db
 from playlist_generator.dependencies import get_current_user, get_spotify
+from playlist_generator.models.history import GenerationHistoryTrack
+from playlist_generator.models.job import GenerationJob
 from playlist_generator.models.target import TargetPlaylist
 from playlist_generator.models.user import User
+from playlist_generator.routers.forms import parse_optional_float, parse_optional_int
 from playlist_generator.services import generation as gen_service
+from playlist_generator.services import jobs, preview_store
 
 logger = logging.getLogger(__name__)
 
@@ -20,32 +28,15 @@ router = APIRouter(prefix="/api/generate", tags=["generation"])
 
 templates: Jinja2Templates | None = None
 
+_SSE_PING_SECONDS = 15
+_MAX_COMPARE_VARIANTS = 3  # rows rendered by the compare form
+
 
 def set_templates(t: Jinja2Templates) -> None:
     global templates
     templates = t
 
 
-def _parse_optional_int(value: str | None) -> int | None:
-    if not value or not value.strip():
-        return None
-    try:
-        v = int(value)
-        return v if v > 0 else None
-    except ValueError:
-        return None
-
-
-def _parse_optional_float(value: str | None) -> float | None:
-    if not value or not value.strip():
-        return None
-    try:
-        v = float(value)
-        return v if v > 0 else None
-    except ValueError:
-        return None
-
-
 @router.post("/preview")
 async def preview(
     request: Request,
@@ -65,29 +56,58 @@ async def preview(
     if not target or target.user_id != user.id:
         return HTMLResponse('<div class="alert alert-danger">Invalid target playlist</div>')
 
-    result = await gen_service.preview(
-        user_id=user.id,
-        spotify=spotify,
-        db=db,
-        max_tracks=_parse_optional_int(max_tracks),
-        max_minutes=_parse_optional_int(max_minutes),
-        discovery_mode=discovery_mode if discovery_mode else None,
-        discovery_value=_parse_optional_float(discovery_value),
-    )
-
-    total_minutes = result.total_duration_ms // 60_000
-    total_seconds = (result.total_duration_ms % 60_000) // 1000
+    params = _generation_params(max_tracks, max_minutes, discovery_mode, discovery_value)
+    result = await gen_service.preview(user_id=user.id, spotify=spotify, db=db, **params)
+    token = preview_store.put(user.id, result, params)
 
     return templates.TemplateResponse(
         request, "partials/generation_preview.html",
+        _preview_context(result, target, token, params),
+    )
+
+
+@router.post("/compare")
+async def compare(
+    request: Request,
+    target_id: Annotated[str, Form()],
+    user: Annotated[User, Depends(get_current_user)],
+    spotify: Annotated[spotipy.Spotify, Depends(get_spotify)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    max_tracks: Annotated[list[str], Form()] = [],
+    max_minutes: Annotated[list[str], Form()] = [],
+    discovery_mode: Annotated[list[str], Form()] = [],
+    discovery_value: Annotated[list[str], Form()] = [],
+) -> Response:
+    """Preview several parameter sets side by side from one pool collection.
+
+    Each form field is repeated once per variant; rows left entirely empty
+    are skipped. Every variant gets its own preview token, so any of them
+    can be pushed as previewed.
+    """
+    assert templates is not None
+
+    target = await db.get(TargetPlaylist, target_id)
+    if not target or target.user_id != user.id:
+        return HTMLResponse('<div class="alert alert-danger">Invalid target playlist</div>')
+
+    rows = zip_longest(max_tracks, max_minutes, discovery_mode, discovery_value)
+    variants = [
+        _generation_params(*row) for row in rows if any(v and v.strip() for v in row)
+    ][:_MAX_COMPARE_VARIANTS]
+    if not variants:
+        return HTMLResponse('<div class="alert alert-warning">Fill in at least one variant</div>')
+
+    results = await gen_service.compare(user.id, spotify, db, variants)
+    columns = [
         {
-            "tracks": result.tracks,
-            "track_count": len(result.tracks),
-            "discovery_count": result.discovery_count,
-            "total_duration": f"{total_minutes}m {total_seconds}s",
-            "target_id": target_id,
-            "target_name": target.playlist_name or target.spotify_playlist_id,
-        },
+            **_preview_context(result, target, preview_store.put(user.id, result, params), params),
+            "title": _variant_title(params),
+        }
+        for result, params in zip(results, variants)
+    ]
+
+    return templates.TemplateResponse(
+        request, "partials/generation_compare.html", {"variants": columns}
     )
 
 
@@ -96,36 +116,289 @@ async def execute(
     request: Request,
     target_id: Annotated[str, Form()],
     user: Annotated[User, Depends(get_current_user)],
-    spotify: Annotated[spotipy.Spotify, Depends(get_spotify)],
     db: Annotated[AsyncSession, Depends(get_db)],
     max_tracks: Annotated[str | None, Form()] = None,
     max_minutes: Annotated[str | None, Form()] = None,
     discovery_mode: Annotated[str | None, Form()] = None,
     discovery_value: Annotated[str | None, Form()] = None,
+    preview_token: Annotated[str | None, Form()] = None,
 ) -> Response:
+    """Queue the generation and return a job status partial that polls for progress.
+
+    With a valid `preview_token` the previewed tracks are written as-is;
+    otherwise the job runs the pipeline again with the submitted parameters.
+    """
     assert templates is not None
 
     target = await db.get(TargetPlaylist, target_id)
     if not target or target.user_id != user.id:
         return HTMLResponse('<div class="alert alert-danger">Invalid target playlist</div>')
 
-    result = await gen_service.execute(
+    stored = preview_store.get(preview_token, user.id)
+    if stored:
+        params, previewed = stored.params, stored.result
+    else:
+        params = _generation_params(max_tracks, max_minutes, discovery_mode, discovery_value)
+        previewed = None
+
+    job = await jobs.queue.submit(
         user_id=user.id,
         target_playlist_id=target.spotify_playlist_id,
         target_playlist_name=target.playlist_name,
-        spotify=spotify,
         db=db,
-        max_tracks=_parse_optional_int(max_tracks),
-        max_minutes=_parse_optional_int(max_minutes),
-        discovery_mode=discovery_mode if discovery_mode else None,
-        discovery_value=_parse_optional_float(discovery_value),
+        previewed=previewed,
+        **params,
+    )
+
+    return templates.TemplateResponse(
+        request, "partials/generation_job.html", _job_context(job)
     )
 
-    total_minutes = result.total_duration_ms // 60_000
 
-    return HTMLResponse(
-        f'<div class="alert alert-success" data-auto-dismiss>'
-        f"Playlist generated! {len(result.tracks)} tracks "
-        f"({total_minutes} min) written to {target.playlist_name or target.spotify_playlist_id}."
-        f"</div>"
+@router.post("/batch")
+async def batch(
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    target_id: Annotated[list[str], Form()] = [],
+    include: Annotated[list[str], Form()] = [],
+    max_tracks: Annotated[list[str], Form()] = [],
+    max_minutes: Annotated[list[str], Form()] = [],
+    discovery_mode: Annotated[list[str], Form()] = [],
+    discovery_value: Annotated[list[str], Form()] = [],
+) -> Response:
+    """Queue every included target as one batch and return their job status partials.
+
+    Each row of the form is one target: `target_id` and the parameter
+    fields are repeated per row, `include` lists the rows to run. The batch
+    runs in the job queue with one pool collection for all its targets.
+    """
+    assert templates is not None
+
+    result = await db.execute(
+        select(TargetPlaylist).where(TargetPlaylist.user_id == user.id)
     )
+    owned = {t.id: t for t in result.scalars().all()}
+
+    rows = zip_longest(target_id, max_tracks, max_minutes, discovery_mode, discovery_value)
+    chosen: dict[str, tuple[TargetPlaylist, dict]] = {}
+    for tid, *fields in rows:
+        if tid in owned and tid in include and tid not in chosen:
+            chosen[tid] = (owned[tid], _generation_params(*fields))
+    if not chosen:
+        return HTMLResponse('<div class="alert alert-warning">Select at least one target</div>')
+
+    targets = [
+        gen_service.BatchTarget(target.spotify_playlist_id, target.playlist_name, **params)
+        for target, params in chosen.values()
+    ]
+    batch_jobs = await jobs.queue.submit_batch(user.id, targets, db)
+
+    return templates.TemplateResponse(
+        request, "partials/generation_batch.html",
+        {"jobs": [_job_context(job) for job in batch_jobs]},
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def job_status(
+    request: Request,
+    job_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Job status partial; polls itself until the job has finished."""
+    assert templates is not None
+
+    job = await db.get(GenerationJob, job_id)
+    if not job or job.user_id != user.id:
+        return HTMLResponse('<div class="alert alert-danger">Job not found</div>')
+
+    return templates.TemplateResponse(
+        request, "partials/generation_job.html", _job_context(job)
+    )
+
+
+@router.get("/jobs/{job_id}/result")
+async def job_result(
+    job_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Job status, timings and the written tracks as JSON."""
+    job = await db.get(GenerationJob, job_id)
+    if not job or job.user_id != user.id:
+        return JSONResponse({"detail": "Job not found"}, status_code=404)
+
+    tracks = []
+    if job.generation_id:
+        result = await db.execute(
+            select(GenerationHistoryTrack)
+            .where(GenerationHistoryTrack.generation_id == job.generation_id)
+            .order_by(GenerationHistoryTrack.position)
+        )
+        tracks = [
+            {
+                "spotify_id": t.spotify_track_id,
+                "name": t.track_name,
+                "artist": t.artist_name,
+                "duration_ms": t.duration_ms,
+                "is_discovery": bool(t.is_discovery),
+            }
+            for t in result.scalars().all()
+        ]
+
+    return JSONResponse({
+        "id": job.id,
+        "status": job.status,
+        "error": job.error,
+        "target_playlist_id": job.target_playlist_id,
+        "track_count": job.track_count,
+        "total_duration_ms": job.total_duration_ms,
+        "discovery_count": job.discovery_count,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "stage_timings": _job_timings(job),
+        "tracks": tracks,
+    })
+
+
+@router.get("/stream")
+async def stream(
+    request: Request,
+    target_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    spotify: Annotated[spotipy.Spotify, Depends(get_spotify)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    max_tracks: str | None = None,
+    max_minutes: str | None = None,
+    discovery_mode: str | None = None,
+    discovery_value: str | None = None,
+) -> Response:
+    """Run a preview, streaming stage events as Server-Sent Events.
+
+    Emits one event per pipeline stage, then `done` with the rendered HTML
+    (or `failed` with a message). Comment pings keep idle proxies open.
+    Only previews stream: writing to Spotify goes through POST /execute and
+    the job queue.
+    """
+    assert templates is not None
+
+    target = await db.get(TargetPlaylist, target_id)
+    if not target or target.user_id != user.id:
+        return HTMLResponse('<div class="alert alert-danger">Invalid target playlist</div>')
+
+    params = _generation_params(max_tracks, max_minutes, discovery_mode, discovery_value)
+    events: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+
+    async def on_progress(stage: str, data: dict) -> None:
+        await events.put((stage, data))
+
+    async def run() -> None:
+        try:
+            # The request's session may be closed before the stream ends
+            async with async_session_factory() as session:
+                result = await gen_service.preview(
+                    user_id=user.id,
+                    spotify=spotify,
+                    db=session,
+                    progress=on_progress,
+                    **params,
+                )
+            token = preview_store.put(user.id, result, params)
+            html = templates.get_template("partials/generation_preview.html").render(
+                {"request": request, **_preview_context(result, target, token, params)}
+            )
+            await events.put(("done", {"html": html}))
+        except Exception:
+            logger.exception("Streamed generation failed for user %s", user.id)
+            await events.put(("failed", {"message": "Generation failed. Please try again."}))
+
+    async def event_stream() -> AsyncIterator[str]:
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                try:
+                    stage, data = await asyncio.wait_for(events.get(), timeout=_SSE_PING_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {stage}\ndata: {json.dumps(data)}\n\n"
+                if stage in ("done", "failed"):
+                    break
+        finally:
+            # A preview is safe to abandon
+            task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _generation_params(
+    max_tracks: str | None,
+    max_minutes: str | None,
+    discovery_mode: str | None,
+    discovery_value: str | None,
+) -> dict:
+    return {
+        "max_tracks": parse_optional_int(max_tracks),
+        "max_minutes": parse_optional_int(max_minutes),
+        "discovery_mode": discovery_mode if discovery_mode else None,
+        "discovery_value": parse_optional_float(discovery_value),
+    }
+
+
+def _variant_title(params: dict) -> str:
+    parts = []
+    if params["max_tracks"]:
+        parts.append(f"{params['max_tracks']} tracks")
+    if params["max_minutes"]:
+        parts.append(f"{params['max_minutes']} min")
+    if params["discovery_mode"] and params["discovery_value"]:
+        value = f"{params['discovery_value']:g}"
+        parts.append(
+            f"{value}% discovery" if params["discovery_mode"] == "percentage"
+            else f"{value} discovery"
+        )
+    return " · ".join(parts) or "No limits"
+
+
+def _preview_context(
+    result: gen_service.GenerationResult,
+    target: TargetPlaylist,
+    preview_token: str,
+    params: dict,
+) -> dict:
+    total_minutes = result.total_duration_ms // 60_000
+    total_seconds = (result.total_duration_ms % 60_000) // 1000
+    return {
+        "tracks": result.tracks,
+        "track_count": len(result.tracks),
+        "discovery_count": result.discovery_count,
+        "total_duration": f"{total_minutes}m {total_seconds}s",
+        "target_id": target.id,
+        "target_name": target.playlist_name or target.spotify_playlist_id,
+        "preview_token": preview_token,
+        # Sent back with execute so an expired token can fall back to a fresh run
+        "params": {k: v for k, v in params.items() if v is not None},
+    }
+
+
+def _job_timings(job: GenerationJob) -> dict[str, float]:
+    if job.stage_timings:
+        return json.loads(job.stage_timings)
+    # Still running: the worker only writes timings when it finishes
+    return jobs.queue.live_timings(job.id) or {}
+
+
+def _job_context(job: GenerationJob) -> dict:
+    return {
+        "job": job,
+        "finished": job.status in (jobs.SUCCEEDED, jobs.FAILED),
+        "timings": _job_timings(job),
+    }
+
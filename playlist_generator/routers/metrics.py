@@ -0,0 +1,40 @@
+"""Operational metrics as JSON."""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from starlette.responses import JSONResponse
+
+from playlist_generator import executors
+from playlist_generator.dependencies import get_current_user
+from playlist_generator.models.user import User
+from playlist_generator.services import playlist_cache, rate_limit, spotify_api
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("/spotify")
+async def spotify_metrics(
+    user: Annotated[User, Depends(get_current_user)],
+) -> JSONResponse:
+    """Budget, pause and wait times of the shared Spotify rate limiter."""
+    return JSONResponse({
+        **rate_limit.limiter.metrics(),
+        "coalesced_total": spotify_api.flights.coalesced,
+        "shared_in_flight": spotify_api.flights.in_flight(),
+    })
+
+
+@router.get("/executors")
+async def executor_metrics(
+    user: Annotated[User, Depends(get_current_user)],
+) -> JSONResponse:
+    """Size, running and queued work of the blocking-work thread pools."""
+    return JSONResponse(executors.metrics())
+
+
+@router.get("/caches")
+async def cache_metrics(
+    user: Annotated[User, Depends(get_current_user)],
+) -> JSONResponse:
+    """Size and hit rate of the shared in-memory playlist contents cache."""
+    return JSONResponse({"playlist_contents": playlist_cache.shared.metrics()})
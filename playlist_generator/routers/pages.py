@@ -14,9 +14,12 @@ from playlist_generator.models.target import TargetPlaylist
 from playlist_generator.config import settings
 from playlist_generator.models.cover_image import CoverImageConfig
 from playlist_generator.models.history import GenerationHistory
+from playlist_generator.models.job import GenerationJob
 from playlist_generator.services import base_list as base_list_service
 from playlist_generator.services import blacklist as blacklist_service
 from playlist_generator.services import cover_image as cover_service
+from playlist_generator.services import jobs
+from playlist_generator.services import scheduler as scheduler_service
 from playlist_generator.services import skips as skips_service
 
 logger = logging.getLogger(__name__)
@@ -117,9 +120,28 @@ async def generate_page(
         .order_by(TargetPlaylist.is_default.desc(), TargetPlaylist.added_at.desc())
     )
     targets = list(result.scalars().all())
+    # Show a job still in progress, so a reload doesn't lose track of it
+    result = await db.execute(
+        select(GenerationJob)
+        .where(
+            GenerationJob.user_id == user.id,
+            GenerationJob.status.in_((jobs.QUEUED, jobs.RUNNING)),
+        )
+        .order_by(GenerationJob.created_at.desc())
+        .limit(1)
+    )
+    job = result.scalar_one_or_none()
+    schedules = await scheduler_service.get_schedules(user.id, db)
     return templates.TemplateResponse(
         request, "pages/generate.html",
-        {"user": user, "targets": targets},
+        {
+            "user": user,
+            "targets": targets,
+            "job": job,
+            "schedules": schedules,
+            "schedule_targets": {t.id: t for t in targets},
+            "target_schedules": {s.target_id: s for s in schedules},
+        },
     )
 
 
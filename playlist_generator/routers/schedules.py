@@ -0,0 +1,125 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Form, Request
+from fastapi.templating import Jinja2Templates
+from markupsafe import escape
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import HTMLResponse, Response
+
+from playlist_generator.cron import CronError
+from playlist_generator.database import get_db
+from playlist_generator.dependencies import get_current_user
+from playlist_generator.models.schedule import GenerationSchedule
+from playlist_generator.models.target import TargetPlaylist
+from playlist_generator.models.user import User
+from playlist_generator.routers.forms import parse_optional_float, parse_optional_int
+from playlist_generator.services import scheduler as scheduler_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/schedules", tags=["schedules"])
+
+templates: Jinja2Templates | None = None
+
+
+def set_templates(t: Jinja2Templates) -> None:
+    global templates
+    templates = t
+
+
+async def _render_list(request: Request, user: User, db: AsyncSession) -> Response:
+    assert templates is not None
+    schedules = await scheduler_service.get_schedules(user.id, db)
+    targets = {s.target_id: await db.get(TargetPlaylist, s.target_id) for s in schedules}
+    return templates.TemplateResponse(
+        request, "partials/schedule_list.html",
+        {"schedules": schedules, "schedule_targets": targets},
+    )
+
+
+async def _get_own(schedule_id: str, user: User, db: AsyncSession) -> GenerationSchedule | None:
+    schedule = await db.get(GenerationSchedule, schedule_id)
+    if not schedule or schedule.user_id != user.id:
+        return None
+    return schedule
+
+
+@router.post("")
+async def save_schedule(
+    request: Request,
+    target_id: Annotated[str, Form()],
+    cron: Annotated[str, Form()],
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    timezone: Annotated[str, Form()] = "UTC",
+    max_tracks: Annotated[str | None, Form()] = None,
+    max_minutes: Annotated[str | None, Form()] = None,
+    discovery_mode: Annotated[str | None, Form()] = None,
+    discovery_value: Annotated[str | None, Form()] = None,
+) -> Response:
+    """Create or replace the schedule of one of the user's targets."""
+    target = await db.get(TargetPlaylist, target_id)
+    if not target or target.user_id != user.id:
+        return HTMLResponse('<div class="alert alert-danger">Invalid target playlist</div>')
+
+    try:
+        await scheduler_service.save_schedule(
+            user.id, target.id, cron, timezone or "UTC", db,
+            max_tracks=parse_optional_int(max_tracks),
+            max_minutes=parse_optional_int(max_minutes),
+            discovery_mode=discovery_mode if discovery_mode else None,
+            discovery_value=parse_optional_float(discovery_value),
+        )
+    except CronError as e:
+        # The message echoes the submitted cron expression or timezone
+        return HTMLResponse(
+            f'<div class="alert alert-warning" data-auto-dismiss>{escape(str(e))}</div>'
+        )
+
+    return await _render_list(request, user, db)
+
+
+@router.patch("/{schedule_id}/toggle")
+async def toggle_schedule(
+    request: Request,
+    schedule_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    schedule = await _get_own(schedule_id, user, db)
+    if schedule is None:
+        return HTMLResponse("", status_code=404)
+    await scheduler_service.set_enabled(schedule, not schedule.enabled, db)
+    return await _render_list(request, user, db)
+
+
+@router.delete("/{schedule_id}")
+async def delete_schedule(
+    schedule_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    schedule = await _get_own(schedule_id, user, db)
+    if schedule is None:
+        return HTMLResponse("", status_code=404)
+    await scheduler_service.delete_schedule(schedule, db)
+    return HTMLResponse("")
+
+
+@router.get("/{schedule_id}/runs")
+async def schedule_runs(
+    request: Request,
+    schedule_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Run log of a schedule, newest first."""
+    assert templates is not None
+    schedule = await _get_own(schedule_id, user, db)
+    if schedule is None:
+        return HTMLResponse("", status_code=404)
+    runs = await scheduler_service.get_runs(schedule.id, db)
+    return templates.TemplateResponse(
+        request, "partials/schedule_runs.html", {"runs": runs}
+    )
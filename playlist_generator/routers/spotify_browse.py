@@ -1,5 +1,4 @@
 """Spotify browse API — returns HTML partials for HTMX-powered browsing."""
-import asyncio
 import logging
 from typing import Annotated
 
@@ -10,6 +9,7 @@ from starlette.responses import Response
 
 from playlist_generator.dependencies import get_current_user, get_spotify
 from playlist_generator.models.user import User
+from playlist_generator.services import spotify_api
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ async def my_playlists(
 ) -> Response:
     """Browse the user's own Spotify playlists."""
     assert templates is not None
-    results = await asyncio.to_thread(
+    results = await spotify_api.call(
         spotify.current_user_playlists, limit=limit, offset=offset
     )
     playlists = [
@@ -74,12 +74,12 @@ async def my_tracks(
     """Browse the user's liked or top tracks."""
     assert templates is not None
     if source == "top":
-        results = await asyncio.to_thread(
+        results = await spotify_api.call(
             spotify.current_user_top_tracks, limit=limit, offset=offset
         )
         items = results.get("items", [])
     else:
-        results = await asyncio.to_thread(
+        results = await spotify_api.call(
             spotify.current_user_saved_tracks, limit=limit, offset=offset
         )
         items = [item["track"] for item in results.get("items", []) if item.get("track")]
@@ -122,7 +122,7 @@ async def playlist_tracks(
 ) -> Response:
     """Browse tracks inside a specific playlist (for blacklisting)."""
     assert templates is not None
-    results = await asyncio.to_thread(
+    results = await spotify_api.call(
         spotify.playlist_tracks,
         playlist_id,
         fields="items(track(id,name,artists,duration_ms,album(images))),next",
@@ -167,7 +167,7 @@ async def search(
 ) -> Response:
     """Search Spotify for tracks or playlists."""
     assert templates is not None
-    results = await asyncio.to_thread(
+    results = await spotify_api.call(
         spotify.search, q=q, type=type, limit=limit
     )
 
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from typing import Annotated
 
@@ -13,6 +12,8 @@ from playlist_generator.database import get_db
 from playlist_generator.dependencies import get_current_user, get_spotify
 from playlist_generator.models.target import TargetPlaylist
 from playlist_generator.models.user import User
+from playlist_generator.services import scheduler as scheduler_service
+from playlist_generator.services import spotify_api
 from playlist_generator.services.base_list import extract_playlist_id
 
 logger = logging.getLogger(__name__)
@@ -59,7 +60,7 @@ async def add_target(
         return HTMLResponse('<div class="alert alert-warning" data-auto-dismiss>Target already added</div>')
 
     try:
-        pl_data = await asyncio.to_thread(
+        pl_data = await spotify_api.call_shared(
             spotify.playlist, playlist_id, fields="name"
         )
         playlist_name = pl_data.get("name", "")
@@ -96,6 +97,7 @@ async def delete_target(
     target = await db.get(TargetPlaylist, target_id)
     if not target or target.user_id != user.id:
         return HTMLResponse("", status_code=404)
+    await scheduler_service.delete_for_target(target.id, db)
     await db.delete(target)
     await db.commit()
     return HTMLResponse("")
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import re
 
@@ -7,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.models.base_list import BaseTrack, BasePlaylist
+from playlist_generator.services import candidate_pool, spotify_api
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +61,7 @@ async def add_track(
 
     # Fetch metadata from Spotify
     try:
-        track_data = await asyncio.to_thread(spotify.track, track_id)
+        track_data = await spotify_api.call(spotify.track, track_id)
         track_name = track_data.get("name", "")
         artists = track_data.get("artists", [])
         artist_name = ", ".join(a["name"] for a in artists) if artists else ""
@@ -84,6 +84,7 @@ async def add_track(
         album_image_url=album_image_url,
     )
     db.add(track)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
     await db.refresh(track)
     return track
@@ -94,6 +95,7 @@ async def delete_track(user_id: str, track_db_id: str, db: AsyncSession) -> bool
     if not track or track.user_id != user_id:
         return False
     await db.delete(track)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
     return True
 
@@ -125,7 +127,7 @@ async def add_playlist(
         return None
 
     try:
-        pl_data = await asyncio.to_thread(
+        pl_data = await spotify_api.call_shared(
             spotify.playlist, playlist_id, fields="name,tracks.total,images"
         )
         playlist_name = pl_data.get("name", "")
@@ -146,6 +148,7 @@ async def add_playlist(
         image_url=image_url,
     )
     db.add(playlist)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
     await db.refresh(playlist)
     return playlist
@@ -156,5 +159,6 @@ async def delete_playlist(user_id: str, playlist_db_id: str, db: AsyncSession) -
     if not playlist or playlist.user_id != user_id:
         return False
     await db.delete(playlist)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
     return True
@@ -1,12 +1,15 @@
-import asyncio
 import logging
+import time
+from dataclasses import dataclass
 
 import spotipy
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from playlist_generator.models.blacklist import BlacklistTrack, BlacklistPlaylist
+from playlist_generator.models.blacklist import BlacklistTrack, BlacklistPlaylist, CompiledBlacklistSource
+from playlist_generator.services import candidate_pool, spotify_api
 from playlist_generator.services.base_list import extract_track_id, extract_playlist_id
+from playlist_generator.services.playlist_cache import PlaylistContents
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +40,7 @@ async def add_track(
         return None
 
     try:
-        track_data = await asyncio.to_thread(spotify.track, track_id)
+        track_data = await spotify_api.call(spotify.track, track_id)
         track_name = track_data.get("name", "")
         artists = track_data.get("artists", [])
         artist_name = ", ".join(a["name"] for a in artists) if artists else ""
@@ -53,8 +56,10 @@ async def add_track(
         artist_name=artist_name,
     )
     db.add(track)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
     await db.refresh(track)
+    await _recompile(user_id, db)
     return track
 
 
@@ -63,7 +68,9 @@ async def delete_track(user_id: str, track_db_id: str, db: AsyncSession) -> bool
     if not track or track.user_id != user_id:
         return False
     await db.delete(track)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
+    await _recompile(user_id, db)
     return True
 
 
@@ -93,7 +100,7 @@ async def add_playlist(
         return None
 
     try:
-        pl_data = await asyncio.to_thread(
+        pl_data = await spotify_api.call(
             spotify.playlist, playlist_id, fields="name"
         )
         playlist_name = pl_data.get("name", "")
@@ -107,8 +114,10 @@ async def add_playlist(
         playlist_name=playlist_name,
     )
     db.add(playlist)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
     await db.refresh(playlist)
+    await _recompile(user_id, db)
     return playlist
 
 
@@ -117,5 +126,137 @@ async def delete_playlist(user_id: str, playlist_db_id: str, db: AsyncSession) -
     if not playlist or playlist.user_id != user_id:
         return False
     await db.delete(playlist)
+    await candidate_pool.mark_changed(user_id, db)
     await db.commit()
+    await _recompile(user_id, db)
     return True
+
+
+# ── Compiled blacklist ───────────────────────────────
+
+@dataclass
+class CompiledBlacklist:
+    """A user's blocked track IDs, grouped by the source they came from."""
+    track_ids: set[str]
+    playlists: dict[str, CompiledBlacklistSource]
+
+    def blocked_ids(self, refreshed: dict[str, set[str]] | None = None) -> set[str]:
+        """All blocked IDs, using `refreshed` IDs for playlists refetched since loading."""
+        refreshed = refreshed or {}
+        blocked = set(self.track_ids)
+        for playlist_id, source in self.playlists.items():
+            if playlist_id in refreshed:
+                blocked |= refreshed[playlist_id]
+            else:
+                blocked.update(source.track_ids.split())
+        return blocked
+
+
+async def _recompile(user_id: str, db: AsyncSession) -> None:
+    """Bring the compiled blacklist in line with the user's blacklist tables.
+
+    Only touches the DB: the individual-tracks row is rebuilt, removed
+    playlists are dropped and new playlists get an empty row with no
+    snapshot, which generation fills in on its next run.
+    """
+    result = await db.execute(
+        select(BlacklistTrack.spotify_track_id).where(BlacklistTrack.user_id == user_id)
+    )
+    track_ids = sorted(result.scalars().all())
+
+    result = await db.execute(
+        select(BlacklistPlaylist.spotify_playlist_id).where(BlacklistPlaylist.user_id == user_id)
+    )
+    playlist_ids = set(result.scalars().all())
+
+    result = await db.execute(
+        select(CompiledBlacklistSource)
+        .where(CompiledBlacklistSource.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+    rows = list(result.scalars().all())
+
+    tracks_row = next((r for r in rows if r.spotify_playlist_id is None), None)
+    if tracks_row is None:
+        tracks_row = CompiledBlacklistSource(user_id=user_id, spotify_playlist_id=None)
+        db.add(tracks_row)
+    tracks_row.track_ids = " ".join(track_ids)
+    tracks_row.track_count = len(track_ids)
+    tracks_row.checked_at = time.time()
+
+    compiled_playlists = {r.spotify_playlist_id for r in rows if r.spotify_playlist_id}
+    removed = compiled_playlists - playlist_ids
+    if removed:
+        await db.execute(
+            delete(CompiledBlacklistSource).where(
+                CompiledBlacklistSource.user_id == user_id,
+                CompiledBlacklistSource.spotify_playlist_id.in_(removed),
+            )
+        )
+    for playlist_id in playlist_ids - compiled_playlists:
+        db.add(CompiledBlacklistSource(user_id=user_id, spotify_playlist_id=playlist_id))
+
+    await db.commit()
+
+
+async def load_compiled(user_id: str, db: AsyncSession) -> CompiledBlacklist:
+    """Load the user's compiled blacklist, compiling it on first use."""
+    # populate_existing: rows are updated with Core statements elsewhere
+    query = (
+        select(CompiledBlacklistSource)
+        .where(CompiledBlacklistSource.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+    rows = list((await db.execute(query)).scalars().all())
+
+    if not any(r.spotify_playlist_id is None for r in rows):
+        await _recompile(user_id, db)
+        rows = list((await db.execute(query)).scalars().all())
+
+    compiled = CompiledBlacklist(track_ids=set(), playlists={})
+    for row in rows:
+        if row.spotify_playlist_id is None:
+            compiled.track_ids = set(row.track_ids.split())
+        else:
+            compiled.playlists[row.spotify_playlist_id] = row
+    return compiled
+
+
+async def save_playlist_sources(
+    user_id: str, contents: list[PlaylistContents], db: AsyncSession
+) -> None:
+    """Record snapshot checks and refetched contents of blacklisted playlists.
+
+    Track IDs are rewritten whenever the snapshot moved, including for a
+    shared-cache hit (`from_cache`, but newer than the stored snapshot):
+    later runs trust the stored IDs for as long as the snapshot is unchanged.
+    """
+    if not contents:
+        return
+
+    result = await db.execute(
+        select(CompiledBlacklistSource.spotify_playlist_id, CompiledBlacklistSource.snapshot_id)
+        .where(
+            CompiledBlacklistSource.user_id == user_id,
+            CompiledBlacklistSource.spotify_playlist_id.in_([c.playlist_id for c in contents]),
+        )
+    )
+    stored = dict(result.all())
+
+    now = time.time()
+    for c in contents:
+        values: dict = {"snapshot_id": c.snapshot_id, "checked_at": now}
+        if not c.from_cache or c.snapshot_id != stored.get(c.playlist_id):
+            track_ids = sorted({t["id"] for t in c.tracks if t.get("id")})
+            values["track_ids"] = " ".join(track_ids)
+            values["track_count"] = len(track_ids)
+        # Core update: the playlist may have been removed while we were fetching
+        await db.execute(
+            update(CompiledBlacklistSource)
+            .where(
+                CompiledBlacklistSource.user_id == user_id,
+                CompiledBlacklistSource.spotify_playlist_id == c.playlist_id,
+            )
+            .values(**values)
+        )
+    await db.commit()
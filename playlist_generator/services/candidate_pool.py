@@ -0,0 +1,113 @@
+"""Materialized candidate pool per user.
+
+Building the pool means reading the base list, fetching every base playlist
+(or at least its snapshot) and applying the blacklist. The result is stored
+in `user_candidate_pool`, so a preview for an established user is one
+indexed read instead of a round of Spotify calls.
+
+A stored pool is used while it is current: built after the user's last base
+list or blacklist edit, and younger than CANDIDATE_POOL_MAX_AGE_SECONDS.
+Edits only mark the pool changed; the refresher rebuilds changed and ageing
+pools of recently active users in the background.
+"""
+import time
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from playlist_generator.config import settings
+from playlist_generator.models.candidate_pool import CandidatePoolState, CandidatePoolTrack
+from playlist_generator.services.track_pool import TrackPool
+
+
+async def load(user_id: str, db: AsyncSession, now: float | None = None) -> TrackPool | None:
+    """The user's stored pool, or None if there is none or it is out of date."""
+    now = time.time() if now is None else now
+    state = await db.get(CandidatePoolState, user_id, populate_existing=True)
+    if (
+        state is None
+        or state.changed_at >= state.built_at
+        or now - state.built_at > settings.CANDIDATE_POOL_MAX_AGE_SECONDS
+    ):
+        return None
+
+    result = await db.execute(
+        select(
+            CandidatePoolTrack.spotify_track_id,
+            CandidatePoolTrack.track_name,
+            CandidatePoolTrack.artist_name,
+            CandidatePoolTrack.duration_ms,
+        )
+        .where(CandidatePoolTrack.user_id == user_id)
+        .order_by(CandidatePoolTrack.position)
+    )
+    pool = TrackPool()
+    for track_id, name, artist, duration_ms in result:
+        pool.add(track_id, name or "", artist or "", duration_ms or 0)
+
+    state.used_at = now
+    await db.commit()
+    return pool
+
+
+async def save(user_id: str, pool: TrackPool, built_at: float, db: AsyncSession) -> None:
+    """Replace the user's stored pool.
+
+    `built_at` is when the sources were read, not now: an edit made while
+    the pool was being built leaves it marked changed.
+    """
+    await db.execute(delete(CandidatePoolTrack).where(CandidatePoolTrack.user_id == user_id))
+    if pool:
+        # Single executemany INSERT, as for generation history tracks
+        await db.execute(
+            CandidatePoolTrack.__table__.insert(),
+            [
+                {
+                    "user_id": user_id,
+                    "position": i,
+                    "spotify_track_id": pool.ids[i],
+                    "track_name": pool.names[i],
+                    "artist_name": pool.artists[i],
+                    "duration_ms": pool.durations[i],
+                }
+                for i in range(len(pool))
+            ],
+        )
+
+    state = await db.get(CandidatePoolState, user_id, populate_existing=True)
+    if state is None:
+        state = CandidatePoolState(user_id=user_id, changed_at=0.0)
+        db.add(state)
+    state.built_at = built_at
+    state.track_count = len(pool)
+    await db.commit()
+
+
+async def mark_changed(user_id: str, db: AsyncSession) -> None:
+    """Flag the user's pool as out of date after an edit. The caller commits."""
+    await db.execute(
+        update(CandidatePoolState)
+        .where(CandidatePoolState.user_id == user_id)
+        .values(changed_at=time.time())
+    )
+
+
+async def due_for_refresh(db: AsyncSession, now: float | None = None) -> list[str]:
+    """Users whose pool was edited or is ageing, among those who used it lately.
+
+    Pools are rebuilt at half their maximum age, so an active user's pool is
+    replaced before previews stop using it.
+    """
+    now = time.time() if now is None else now
+    result = await db.execute(
+        select(CandidatePoolState.user_id)
+        .where(
+            CandidatePoolState.used_at >= now - settings.CANDIDATE_POOL_IDLE_SECONDS,
+            or_(
+                CandidatePoolState.changed_at >= CandidatePoolState.built_at,
+                CandidatePoolState.built_at <= now - settings.CANDIDATE_POOL_MAX_AGE_SECONDS / 2,
+            ),
+        )
+        .order_by(CandidatePoolState.used_at.desc())
+    )
+    return list(result.scalars().all())
@@ -1,4 +1,3 @@
-import asyncio
 import base64
 import logging
 import os
@@ -9,8 +8,10 @@ from PIL import Image, ImageDraw, ImageFont
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from playlist_generator import executors
 from playlist_generator.config import settings
 from playlist_generator.models.cover_image import CoverImageConfig
+from playlist_generator.services import spotify_api
 
 logger = logging.getLogger(__name__)
 
@@ -85,9 +86,9 @@ async def upload_to_spotify(
     playlist_id: str, img: Image.Image, spotify: spotipy.Spotify
 ) -> None:
     """Upload a cover image to a Spotify playlist."""
-    jpeg_bytes = image_to_spotify_bytes(img)
+    jpeg_bytes = await executors.image.run(image_to_spotify_bytes, img)
     b64_data = base64.b64encode(jpeg_bytes).decode()
-    await asyncio.to_thread(spotify.playlist_upload_cover_image, playlist_id, b64_data)
+    await spotify_api.call(spotify.playlist_upload_cover_image, playlist_id, b64_data)
 
 
 # ── Config CRUD ──────────────────────────────────────
@@ -155,31 +156,33 @@ async def delete_config(config_id: str, user_id: str, db: AsyncSession) -> bool:
     return True
 
 
+def _decode_generated(b64_json: str) -> Image.Image:
+    img = Image.open(BytesIO(base64.b64decode(b64_json)))
+    # Resize to Spotify's preferred 1500x1500
+    return img.resize((1500, 1500), Image.Resampling.LANCZOS)
+
+
 async def generate_with_openai(prompt: str) -> Image.Image | None:
     """Generate a cover image using OpenAI DALL-E. Returns None if not configured."""
     if not settings.OPENAI_API_KEY:
         return None
 
     try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        response = await asyncio.to_thread(
-            client.images.generate,
-            model="dall-e-3",
-            prompt=f"Album cover art: {prompt}. Square format, no text, artistic, high quality.",
-            n=1,
-            size="1024x1024",
-            response_format="b64_json",
-        )
+        from openai import AsyncOpenAI
+
+        # Awaited on the event loop: a generation takes tens of seconds and
+        # would otherwise hold one of the few `image` threads Pillow work needs
+        async with AsyncOpenAI(api_key=settings.OPENAI_API_KEY) as client:
+            response = await client.images.generate(
+                model="dall-e-3",
+                prompt=f"Album cover art: {prompt}. Square format, no text, artistic, high quality.",
+                n=1,
+                size="1024x1024",
+                response_format="b64_json",
+            )
 
         if response.data and response.data[0].b64_json:
-            import base64 as b64mod
-            img_bytes = b64mod.b64decode(response.data[0].b64_json)
-            img = Image.open(BytesIO(img_bytes))
-            # Resize to Spotify's preferred 1500x1500
-            img = img.resize((1500, 1500), Image.Resampling.LANCZOS)
-            return img
+            return await executors.image.run(_decode_generated, response.data[0].b64_json)
     except Exception:
         logger.exception("OpenAI image generation failed")
 
@@ -1,27 +1,35 @@
-import asyncio
 import logging
 import math
 import random
-from dataclasses import dataclass
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import chain
 
 import spotipy
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from playlist_generator.concurrency import gather_bounded, iter_completed
+from playlist_generator.config import settings
 from playlist_generator.models.base_list import BaseTrack, BasePlaylist
-from playlist_generator.models.blacklist import BlacklistTrack, BlacklistPlaylist
 from playlist_generator.models.history import GenerationHistory, GenerationHistoryTrack
+from playlist_generator.services import blacklist as blacklist_service
+from playlist_generator.services import candidate_pool, playlist_cache, playlist_writer, spotify_api
+from playlist_generator.services.blacklist import CompiledBlacklist
+from playlist_generator.services.playlist_cache import PlaylistContents
+from playlist_generator.services.track_pool import TrackInfo, TrackPool, lazy_shuffle
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class TrackInfo:
-    spotify_id: str
-    name: str
-    artist: str
-    duration_ms: int
-    is_discovery: bool = False
+_PAGE_SIZE = 100  # Spotify's maximum for playlist items
+_PLAYLIST_TRACK_FIELDS = "items(track(id,uri,name,artists,duration_ms)),next,total"
+# Blacklist playlists only need IDs; `total` stays so later pages can be fetched in parallel
+_PLAYLIST_ID_FIELDS = "items(track(id)),next,total"
+_RECOMMENDATION_RETRIES = 1  # extra attempts per failed recommendations batch
 
 
 @dataclass
@@ -29,172 +37,545 @@ class GenerationResult:
     tracks: list[TrackInfo]
     total_duration_ms: int
     discovery_count: int
+    history_id: str | None = None  # set by execute() once the run is recorded
+
+
+# Receives (stage, data) as the pipeline progresses. Stages:
+#   playlists_fetched  {"playlists", "tracks"}
+#   blacklist_built    {"blocked"}
+#   pool_loaded        {"tracks"}   (instead of the two above, from the stored pool)
+#   discovery_fetched  {"requested", "tracks"}
+#   chunk_written      {"chunk", "chunks"}  (execute only; timed by the job queue)
+ProgressCallback = Callable[[str, dict], Awaitable[None]]
+
+
+async def _emit(progress: ProgressCallback | None, stage: str, **data) -> None:
+    if progress is not None:
+        await progress(stage, data)
+
+
+@dataclass
+class _Sources:
+    """Everything the pipeline reads from the DB, loaded before any Spotify call.
+
+    The collect and blacklist stages only touch the network, so they can run
+    concurrently without sharing the AsyncSession.
+    """
+    user_id: str
+    base_tracks: list[BaseTrack]
+    base_playlist_ids: list[str]
+    blacklist: CompiledBlacklist
+    cached: dict[str, PlaylistContents]
+    fetched: list[PlaylistContents] = field(default_factory=list)
+    blacklist_checked: list[PlaylistContents] = field(default_factory=list)
+    failed_playlist_ids: list[str] = field(default_factory=list)
 
 
 async def _fetch_playlist_tracks(
-    playlist_id: str, spotify: spotipy.Spotify
+    playlist_id: str,
+    spotify: spotipy.Spotify,
+    total: int | None = None,
+    fields: str = _PLAYLIST_TRACK_FIELDS,
 ) -> list[dict]:
-    """Fetch all tracks from a Spotify playlist, handling pagination."""
+    """Fetch all tracks from a Spotify playlist, handling pagination.
+
+    Track dicts hold only what `fields` asks for.
+
+    Once the playlist's total is known (passed in from playlist metadata, or
+    read from the first page) the page offsets are fetched concurrently and
+    reassembled in order. Falls back to following `next` links when the
+    total is unknown or parallel paging is off.
+    """
+    parallel = settings.PLAYLIST_PAGE_CONCURRENCY > 1
+    pages: list[dict] = []
+    first_offset = 0
+    if total is None or not parallel:
+        first = await spotify_api.call(
+            spotify.playlist_tracks, playlist_id, fields=fields, limit=_PAGE_SIZE
+        )
+        if not first:
+            return []
+        pages.append(first)
+        total = first.get("total") if first.get("next") else None
+        first_offset = _PAGE_SIZE
+
+    if isinstance(total, int) and parallel:
+        pages += await gather_bounded(
+            (
+                spotify_api.call(
+                    spotify.playlist_tracks, playlist_id,
+                    fields=fields, limit=_PAGE_SIZE, offset=offset,
+                )
+                for offset in range(first_offset, total, _PAGE_SIZE)
+            ),
+            limit=settings.PLAYLIST_PAGE_CONCURRENCY,
+        )
+    elif pages:
+        results = pages[0]
+        while results.get("next"):
+            results = await spotify_api.call(spotify.next, results)
+            if not results:
+                break
+            pages.append(results)
+
     all_tracks: list[dict] = []
-    results = await asyncio.to_thread(
-        spotify.playlist_tracks, playlist_id, fields="items(track(id,name,artists,duration_ms)),next"
-    )
-    while results:
-        for item in results.get("items", []):
+    for page in pages:
+        for item in page.get("items", []):
             track = item.get("track")
             if track and track.get("id"):
                 all_tracks.append(track)
-        if results.get("next"):
-            results = await asyncio.to_thread(spotify.next, results)
-        else:
-            break
     return all_tracks
 
 
-async def _collect_base_tracks(
-    user_id: str, spotify: spotipy.Spotify, db: AsyncSession
-) -> list[TrackInfo]:
-    """Collect all tracks from the user's base list (individual tracks + playlist tracks)."""
-    pool: list[TrackInfo] = []
-    seen: set[str] = set()
+async def _fetch_playlist_contents(
+    playlist_id: str,
+    spotify: spotipy.Spotify,
+    cached: PlaylistContents | None = None,
+    ids_only: bool = False,
+) -> PlaylistContents:
+    """Fetch a playlist's tracks, skipping the paginated fetch when its snapshot is unchanged.
+
+    A snapshot another user already loaded is served from the shared
+    in-memory cache, once this caller's own metadata read has shown it can
+    see the playlist. Concurrent fetches of the same playlist snapshot
+    (shared sources, a double-clicked preview) share one paginated fetch.
+
+    With `ids_only` a fetch asks Spotify for track IDs alone, so its
+    contents must not be stored in the playlist cache.
+    """
+    meta = await spotify_api.call_shared(
+        spotify.playlist, playlist_id, fields="snapshot_id,tracks.total"
+    ) or {}
+    snapshot_id = meta.get("snapshot_id")
+    total = (meta.get("tracks") or {}).get("total")
+    total = total if isinstance(total, int) else None
+    if cached and snapshot_id and cached.snapshot_id == snapshot_id:
+        return replace(cached, total=total)
+    if snapshot_id and (shared := playlist_cache.shared.get(playlist_id, snapshot_id)):
+        return replace(shared, total=total)
+
+    fields = _PLAYLIST_ID_FIELDS if ids_only else _PLAYLIST_TRACK_FIELDS
+    # Every caller got this snapshot with its own token, so a known snapshot
+    # is fetched once for all users; without one, only per user
+    owner = None if snapshot_id else spotify_api.client_key(spotify)
+    tracks = await spotify_api.flights.do(
+        ("playlist_contents", playlist_id, snapshot_id, owner, fields),
+        lambda: _fetch_playlist_tracks(playlist_id, spotify, total=total, fields=fields),
+    )
+    return PlaylistContents(playlist_id, snapshot_id, tracks, total=total)
+
+
+async def _fetch_playlists(
+    playlist_ids: list[str], spotify: spotipy.Spotify, sources: _Sources
+) -> list[list[dict] | BaseException]:
+    """Fetch several playlists concurrently, serving unchanged ones from the snapshot cache.
+
+    Results are returned in input order; a playlist that failed to fetch
+    yields its exception instead of a track list. Freshly fetched contents
+    are collected on `sources` to be persisted once the network phase ends.
+    """
+    results = await gather_bounded(
+        (_fetch_playlist_contents(pid, spotify, sources.cached.get(pid)) for pid in playlist_ids),
+        limit=settings.PLAYLIST_FETCH_CONCURRENCY,
+        return_exceptions=True,
+    )
+    sources.fetched.extend(
+        r for r in results if isinstance(r, PlaylistContents) and not r.from_cache
+    )
+    return [r if isinstance(r, BaseException) else r.tracks for r in results]
 
-    # 1. Individual tracks from the database
+
+async def _load_sources(user_id: str, db: AsyncSession) -> _Sources:
+    """Read the user's base list, compiled blacklist and cached playlist snapshots."""
     result = await db.execute(
         select(BaseTrack).where(BaseTrack.user_id == user_id)
     )
-    for bt in result.scalars().all():
-        if bt.spotify_track_id not in seen:
-            seen.add(bt.spotify_track_id)
-            pool.append(TrackInfo(
-                spotify_id=bt.spotify_track_id,
-                name=bt.track_name or "",
-                artist=bt.artist_name or "",
-                duration_ms=bt.duration_ms or 0,
-            ))
-
-    # 2. Tracks from base playlists
+    base_tracks = list(result.scalars().all())
+
     result = await db.execute(
-        select(BasePlaylist).where(BasePlaylist.user_id == user_id)
+        select(BasePlaylist.spotify_playlist_id)
+        .where(BasePlaylist.user_id == user_id)
+        .order_by(BasePlaylist.added_at)
     )
-    playlists = result.scalars().all()
-
-    for bp in playlists:
-        try:
-            tracks = await _fetch_playlist_tracks(bp.spotify_playlist_id, spotify)
-            for t in tracks:
-                tid = t["id"]
-                if tid not in seen:
-                    seen.add(tid)
-                    artists = t.get("artists", [])
-                    pool.append(TrackInfo(
-                        spotify_id=tid,
-                        name=t.get("name", ""),
-                        artist=", ".join(a["name"] for a in artists) if artists else "",
-                        duration_ms=t.get("duration_ms", 0),
-                    ))
-        except Exception:
-            logger.warning("Failed to fetch tracks from playlist %s", bp.spotify_playlist_id)
+    base_playlist_ids = list(result.scalars().all())
 
-    return pool
+    blacklist = await blacklist_service.load_compiled(user_id, db)
+    cached = await playlist_cache.load(base_playlist_ids, db)
 
+    return _Sources(
+        user_id=user_id,
+        base_tracks=base_tracks,
+        base_playlist_ids=base_playlist_ids,
+        blacklist=blacklist,
+        cached=cached,
+    )
 
-async def _build_blacklist_set(
-    user_id: str, spotify: spotipy.Spotify, db: AsyncSession
-) -> set[str]:
-    """Build a set of all blacklisted track IDs."""
-    blocked: set[str] = set()
 
-    # Individually blacklisted tracks
-    result = await db.execute(
-        select(BlacklistTrack.spotify_track_id).where(BlacklistTrack.user_id == user_id)
+async def _store_sources(sources: _Sources, db: AsyncSession) -> None:
+    """Persist what the network phase learned: new snapshots and blacklist checks."""
+    await playlist_cache.store(sources.fetched, db)
+    await blacklist_service.save_playlist_sources(
+        sources.user_id, sources.blacklist_checked, db
     )
-    for (track_id,) in result.all():
-        blocked.add(track_id)
 
-    # Tracks from blacklisted playlists
-    result = await db.execute(
-        select(BlacklistPlaylist).where(BlacklistPlaylist.user_id == user_id)
+
+async def _gather_base_pool(
+    sources: _Sources, spotify: spotipy.Spotify
+) -> TrackPool:
+    """Network phase of base collection: individual tracks plus playlist tracks.
+
+    A base playlist that fails to fetch is left out of the pool and recorded
+    in `sources.failed_playlist_ids`.
+    """
+    pool = TrackPool()
+
+    # 1. Individual tracks from the database
+    for bt in sources.base_tracks:
+        pool.add(
+            bt.spotify_track_id,
+            bt.track_name or "",
+            bt.artist_name or "",
+            bt.duration_ms or 0,
+        )
+
+    # 2. Tracks from base playlists, fetched concurrently but merged in DB order
+    #    so dedup still favours the first source
+    fetched = await _fetch_playlists(sources.base_playlist_ids, spotify, sources)
+    for playlist_id, tracks in zip(sources.base_playlist_ids, fetched):
+        if isinstance(tracks, BaseException):
+            logger.warning("Failed to fetch tracks from playlist %s", playlist_id)
+            sources.failed_playlist_ids.append(playlist_id)
+            continue
+        for t in tracks:
+            pool.add_spotify_track(t)
+
+    return pool
+
+
+async def _gather_blacklist(
+    sources: _Sources, spotify: spotipy.Spotify
+) -> set[str]:
+    """Network phase of blacklist construction.
+
+    The compiled blacklist already holds every source's IDs. Only playlists
+    that are new or due for a snapshot recheck are contacted, and only those
+    whose snapshot changed are refetched.
+    """
+    now = time.time()
+    due = [
+        row for row in sources.blacklist.playlists.values()
+        if not row.snapshot_id
+        or now - row.checked_at >= settings.BLACKLIST_SNAPSHOT_TTL_SECONDS
+    ]
+    results = await gather_bounded(
+        (
+            _fetch_playlist_contents(
+                row.spotify_playlist_id, spotify,
+                PlaylistContents(row.spotify_playlist_id, row.snapshot_id, [], from_cache=True)
+                if row.snapshot_id else None,
+                ids_only=True,
+            )
+            for row in due
+        ),
+        limit=settings.PLAYLIST_FETCH_CONCURRENCY,
+        return_exceptions=True,
     )
-    for bp in result.scalars().all():
-        try:
-            tracks = await _fetch_playlist_tracks(bp.spotify_playlist_id, spotify)
-            for t in tracks:
-                if t.get("id"):
-                    blocked.add(t["id"])
-        except Exception:
-            logger.warning("Failed to fetch blacklist playlist %s", bp.spotify_playlist_id)
 
-    return blocked
+    refreshed: dict[str, set[str]] = {}
+    for row, contents in zip(due, results):
+        if isinstance(contents, BaseException):
+            # Keep blocking whatever we compiled last time
+            logger.warning("Failed to fetch blacklist playlist %s", row.spotify_playlist_id)
+            continue
+        sources.blacklist_checked.append(contents)
+        # A shared-cache hit is from_cache too, but may be a newer snapshot
+        if not contents.from_cache or contents.snapshot_id != row.snapshot_id:
+            refreshed[contents.playlist_id] = {t["id"] for t in contents.tracks if t.get("id")}
+
+    return sources.blacklist.blocked_ids(refreshed)
 
 
 async def _get_recommendations(
-    seed_pool: list[TrackInfo],
+    seed_pool: TrackPool,
     blacklist: set[str],
     count: int,
     spotify: spotipy.Spotify,
-) -> list[TrackInfo]:
-    """Get discovery tracks via Spotify's recommendations API."""
+) -> TrackPool:
+    """Get discovery tracks via Spotify's recommendations API.
+
+    All planned seed batches are requested concurrently (bounded) and merged
+    as they arrive; once `count` tracks are found the rest are dropped.
+    """
+    discovery = TrackPool()
     if not seed_pool or count <= 0:
-        return []
-
-    discovery: list[TrackInfo] = []
-    existing_ids = {t.spotify_id for t in seed_pool} | blacklist
-    attempts = 0
-    max_attempts = math.ceil(count / 20) + 2  # Extra attempts for filtered-out tracks
-
-    while len(discovery) < count and attempts < max_attempts:
-        attempts += 1
-        # Sample up to 5 seed tracks (Spotify's limit)
-        seeds = random.sample(seed_pool, min(5, len(seed_pool)))
-        seed_ids = [s.spotify_id for s in seeds]
-        remaining = count - len(discovery)
-
-        try:
-            result = await asyncio.to_thread(
-                spotify.recommendations,
-                seed_tracks=seed_ids,
-                limit=min(remaining, 100),
-            )
+        return discovery
+
+    existing_ids = set(seed_pool.ids) | blacklist
+    batches = math.ceil(count / 20) + 2  # Extra batches for filtered-out tracks
+    limit = min(count, 100)
+    # Sample up to 5 seed tracks per batch (Spotify's limit)
+    seed_batches = [
+        random.sample(seed_pool.ids, min(5, len(seed_pool))) for _ in range(batches)
+    ]
+
+    async def fetch(seed_ids: list[str]) -> dict:
+        # A failed batch is retried on its own instead of aborting discovery
+        for attempt in range(1 + _RECOMMENDATION_RETRIES):
+            try:
+                return await spotify_api.call(
+                    spotify.recommendations, seed_tracks=seed_ids, limit=limit
+                )
+            except Exception:
+                logger.warning("Recommendations call failed (attempt %d)", attempt + 1)
+                if attempt == _RECOMMENDATION_RETRIES:
+                    raise
+        return {}
+
+    async with aclosing(iter_completed(
+        (partial(fetch, seeds) for seeds in seed_batches),
+        settings.RECOMMENDATION_CONCURRENCY,
+    )) as results:
+        async for result in results:
+            if isinstance(result, BaseException):
+                continue
             for t in result.get("tracks", []):
                 tid = t.get("id")
                 if tid and tid not in existing_ids:
                     existing_ids.add(tid)
-                    artists = t.get("artists", [])
-                    discovery.append(TrackInfo(
-                        spotify_id=tid,
-                        name=t.get("name", ""),
-                        artist=", ".join(a["name"] for a in artists) if artists else "",
-                        duration_ms=t.get("duration_ms", 0),
-                        is_discovery=True,
-                    ))
+                    discovery.add_spotify_track(t, is_discovery=True)
                     if len(discovery) >= count:
                         break
-        except Exception:
-            logger.warning("Recommendations call failed (attempt %d)", attempts)
-            break
+            if len(discovery) >= count:
+                break
 
     return discovery
 
 
-def _apply_limits(
-    tracks: list[TrackInfo],
+async def _select_tracks(
+    pool: TrackPool,
+    discovery_slots: int,
+    fetch_discovery: Callable[[int], Awaitable[TrackPool]],
     max_tracks: int | None,
-    max_minutes: int | None,
-) -> list[TrackInfo]:
-    """Truncate the track list based on max_tracks and/or max_minutes."""
-    result: list[TrackInfo] = []
-    total_ms = 0
-    max_ms = max_minutes * 60_000 if max_minutes else None
-
-    for track in tracks:
-        if max_tracks and len(result) >= max_tracks:
+    max_ms: int | None,
+) -> TrackPool:
+    """Shuffle `pool` plus `discovery_slots` discovery tracks and apply the limits, lazily.
+
+    Equivalent to shuffling everything and truncating, but indices are drawn
+    one at a time and only until the limits are reached. Discovery slots are
+    drawn like any other index; as their durations are unknown until fetched,
+    the pool's average stands in while sizing the draw, and only the slots
+    drawn are requested from Spotify.
+    """
+    size = len(pool)
+    order = lazy_shuffle(size + discovery_slots)
+    estimate = pool.total_duration_ms() // size if size else 0
+
+    drawn: list[int] = []
+    if max_tracks or max_ms:
+        total = 0
+        for i in order:
+            drawn.append(i)
+            total += pool.durations[i] if i < size else estimate
+            if (max_tracks and len(drawn) >= max_tracks) or (max_ms and total > max_ms):
+                break
+    else:
+        drawn = list(order)
+
+    wanted = sum(1 for i in drawn if i >= size)
+    discovery = await fetch_discovery(wanted) if wanted else TrackPool()
+
+    # Walk the draw (and beyond, if real durations ran short of the estimate),
+    # stopping at the first track that does not fit
+    selection = TrackPool()
+    total = 0
+    next_discovery = 0
+    for i in chain(drawn, order):
+        if i < size:
+            source, row = pool, i
+        elif next_discovery < len(discovery):
+            source, row = discovery, next_discovery
+            next_discovery += 1
+        else:
+            continue  # fewer recommendations came back than were asked for
+        if max_tracks and len(selection) >= max_tracks:
             break
-        if max_ms and total_ms + track.duration_ms > max_ms:
+        if max_ms and total + source.durations[row] > max_ms:
             break
-        result.append(track)
-        total_ms += track.duration_ms
+        selection.add_from(source, row)
+        total += source.durations[row]
 
-    return result
+    return selection
+
+
+async def _write_target(
+    playlist_id: str,
+    tracks: list[TrackInfo],
+    spotify: spotipy.Spotify,
+    db: AsyncSession,
+    progress: ProgressCallback | None = None,
+) -> None:
+    """Write tracks to the target playlist, diffing against its current contents.
+
+    The written contents are cached under the resulting snapshot_id, so the
+    next run can read the target back with a single metadata call.
+    """
+    cached = await playlist_cache.load([playlist_id], db)
+    written = await _sync_target(playlist_id, tracks, spotify, cached.get(playlist_id), progress)
+    await playlist_cache.store([written] if written else [], db)
+
+
+async def _sync_target(
+    playlist_id: str,
+    tracks: list[TrackInfo],
+    spotify: spotipy.Spotify,
+    cached: PlaylistContents | None,
+    progress: ProgressCallback | None = None,
+) -> PlaylistContents | None:
+    """Network phase of _write_target. Returns the target's contents to cache, if known."""
+    try:
+        current: PlaylistContents | None = await _fetch_playlist_contents(
+            playlist_id, spotify, cached
+        )
+    except Exception:
+        logger.warning("Could not read target playlist %s, replacing it", playlist_id)
+        current = None
+
+    # Items we cannot address by URI (local files, unavailable tracks) are
+    # missing from `current`: only a replace is sure to remove them
+    current_uris = None
+    if current and (current.total is None or current.total == len(current.tracks)):
+        # Episodes keep their own URI so they are diffed out, not matched
+        current_uris = [t.get("uri") or f"spotify:track:{t['id']}" for t in current.tracks]
+
+    desired = [f"spotify:track:{t.spotify_id}" for t in tracks]
+    ops = playlist_writer.plan_writes(current_uris, desired)
+    if not ops:
+        return current
+
+    # Only jobs write to Spotify now; this feeds their "Write to Spotify" timing
+    async def on_chunk(chunk: int, chunks: int) -> None:
+        await _emit(progress, "chunk_written", chunk=chunk, chunks=chunks)
+
+    snapshot_id = await playlist_writer.apply_writes(
+        playlist_id, ops, spotify, current.snapshot_id if current else None,
+        on_chunk=on_chunk,
+    )
+
+    return PlaylistContents(
+        playlist_id,
+        snapshot_id,
+        [
+            {
+                "id": t.spotify_id,
+                "name": t.name,
+                "artists": [{"name": t.artist}] if t.artist else [],
+                "duration_ms": t.duration_ms,
+            }
+            for t in tracks
+        ],
+    )
+
+
+async def _persist_history(
+    history: GenerationHistory, tracks: list[TrackInfo], db: AsyncSession
+) -> None:
+    """Store a generation and its tracks.
+
+    Track rows go in as a single executemany INSERT with pre-generated IDs
+    instead of one ORM object per track, which dominates execute time for
+    multi-thousand-track generations on SQLite.
+    """
+    history.id = history.id or str(uuid.uuid4())
+    db.add(history)
+    await db.flush()
+
+    if tracks:
+        await db.execute(
+            GenerationHistoryTrack.__table__.insert(),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "generation_id": history.id,
+                    "spotify_track_id": t.spotify_id,
+                    "track_name": t.name,
+                    "artist_name": t.artist,
+                    "duration_ms": t.duration_ms,
+                    "is_discovery": 1 if t.is_discovery else 0,
+                    "position": i,
+                }
+                for i, t in enumerate(tracks)
+            ],
+        )
+    await db.commit()
+
+
+async def _build_candidate_pool(
+    user_id: str,
+    spotify: spotipy.Spotify,
+    db: AsyncSession,
+    progress: ProgressCallback | None = None,
+) -> tuple[TrackPool, set[str]]:
+    """Collect the base pool and blacklist from their sources and store the filtered pool.
+
+    A pool missing a base playlist is returned but not stored, so the next
+    preview fetches again instead of serving the gap until the pool ages out.
+    """
+
+    async def collect() -> TrackPool:
+        pool = await _gather_base_pool(sources, spotify)
+        await _emit(progress, "playlists_fetched",
+                    playlists=len(sources.base_playlist_ids), tracks=len(pool))
+        return pool
+
+    async def blacklist_stage() -> set[str]:
+        blocked = await _gather_blacklist(sources, spotify)
+        await _emit(progress, "blacklist_built", blocked=len(blocked))
+        return blocked
+
+    # Collect and blacklist: read the DB up front, then run both network-bound
+    # stages concurrently and persist fetched snapshots after
+    started = time.time()
+    sources = await _load_sources(user_id, db)
+    base_pool, blacklist = await gather_bounded([collect(), blacklist_stage()])
+    await _store_sources(sources, db)
+
+    filtered = base_pool.exclude(blacklist)
+    if sources.failed_playlist_ids:
+        logger.warning(
+            "Not storing the candidate pool of user %s: %d base playlists failed",
+            user_id, len(sources.failed_playlist_ids),
+        )
+    else:
+        await candidate_pool.save(user_id, filtered, started, db)
+    return filtered, blacklist
+
+
+async def _candidate_pool(
+    user_id: str,
+    spotify: spotipy.Spotify,
+    db: AsyncSession,
+    progress: ProgressCallback | None = None,
+) -> tuple[TrackPool, set[str]]:
+    """The filtered candidate pool and blacklist, from the stored pool when it is current.
+
+    The stored pool already excludes the blacklist; the blocked IDs are
+    still needed to keep them out of discovery, and come from the compiled
+    blacklist without any Spotify call.
+    """
+    stored = await candidate_pool.load(user_id, db)
+    if stored is None:
+        return await _build_candidate_pool(user_id, spotify, db, progress)
+    blacklist = (await blacklist_service.load_compiled(user_id, db)).blocked_ids()
+    await _emit(progress, "pool_loaded", tracks=len(stored))
+    return stored, blacklist
+
+
+async def refresh_candidate_pool(
+    user_id: str, spotify: spotipy.Spotify, db: AsyncSession
+) -> int:
+    """Rebuild the user's stored candidate pool. Returns its size."""
+    pool, _ = await _build_candidate_pool(user_id, spotify, db)
+    return len(pool)
 
 
 async def preview(
@@ -205,42 +586,73 @@ async def preview(
     max_minutes: int | None = None,
     discovery_mode: str | None = None,
     discovery_value: float | None = None,
+    progress: ProgressCallback | None = None,
 ) -> GenerationResult:
     """Run the full generation pipeline without writing to Spotify."""
-    # 1. Collect
-    base_pool = await _collect_base_tracks(user_id, spotify, db)
+    # 1-3. Candidate pool and blacklist
+    filtered, blacklist = await _candidate_pool(user_id, spotify, db, progress)
+    return await _select_from_pool(
+        filtered, blacklist, spotify,
+        max_tracks, max_minutes, discovery_mode, discovery_value, progress,
+    )
 
-    # 2. Blacklist
-    blacklist = await _build_blacklist_set(user_id, spotify, db)
 
-    # 3. Filter
-    filtered = [t for t in base_pool if t.spotify_id not in blacklist]
+async def compare(
+    user_id: str,
+    spotify: spotipy.Spotify,
+    db: AsyncSession,
+    variants: list[dict],
+    progress: ProgressCallback | None = None,
+) -> list[GenerationResult]:
+    """Preview several parameter sets against one candidate pool.
+
+    Each variant is a dict of preview()'s max_tracks, max_minutes,
+    discovery_mode and discovery_value. The pool and blacklist are collected
+    once, then every variant's selection (and discovery fetch) runs
+    concurrently. Results are returned in variant order.
+    """
+    pool, blacklist = await _candidate_pool(user_id, spotify, db, progress)
+    return await gather_bounded(
+        _select_from_pool(pool, blacklist, spotify, progress=progress, **params)
+        for params in variants
+    )
+
 
-    # 4. Discovery
-    discovery_tracks: list[TrackInfo] = []
+async def _select_from_pool(
+    filtered: TrackPool,
+    blacklist: set[str],
+    spotify: spotipy.Spotify,
+    max_tracks: int | None = None,
+    max_minutes: int | None = None,
+    discovery_mode: str | None = None,
+    discovery_value: float | None = None,
+    progress: ProgressCallback | None = None,
+) -> GenerationResult:
+    """Draw one selection from a candidate pool. Leaves the pool untouched."""
+    # 4. Discovery size, before anything is fetched
+    discovery_count = 0
     if discovery_mode and discovery_value and discovery_value > 0:
         if discovery_mode == "percentage":
             discovery_count = max(1, int(len(filtered) * discovery_value / 100))
         else:  # fixed
             discovery_count = int(discovery_value)
-        discovery_tracks = await _get_recommendations(
-            filtered, blacklist, discovery_count, spotify
-        )
-
-    # 5. Combine and shuffle
-    all_tracks = filtered + discovery_tracks
-    random.shuffle(all_tracks)
 
-    # 6. Apply limits
-    all_tracks = _apply_limits(all_tracks, max_tracks, max_minutes)
+    async def fetch_discovery(count: int) -> TrackPool:
+        tracks = await _get_recommendations(filtered, blacklist, count, spotify)
+        await _emit(progress, "discovery_fetched", requested=count, tracks=len(tracks))
+        return tracks
 
-    total_ms = sum(t.duration_ms for t in all_tracks)
-    disc_count = sum(1 for t in all_tracks if t.is_discovery)
+    # 5+6. Draw a random selection within the limits, fetching only the
+    #      discovery tracks that land in it
+    selection = await _select_tracks(
+        filtered, discovery_count, fetch_discovery,
+        max_tracks, max_minutes * 60_000 if max_minutes else None,
+    )
 
     return GenerationResult(
-        tracks=all_tracks,
-        total_duration_ms=total_ms,
-        discovery_count=disc_count,
+        tracks=selection.to_tracks(),
+        total_duration_ms=selection.total_duration_ms(),
+        discovery_count=selection.discovery_count(),
     )
 
 
@@ -254,33 +666,118 @@ async def execute(
     max_minutes: int | None = None,
     discovery_mode: str | None = None,
     discovery_value: float | None = None,
+    progress: ProgressCallback | None = None,
+    previewed: GenerationResult | None = None,
 ) -> GenerationResult:
-    """Run the full pipeline and write to the Spotify playlist."""
-    result = await preview(
-        user_id, spotify, db,
+    """Run the full pipeline and write to the Spotify playlist.
+
+    If `previewed` is given, its tracks are written as-is instead of running
+    the pipeline again.
+    """
+    if previewed is not None:
+        result = previewed
+    else:
+        result = await preview(
+            user_id, spotify, db,
+            max_tracks=max_tracks,
+            max_minutes=max_minutes,
+            discovery_mode=discovery_mode,
+            discovery_value=discovery_value,
+            progress=progress,
+        )
+
+    if not result.tracks:
+        return result
+
+    await _write_target(target_playlist_id, result.tracks, spotify, db, progress)
+    await _record_history(
+        user_id, target_playlist_id, target_playlist_name, result, db,
         max_tracks=max_tracks,
         max_minutes=max_minutes,
         discovery_mode=discovery_mode,
         discovery_value=discovery_value,
     )
+    return result
 
-    if not result.tracks:
-        return result
 
-    # Clear the target playlist
-    track_uris = [f"spotify:track:{t.spotify_id}" for t in result.tracks]
-    await asyncio.to_thread(
-        spotify.playlist_replace_items, target_playlist_id, []
+@dataclass
+class BatchTarget:
+    """One target of execute_batch() with its own limits and discovery settings."""
+    playlist_id: str
+    playlist_name: str | None = None
+    max_tracks: int | None = None
+    max_minutes: int | None = None
+    discovery_mode: str | None = None
+    discovery_value: float | None = None
+
+    def params(self) -> dict:
+        return {
+            "max_tracks": self.max_tracks,
+            "max_minutes": self.max_minutes,
+            "discovery_mode": self.discovery_mode,
+            "discovery_value": self.discovery_value,
+        }
+
+
+async def execute_batch(
+    user_id: str,
+    targets: list[BatchTarget],
+    spotify: spotipy.Spotify,
+    db: AsyncSession,
+    progress: ProgressCallback | None = None,
+) -> list[GenerationResult | BaseException]:
+    """Generate several targets from one candidate pool and write them concurrently.
+
+    The pool and blacklist are collected once and each target draws its
+    own selection. The Spotify writes run concurrently (bounded); cached
+    target contents are read before and stored after, as the session
+    cannot be shared between them. Results are in `targets` order; a target
+    whose write failed yields its exception and gets no history entry.
+    """
+    pool, blacklist = await _candidate_pool(user_id, spotify, db, progress)
+    results = await gather_bounded(
+        _select_from_pool(pool, blacklist, spotify, progress=progress, **t.params())
+        for t in targets
     )
 
-    # Add in chunks of 100
-    for i in range(0, len(track_uris), 100):
-        chunk = track_uris[i : i + 100]
-        await asyncio.to_thread(
-            spotify.playlist_add_items, target_playlist_id, chunk
+    outcomes: list[GenerationResult | BaseException] = list(results)
+    to_write = [(i, t, r) for i, (t, r) in enumerate(zip(targets, results)) if r.tracks]
+    cached = await playlist_cache.load([t.playlist_id for _, t, _ in to_write], db)
+    written = await gather_bounded(
+        (
+            _sync_target(t.playlist_id, r.tracks, spotify, cached.get(t.playlist_id), progress)
+            for _, t, r in to_write
+        ),
+        limit=settings.BATCH_WRITE_CONCURRENCY,
+        return_exceptions=True,
+    )
+
+    await playlist_cache.store(
+        [w for w in written if isinstance(w, PlaylistContents)], db
+    )
+    for (i, target, result), w in zip(to_write, written):
+        if isinstance(w, BaseException):
+            logger.warning("Batch write to target %s failed: %s", target.playlist_id, w)
+            outcomes[i] = w
+            continue
+        await _record_history(
+            user_id, target.playlist_id, target.playlist_name, result, db, **target.params()
         )
+    return outcomes
 
-    # Record history with individual tracks
+
+async def _record_history(
+    user_id: str,
+    target_playlist_id: str,
+    target_playlist_name: str | None,
+    result: GenerationResult,
+    db: AsyncSession,
+    max_tracks: int | None = None,
+    max_minutes: int | None = None,
+    discovery_mode: str | None = None,
+    discovery_value: float | None = None,
+) -> None:
+    """Record a written generation with its individual tracks."""
     history = GenerationHistory(
         user_id=user_id,
         target_playlist_id=target_playlist_id,
@@ -293,19 +790,5 @@ async def execute(
         discovery_mode=discovery_mode,
         discovery_value=discovery_value,
     )
-    db.add(history)
-    await db.flush()  # get the history.id
-
-    for i, track in enumerate(result.tracks):
-        db.add(GenerationHistoryTrack(
-            generation_id=history.id,
-            spotify_track_id=track.spotify_id,
-            track_name=track.name,
-            artist_name=track.artist,
-            duration_ms=track.duration_ms,
-            is_discovery=1 if track.is_discovery else 0,
-            position=i,
-        ))
-    await db.commit()
-
-    return result
+    await _persist_history(history, result.tracks, db)
+    result.history_id = history.id
@@ -0,0 +1,321 @@
+"""Background generation jobs — execute() runs in a worker pool instead of the request.
+
+Jobs are persisted in `generation_jobs` so their status survives page
+reloads. A batch is one job per target sharing a `batch_id`; whichever
+worker picks it up runs all its queued jobs with execute_batch(). Stage timings of a running job are kept in memory and written to
+the row when it finishes; jobs still queued at startup are picked up again,
+jobs that were running are marked failed.
+"""
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from playlist_generator.config import settings
+from playlist_generator.database import async_session_factory
+from playlist_generator.models.job import GenerationJob
+from playlist_generator.models.user import User
+from playlist_generator.services import generation as gen_service
+from playlist_generator.services.spotify_auth import get_spotify_client
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class _StageClock:
+    """Per-stage durations of one run: time since the previous stage finished.
+
+    Repeated stages (one `chunk_written` per write call) add up.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.timings: dict[str, float] = {}
+
+    async def __call__(self, stage: str, data: dict) -> None:
+        now = time.perf_counter()
+        self.timings[stage] = round(self.timings.get(stage, 0.0) + now - self._last, 3)
+        self._last = now
+
+    def finish(self) -> dict[str, float]:
+        return {**self.timings, "total": round(time.perf_counter() - self.started, 3)}
+
+
+class JobQueue:
+    def __init__(
+        self,
+        workers: int | None = None,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ) -> None:
+        self._workers = workers or settings.GENERATION_WORKERS
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._running: dict[str, _StageClock] = {}
+        self._previews: dict[str, gen_service.GenerationResult] = {}
+
+    async def start(self) -> None:
+        """Recover unfinished jobs and start the workers."""
+        async with self._session_factory() as db:
+            await db.execute(
+                update(GenerationJob)
+                .where(GenerationJob.status == RUNNING)
+                .values(status=FAILED, error="Interrupted by a restart", finished_at=time.time())
+            )
+            await db.commit()
+            result = await db.execute(
+                select(GenerationJob.id)
+                .where(GenerationJob.status == QUEUED)
+                .order_by(GenerationJob.created_at)
+            )
+            for job_id in result.scalars().all():
+                self._queue.put_nowait(job_id)
+
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self._workers)]
+        logger.info("Started %d generation worker(s)", self._workers)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self) -> None:
+        """Wait until every submitted job has been processed."""
+        await self._queue.join()
+
+    async def submit(
+        self,
+        user_id: str,
+        target_playlist_id: str,
+        target_playlist_name: str | None,
+        db: AsyncSession,
+        max_tracks: int | None = None,
+        max_minutes: int | None = None,
+        discovery_mode: str | None = None,
+        discovery_value: float | None = None,
+        previewed: gen_service.GenerationResult | None = None,
+    ) -> GenerationJob:
+        """Persist a new job and queue it. Returns immediately.
+
+        `previewed` is written as-is. It is only held in memory, so a job
+        resumed after a restart runs the pipeline again.
+        """
+        job = GenerationJob(
+            user_id=user_id,
+            target_playlist_id=target_playlist_id,
+            target_playlist_name=target_playlist_name,
+            status=QUEUED,
+            max_tracks_param=max_tracks,
+            max_minutes_param=max_minutes,
+            discovery_mode=discovery_mode,
+            discovery_value=discovery_value,
+        )
+        db.add(job)
+        await db.commit()
+        if previewed is not None:
+            self._previews[job.id] = previewed
+        self._queue.put_nowait(job.id)
+        logger.info("Queued generation job %s for user %s", job.id, user_id)
+        return job
+
+    async def submit_batch(
+        self,
+        user_id: str,
+        targets: list[gen_service.BatchTarget],
+        db: AsyncSession,
+    ) -> list[GenerationJob]:
+        """Persist one job per target and queue them to run together. Returns immediately."""
+        batch_id = str(uuid.uuid4())
+        batch = [
+            GenerationJob(
+                user_id=user_id,
+                batch_id=batch_id,
+                target_playlist_id=t.playlist_id,
+                target_playlist_name=t.playlist_name,
+                status=QUEUED,
+                max_tracks_param=t.max_tracks,
+                max_minutes_param=t.max_minutes,
+                discovery_mode=t.discovery_mode,
+                discovery_value=t.discovery_value,
+            )
+            for t in targets
+        ]
+        db.add_all(batch)
+        await db.commit()
+        # One queue entry runs the whole batch
+        self._queue.put_nowait(batch[0].id)
+        logger.info("Queued generation batch %s (%d targets) for user %s", batch_id, len(batch), user_id)
+        return batch
+
+    def live_timings(self, job_id: str) -> dict[str, float] | None:
+        """Stage timings so far of a job running in this process."""
+        clock = self._running.get(job_id)
+        return dict(clock.timings) if clock else None
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception("Generation job %s crashed", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        async with self._session_factory() as db:
+            batch_id = await db.scalar(
+                select(GenerationJob.batch_id).where(GenerationJob.id == job_id)
+            )
+            if batch_id:
+                await self._run_batch(batch_id, db)
+                return
+
+            # Claim atomically; a job can be queued twice (submitted and recovered)
+            claimed = await db.execute(
+                update(GenerationJob)
+                .where(GenerationJob.id == job_id, GenerationJob.status == QUEUED)
+                .values(status=RUNNING, started_at=time.time())
+            )
+            await db.commit()
+            if claimed.rowcount != 1:
+                return
+            previewed = self._previews.pop(job_id, None)
+
+            job = await db.get(GenerationJob, job_id)
+            user = await db.get(User, job.user_id) if job else None
+            if job is None or user is None:
+                await _fail_claimed(db, GenerationJob.id == job_id)
+                return
+
+            clock = _StageClock()
+            self._running[job_id] = clock
+            try:
+                spotify = await get_spotify_client(user, db)
+                result = await gen_service.execute(
+                    user_id=user.id,
+                    target_playlist_id=job.target_playlist_id,
+                    target_playlist_name=job.target_playlist_name,
+                    spotify=spotify,
+                    db=db,
+                    max_tracks=job.max_tracks_param,
+                    max_minutes=job.max_minutes_param,
+                    discovery_mode=job.discovery_mode,
+                    discovery_value=job.discovery_value,
+                    progress=clock,
+                    previewed=previewed,
+                )
+            except Exception as e:
+                logger.exception("Generation job %s failed", job_id)
+                await db.rollback()
+                await db.refresh(job)
+                job.status = FAILED
+                job.error = str(e) or type(e).__name__
+            else:
+                _succeed(job, result)
+            finally:
+                del self._running[job_id]
+
+            job.stage_timings = json.dumps(clock.finish())
+            job.finished_at = time.time()
+            await db.commit()
+            logger.info("Generation job %s %s", job_id, job.status)
+
+    async def _run_batch(self, batch_id: str, db: AsyncSession) -> None:
+        # Claim every queued job of the batch at once; other entries of it
+        # (queued again on restart) then find nothing to claim
+        claimed = await db.execute(
+            update(GenerationJob)
+            .where(GenerationJob.batch_id == batch_id, GenerationJob.status == QUEUED)
+            .values(status=RUNNING, started_at=time.time())
+        )
+        await db.commit()
+        if claimed.rowcount == 0:
+            return
+
+        result = await db.execute(
+            select(GenerationJob)
+            .where(GenerationJob.batch_id == batch_id, GenerationJob.status == RUNNING)
+            .order_by(GenerationJob.created_at)
+        )
+        batch = list(result.scalars().all())
+        user = await db.get(User, batch[0].user_id) if batch else None
+        if user is None:
+            await _fail_claimed(db, GenerationJob.batch_id == batch_id)
+            return
+
+        clock = _StageClock()
+        for job in batch:
+            self._running[job.id] = clock
+        try:
+            spotify = await get_spotify_client(user, db)
+            outcomes = await gen_service.execute_batch(
+                user.id,
+                [
+                    gen_service.BatchTarget(
+                        job.target_playlist_id,
+                        job.target_playlist_name,
+                        max_tracks=job.max_tracks_param,
+                        max_minutes=job.max_minutes_param,
+                        discovery_mode=job.discovery_mode,
+                        discovery_value=job.discovery_value,
+                    )
+                    for job in batch
+                ],
+                spotify,
+                db,
+                progress=clock,
+            )
+        except Exception as e:
+            logger.exception("Generation batch %s failed", batch_id)
+            await db.rollback()
+            for job in batch:
+                await db.refresh(job)
+            outcomes = [e] * len(batch)
+        finally:
+            for job in batch:
+                del self._running[job.id]
+
+        timings = json.dumps(clock.finish())
+        finished_at = time.time()
+        for job, outcome in zip(batch, outcomes):
+            if isinstance(outcome, BaseException):
+                job.status = FAILED
+                job.error = str(outcome) or type(outcome).__name__
+            else:
+                _succeed(job, outcome)
+            job.stage_timings = timings
+            job.finished_at = finished_at
+        await db.commit()
+        logger.info("Generation batch %s finished (%d jobs)", batch_id, len(batch))
+
+
+def _succeed(job: GenerationJob, result: gen_service.GenerationResult) -> None:
+    job.status = SUCCEEDED
+    job.generation_id = result.history_id
+    job.track_count = len(result.tracks)
+    job.total_duration_ms = result.total_duration_ms
+    job.discovery_count = result.discovery_count
+
+
+async def _fail_claimed(db: AsyncSession, where) -> None:
+    # The user was deleted after the job was queued; don't leave it RUNNING
+    await db.execute(
+        update(GenerationJob)
+        .where(where, GenerationJob.status == RUNNING)
+        .values(status=FAILED, error="User no longer exists", finished_at=time.time())
+    )
+    await db.commit()
+
+
+queue = JobQueue()
@@ -0,0 +1,243 @@
+"""Playlist contents cache — keyed by Spotify's snapshot_id so unchanged playlists are never refetched.
+
+Two tiers, both shared by every user: snapshots persisted in the database,
+fronted by an in-memory LRU (`shared`) so popular source playlists are
+served without reading thousands of snapshot rows on every preview.
+"""
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from playlist_generator.config import settings
+from playlist_generator.models.track_cache import PlaylistSnapshot, PlaylistSnapshotTrack
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlaylistContents:
+    playlist_id: str
+    snapshot_id: str | None
+    tracks: list[dict]  # Spotify-shaped track dicts: id, name, artists, duration_ms
+    from_cache: bool = False
+    # Items in the playlist per Spotify, when known; more than len(tracks)
+    # if it holds local files or unavailable tracks, which are not kept
+    total: int | None = None
+
+
+_TRACK_OVERHEAD_BYTES = 400  # dicts, list slots and small ints of one track
+
+
+def _estimate_bytes(tracks: list[dict]) -> int:
+    """Rough in-memory size of a track list: fixed overhead plus string lengths."""
+    size = 0
+    for t in tracks:
+        size += _TRACK_OVERHEAD_BYTES + len(t.get("id") or "") + len(t.get("name") or "")
+        size += sum(len(a.get("name") or "") for a in t.get("artists") or [])
+    return size
+
+
+@dataclass
+class _Entry:
+    tracks: list[dict]
+    size: int
+    expires_at: float
+
+
+class SharedContents:
+    """In-memory playlist contents keyed by (playlist ID, snapshot ID).
+
+    Entries expire after `ttl_seconds`; the least recently used ones are
+    evicted once the estimated size exceeds `max_bytes`. Track lists are
+    shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._latest: dict[str, str] = {}  # playlist ID -> newest snapshot put
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, playlist_id: str, snapshot_id: str) -> PlaylistContents | None:
+        key = (playlist_id, snapshot_id)
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.time():
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return PlaylistContents(playlist_id, snapshot_id, entry.tracks, from_cache=True)
+
+    def latest(self, playlist_id: str) -> PlaylistContents | None:
+        """The newest snapshot held for a playlist, if any."""
+        snapshot_id = self._latest.get(playlist_id)
+        return self.get(playlist_id, snapshot_id) if snapshot_id else None
+
+    def put(self, contents: PlaylistContents) -> None:
+        if not contents.snapshot_id:
+            return
+        key = (contents.playlist_id, contents.snapshot_id)
+        size = _estimate_bytes(contents.tracks)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(contents.tracks, size, time.time() + self.ttl_seconds)
+        self._latest[contents.playlist_id] = contents.snapshot_id
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        if self._latest.get(key[0]) == key[1]:
+            del self._latest[key[0]]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._latest.clear()
+        self.bytes = 0
+
+    def metrics(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+shared = SharedContents(
+    max_bytes=settings.PLAYLIST_MEMORY_CACHE_BYTES,
+    ttl_seconds=settings.PLAYLIST_MEMORY_CACHE_TTL_SECONDS,
+)
+
+
+async def load(
+    playlist_ids: list[str], db: AsyncSession
+) -> dict[str, PlaylistContents]:
+    """Load the cached contents of the given playlists, keyed by playlist ID.
+
+    Playlists held in memory skip the database; the rest are read from it
+    and kept in memory for the next caller.
+
+    Callers compare the returned snapshot_id with Spotify's current one
+    before trusting the tracks.
+    """
+    in_memory = {
+        pid: hit for pid in set(playlist_ids) if (hit := shared.latest(pid)) is not None
+    }
+    missing = set(playlist_ids) - in_memory.keys()
+    if not missing:
+        return in_memory
+
+    result = await db.execute(
+        select(PlaylistSnapshot)
+        .where(PlaylistSnapshot.spotify_playlist_id.in_(missing))
+        .order_by(PlaylistSnapshot.fetched_at)
+    )
+    # Latest snapshot wins if more than one is stored
+    snapshots = {s.spotify_playlist_id: s for s in result.scalars().all()}
+    if not snapshots:
+        return in_memory
+
+    contents = {
+        pid: PlaylistContents(pid, s.snapshot_id, [], from_cache=True)
+        for pid, s in snapshots.items()
+    }
+    by_snapshot = {s.id: contents[pid] for pid, s in snapshots.items()}
+
+    result = await db.execute(
+        select(
+            PlaylistSnapshotTrack.playlist_snapshot_id,
+            PlaylistSnapshotTrack.spotify_track_id,
+            PlaylistSnapshotTrack.track_name,
+            PlaylistSnapshotTrack.artist_name,
+            PlaylistSnapshotTrack.duration_ms,
+        )
+        .where(PlaylistSnapshotTrack.playlist_snapshot_id.in_(by_snapshot.keys()))
+        .order_by(PlaylistSnapshotTrack.playlist_snapshot_id, PlaylistSnapshotTrack.position)
+    )
+    for snapshot_id, track_id, name, artist, duration_ms in result.all():
+        by_snapshot[snapshot_id].tracks.append({
+            "id": track_id,
+            "name": name or "",
+            "artists": [{"name": artist}] if artist else [],
+            "duration_ms": duration_ms or 0,
+        })
+
+    for c in contents.values():
+        shared.put(c)
+    return {**in_memory, **contents}
+
+
+async def store(contents: list[PlaylistContents], db: AsyncSession) -> None:
+    """Persist freshly fetched playlists, replacing any older snapshots of them.
+
+    Concurrent builds (scheduler and refresher, two users' jobs) may store
+    the same snapshot at once: the first insert wins and the others skip it,
+    instead of failing the generation on the unique constraint.
+    """
+    contents = [c for c in contents if c.snapshot_id and not c.from_cache]
+    if not contents:
+        return
+
+    stale = select(PlaylistSnapshot.id).where(or_(*(
+        and_(
+            PlaylistSnapshot.spotify_playlist_id == c.playlist_id,
+            PlaylistSnapshot.snapshot_id != c.snapshot_id,
+        )
+        for c in contents
+    )))
+    await db.execute(
+        delete(PlaylistSnapshotTrack).where(PlaylistSnapshotTrack.playlist_snapshot_id.in_(stale))
+    )
+    await db.execute(delete(PlaylistSnapshot).where(PlaylistSnapshot.id.in_(stale)))
+
+    for c in contents:
+        snapshot_id = str(uuid.uuid4())
+        inserted = await db.execute(
+            sqlite_insert(PlaylistSnapshot)
+            .values(
+                id=snapshot_id,
+                spotify_playlist_id=c.playlist_id,
+                snapshot_id=c.snapshot_id,
+                track_count=len(c.tracks),
+                fetched_at=time.time(),
+            )
+            .on_conflict_do_nothing(index_elements=["spotify_playlist_id", "snapshot_id"])
+        )
+        if inserted.rowcount != 1:
+            continue  # already stored, tracks and all
+
+        rows = []
+        for position, t in enumerate(c.tracks):
+            artists = t.get("artists", [])
+            rows.append({
+                "playlist_snapshot_id": snapshot_id,
+                "position": position,
+                "spotify_track_id": t["id"],
+                "track_name": t.get("name"),
+                "artist_name": ", ".join(a["name"] for a in artists) if artists else None,
+                "duration_ms": t.get("duration_ms"),
+            })
+        if rows:
+            await db.execute(insert(PlaylistSnapshotTrack), rows)
+
+    await db.commit()
+    for c in contents:
+        shared.put(c)
+    logger.info("Cached %d playlist snapshot(s)", len(contents))
@@ -0,0 +1,106 @@
+"""Write a track list to a Spotify playlist with as few write calls as possible.
+
+Instead of clearing the playlist and re-adding everything, the writer
+compares the playlist's current contents with the desired ones and picks the
+cheapest plan: nothing (already identical), a tail edit (keep the common
+prefix, remove the rest, append the new tail) or a replace whose first chunk
+goes through `playlist_replace_items`, so listeners never see it empty.
+
+Reorders are not planned: generated playlists are shuffled, so moving items
+one range at a time would always cost more than a replace.
+"""
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import spotipy
+
+from playlist_generator.services import spotify_api
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 100  # Spotify's maximum items per write request
+
+
+@dataclass
+class WriteOp:
+    kind: str  # "replace", "add" or "remove"
+    uris: list[str]
+
+
+def _chunks(uris: list[str]) -> list[list[str]]:
+    return [uris[i : i + CHUNK_SIZE] for i in range(0, len(uris), CHUNK_SIZE)]
+
+
+def _replace_plan(desired: list[str]) -> list[WriteOp]:
+    chunks = _chunks(desired) or [[]]
+    return [WriteOp("replace", chunks[0])] + [WriteOp("add", c) for c in chunks[1:]]
+
+
+def plan_writes(current: list[str] | None, desired: list[str]) -> list[WriteOp]:
+    """Plan the write calls that turn `current` into `desired`.
+
+    `current` is None when the playlist's contents are unknown, which always
+    results in a replace.
+    """
+    if current is None:
+        return _replace_plan(desired)
+    if current == desired:
+        return []
+
+    prefix = 0
+    for have, want in zip(current, desired):
+        if have != want:
+            break
+        prefix += 1
+
+    removed = current[prefix:]
+    added = desired[prefix:]
+    # Removal is by URI, so only safe if none of those URIs must stay in the prefix
+    kept = set(current[:prefix])
+    if any(uri in kept for uri in removed):
+        return _replace_plan(desired)
+
+    replace_cost = max(1, math.ceil(len(desired) / CHUNK_SIZE))
+    tail_cost = math.ceil(len(set(removed)) / CHUNK_SIZE) + math.ceil(len(added) / CHUNK_SIZE)
+    if tail_cost >= replace_cost:
+        return _replace_plan(desired)
+
+    ops = [WriteOp("remove", c) for c in _chunks(list(dict.fromkeys(removed)))]
+    ops += [WriteOp("add", c) for c in _chunks(added)]
+    return ops
+
+
+async def apply_writes(
+    playlist_id: str,
+    ops: list[WriteOp],
+    spotify: spotipy.Spotify,
+    snapshot_id: str | None = None,
+    on_chunk: Callable[[int, int], Awaitable[None]] | None = None,
+) -> str | None:
+    """Apply planned writes in order. Returns the playlist's resulting snapshot_id.
+
+    `on_chunk(done, total)` is awaited after each write call.
+    """
+    for done, op in enumerate(ops, start=1):
+        if op.kind == "replace":
+            result = await spotify_api.call(
+                spotify.playlist_replace_items, playlist_id, op.uris
+            )
+        elif op.kind == "add":
+            result = await spotify_api.call(
+                spotify.playlist_add_items, playlist_id, op.uris
+            )
+        else:
+            result = await spotify_api.call(
+                spotify.playlist_remove_all_occurrences_of_items,
+                playlist_id, op.uris, snapshot_id=snapshot_id,
+            )
+        if isinstance(result, dict) and result.get("snapshot_id"):
+            snapshot_id = result["snapshot_id"]
+        if on_chunk is not None:
+            await on_chunk(done, len(ops))
+
+    logger.info("Wrote playlist %s in %d call(s)", playlist_id, len(ops))
+    return snapshot_id
@@ -0,0 +1,76 @@
+"""Background rebuilding of stored candidate pools.
+
+A single loop, started in the app lifespan, polls for users whose stored
+pool was marked changed by a base list or blacklist edit, or is ageing, and
+rebuilds them one at a time with background Spotify priority. Pools of
+users who have not previewed for a while are left to expire.
+"""
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from playlist_generator.config import settings
+from playlist_generator.database import async_session_factory
+from playlist_generator.models.user import User
+from playlist_generator.services import candidate_pool, rate_limit
+from playlist_generator.services import generation as gen_service
+from playlist_generator.services.spotify_auth import get_spotify_client
+
+logger = logging.getLogger(__name__)
+
+
+class PoolRefresher:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ) -> None:
+        self._session_factory = session_factory
+        self._loop_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._loop_task = asyncio.create_task(self._loop())
+        logger.info("Candidate pool refresher started")
+
+    async def stop(self) -> None:
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Candidate pool refresh failed")
+            await asyncio.sleep(settings.CANDIDATE_POOL_POLL_SECONDS)
+
+    async def tick(self, now: float | None = None) -> list[str]:
+        """Rebuild every pool due for a refresh. Returns the refreshed user IDs."""
+        async with self._session_factory() as db:
+            due = await candidate_pool.due_for_refresh(db, now)
+
+        refreshed: list[str] = []
+        for user_id in due:
+            try:
+                await self._refresh(user_id)
+            except Exception:
+                # Previews fall back to building the pool live
+                logger.exception("Could not refresh candidate pool of user %s", user_id)
+            else:
+                refreshed.append(user_id)
+        return refreshed
+
+    async def _refresh(self, user_id: str) -> None:
+        async with self._session_factory() as db:
+            user = await db.get(User, user_id)
+            if user is None:
+                return
+            spotify = await get_spotify_client(user, db)
+            with rate_limit.background():
+                size = await gen_service.refresh_candidate_pool(user_id, spotify, db)
+        logger.info("Refreshed candidate pool of user %s (%d tracks)", user_id, size)
+
+
+refresher = PoolRefresher()
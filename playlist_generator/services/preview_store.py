@@ -0,0 +1,58 @@
+"""Short-lived store of preview results, so execute writes exactly what was previewed.
+
+Entries live in process memory under a random token, expire after
+PREVIEW_TTL_SECONDS and are evicted oldest-first beyond PREVIEW_MAX_ENTRIES.
+A missing or expired token simply means the caller runs the pipeline again.
+"""
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from playlist_generator.config import settings
+from playlist_generator.services.generation import GenerationResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredPreview:
+    user_id: str
+    result: GenerationResult
+    params: dict  # max_tracks, max_minutes, discovery_mode, discovery_value
+    expires_at: float
+
+
+_previews: OrderedDict[str, StoredPreview] = OrderedDict()
+
+
+def _evict(now: float) -> None:
+    while _previews:
+        token, entry = next(iter(_previews.items()))
+        if entry.expires_at > now and len(_previews) <= settings.PREVIEW_MAX_ENTRIES:
+            break
+        del _previews[token]
+
+
+def put(user_id: str, result: GenerationResult, params: dict) -> str:
+    """Store a preview result and return its token."""
+    now = time.time()
+    token = secrets.token_urlsafe(16)
+    _previews[token] = StoredPreview(
+        user_id, result, params, now + settings.PREVIEW_TTL_SECONDS
+    )
+    _evict(now)
+    return token
+
+
+def get(token: str | None, user_id: str) -> StoredPreview | None:
+    """Return the user's stored preview, or None if unknown or expired."""
+    if not token:
+        return None
+    _evict(time.time())
+    entry = _previews.get(token)
+    if entry is None or entry.user_id != user_id:
+        logger.info("Preview token expired or unknown; execute will run a fresh pipeline")
+        return None
+    return entry
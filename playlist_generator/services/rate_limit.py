@@ -0,0 +1,184 @@
+"""Process-wide Spotify rate limiting.
+
+Every Spotify request made through a `RateLimitedSpotify` or `AsyncSpotify`
+client takes a token from one shared bucket first, whichever user or worker
+it is for. Tokens are taken on the event loop (`spotify_api.call` for the
+spotipy client), so a call waiting for one does not hold a pool thread.
+Calls run with a priority: interactive (a user waiting on a page) or
+background (scheduled regeneration). Background calls leave a reserve of
+tokens for interactive ones and wait while interactive calls are queued.
+
+A 429 response pauses the whole bucket for its `Retry-After` instead of
+letting spotipy sleep and retry inside each thread, then the call is retried.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import spotipy
+
+from playlist_generator.config import settings
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+_DEFAULT_RETRY_AFTER = 5.0  # seconds, when a 429 carries no usable header
+MAX_RETRY_AFTER = 60.0  # longer pauses are honoured but the call fails instead of waiting
+
+# Priority of the Spotify calls made by the current task, read when a call
+# takes its token.
+priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "spotify_priority", default=INTERACTIVE
+)
+
+
+@contextmanager
+def background() -> Iterator[None]:
+    """Run the Spotify calls made inside the block with background priority."""
+    token = priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        priority.reset(token)
+
+
+class RateLimiter:
+    """Token bucket shared by every Spotify call in the process."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        background_reserve: int = 0,
+        clock=time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.background_reserve = min(background_reserve, burst - 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._waiting = dict.fromkeys(PRIORITIES, 0)
+        self._calls = dict.fromkeys(PRIORITIES, 0)
+        self._wait_seconds = dict.fromkeys(PRIORITIES, 0.0)
+        self._max_wait = dict.fromkeys(PRIORITIES, 0.0)
+        self._throttled = 0
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.burst, self._tokens + (now - start) * self.rate)
+        self._updated = max(now, self._updated)
+
+    def _try_take(self, prio: str) -> float:
+        """Take a token and return 0, or return how long to wait before retrying."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if now < self._paused_until:
+                return self._paused_until - now
+            needed = 1.0
+            if prio == BACKGROUND:
+                if self._waiting[INTERACTIVE]:
+                    return 1.0 / self.rate
+                needed += self.background_reserve
+            if self._tokens >= needed:
+                self._tokens -= 1
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def _enter(self, prio: str) -> float:
+        with self._lock:
+            self._waiting[prio] += 1
+        return self._clock()
+
+    def _leave(self, prio: str, started: float) -> None:
+        waited = self._clock() - started
+        with self._lock:
+            self._waiting[prio] -= 1
+            self._calls[prio] += 1
+            self._wait_seconds[prio] += waited
+            self._max_wait[prio] = max(self._max_wait[prio], waited)
+
+    async def acquire(self, prio: str = INTERACTIVE) -> None:
+        """Wait for a token without blocking the event loop."""
+        started = self._enter(prio)
+        try:
+            while (delay := self._try_take(prio)) > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self._leave(prio, started)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds` — Spotify said Retry-After."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._throttled += 1
+
+    def metrics(self) -> dict:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "tokens_available": round(self._tokens, 2),
+                "paused_for_seconds": round(max(0.0, self._paused_until - now), 2),
+                "throttled_total": self._throttled,
+                "priorities": {
+                    p: {
+                        "waiting": self._waiting[p],
+                        "calls": self._calls[p],
+                        "avg_wait_ms": round(
+                            1000 * self._wait_seconds[p] / self._calls[p], 1
+                        ) if self._calls[p] else 0.0,
+                        "max_wait_ms": round(1000 * self._max_wait[p], 1),
+                    }
+                    for p in PRIORITIES
+                },
+            }
+
+
+def retry_after(headers) -> float:
+    """Seconds to pause for a 429, from its Retry-After header."""
+    try:
+        return max(0.0, float((headers or {}).get("Retry-After")))
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER
+
+
+class RateLimitedSpotify(spotipy.Spotify):
+    """spotipy client whose requests all go through the shared limiter.
+
+    `spotify_api.call` takes the token before handing a method to the
+    `spotify` pool and retries it after a 429. 429 is left out of spotipy's
+    own status retries so the response (and its Retry-After header) reaches
+    that loop instead of being slept on per thread.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs.setdefault("status_forcelist", (500, 502, 503, 504))
+        super().__init__(*args, **kwargs)
+        self.prefix = settings.SPOTIFY_API_PREFIX
+
+    def _build_session(self) -> None:
+        super()._build_session()
+        # urllib3 still retries a 429 that carries Retry-After, forcelist or not
+        for adapter in self._session.adapters.values():
+            adapter.max_retries = adapter.max_retries.new(respect_retry_after_header=False)
+
+
+limiter = RateLimiter(
+    rate=settings.SPOTIFY_RATE_PER_SECOND,
+    burst=settings.SPOTIFY_RATE_BURST,
+    background_reserve=settings.SPOTIFY_BACKGROUND_RESERVE,
+)
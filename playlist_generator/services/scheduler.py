@@ -0,0 +1,238 @@
+"""Scheduled regeneration — runs due target schedules through gen_service.execute.
+
+A single loop, started in the app lifespan, polls for schedules whose
+next_run_at has passed. Each one is claimed by advancing next_run_at with a
+conditional update (so several app instances never run the same slot
+twice), then run after a random jitter with bounded global concurrency.
+Missed slots, e.g. while the app was down, run once and are not replayed.
+"""
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from playlist_generator import cron
+from playlist_generator.config import settings
+from playlist_generator.database import async_session_factory
+from playlist_generator.models.schedule import GenerationSchedule, ScheduleRun
+from playlist_generator.models.target import TargetPlaylist
+from playlist_generator.models.user import User
+from playlist_generator.services import generation as gen_service
+from playlist_generator.services import rate_limit
+from playlist_generator.services.spotify_auth import get_spotify_client
+
+logger = logging.getLogger(__name__)
+
+
+def next_run_at(expression: str, timezone: str, after: float | None = None) -> float:
+    """Unix time of the next slot after `after` (default: now). Raises CronError."""
+    try:
+        tz = ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise cron.CronError(f"Unknown timezone: {timezone}") from None
+    start = datetime.fromtimestamp(after if after is not None else time.time(), tz)
+    return cron.parse(expression).next_after(start).timestamp()
+
+
+# ── Schedule management ───────────────────────────────
+
+async def get_schedules(user_id: str, db: AsyncSession) -> list[GenerationSchedule]:
+    result = await db.execute(
+        select(GenerationSchedule)
+        .where(GenerationSchedule.user_id == user_id)
+        .order_by(GenerationSchedule.created_at)
+    )
+    return list(result.scalars().all())
+
+
+async def save_schedule(
+    user_id: str,
+    target_id: str,
+    expression: str,
+    timezone: str,
+    db: AsyncSession,
+    max_tracks: int | None = None,
+    max_minutes: int | None = None,
+    discovery_mode: str | None = None,
+    discovery_value: float | None = None,
+) -> GenerationSchedule:
+    """Create or replace the schedule of a target. Raises CronError if invalid."""
+    next_at = next_run_at(expression, timezone)
+
+    result = await db.execute(
+        select(GenerationSchedule).where(GenerationSchedule.target_id == target_id)
+    )
+    schedule = result.scalar_one_or_none()
+    if schedule is None:
+        schedule = GenerationSchedule(user_id=user_id, target_id=target_id, next_run_at=next_at)
+        db.add(schedule)
+
+    schedule.cron = expression.strip()
+    schedule.timezone = timezone
+    schedule.enabled = 1
+    schedule.next_run_at = next_at
+    schedule.max_tracks_param = max_tracks
+    schedule.max_minutes_param = max_minutes
+    schedule.discovery_mode = discovery_mode
+    schedule.discovery_value = discovery_value
+    await db.commit()
+    return schedule
+
+
+async def set_enabled(schedule: GenerationSchedule, enabled: bool, db: AsyncSession) -> None:
+    schedule.enabled = 1 if enabled else 0
+    if enabled:
+        # Don't fire immediately for slots missed while paused
+        schedule.next_run_at = next_run_at(schedule.cron, schedule.timezone)
+    await db.commit()
+
+
+async def delete_schedule(schedule: GenerationSchedule, db: AsyncSession) -> None:
+    await db.execute(delete(ScheduleRun).where(ScheduleRun.schedule_id == schedule.id))
+    await db.delete(schedule)
+    await db.commit()
+
+
+async def delete_for_target(target_id: str, db: AsyncSession) -> None:
+    """Remove a target's schedule and run log. The caller commits."""
+    schedule_ids = select(GenerationSchedule.id).where(GenerationSchedule.target_id == target_id)
+    await db.execute(delete(ScheduleRun).where(ScheduleRun.schedule_id.in_(schedule_ids)))
+    await db.execute(delete(GenerationSchedule).where(GenerationSchedule.target_id == target_id))
+
+
+async def get_runs(schedule_id: str, db: AsyncSession, limit: int = 20) -> list[ScheduleRun]:
+    result = await db.execute(
+        select(ScheduleRun)
+        .where(ScheduleRun.schedule_id == schedule_id)
+        .order_by(ScheduleRun.started_at.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+# ── Scheduler loop ────────────────────────────────────
+
+class Scheduler:
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        jitter_seconds: float | None = None,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency or settings.SCHEDULER_CONCURRENCY)
+        self._jitter = settings.SCHEDULER_JITTER_SECONDS if jitter_seconds is None else jitter_seconds
+        self._session_factory = session_factory
+        self._loop_task: asyncio.Task | None = None
+        self._runs: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._loop_task = asyncio.create_task(self._loop())
+        logger.info("Scheduler started")
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._loop_task, *self._runs) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+
+    async def drain(self) -> None:
+        """Wait for every run started so far to finish."""
+        await asyncio.gather(*self._runs, return_exceptions=True)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            await asyncio.sleep(settings.SCHEDULER_POLL_SECONDS)
+
+    async def tick(self, now: float | None = None) -> list[str]:
+        """Claim and start every due schedule. Returns the claimed schedule IDs."""
+        now = time.time() if now is None else now
+        claimed: list[str] = []
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(GenerationSchedule).where(
+                    GenerationSchedule.enabled == 1,
+                    GenerationSchedule.next_run_at <= now,
+                )
+            )
+            for schedule in result.scalars().all():
+                try:
+                    next_at = next_run_at(schedule.cron, schedule.timezone, after=now)
+                except cron.CronError:
+                    logger.warning("Disabling schedule %s with invalid cron", schedule.id)
+                    next_at, enabled = schedule.next_run_at, 0
+                else:
+                    enabled = 1
+                won = await db.execute(
+                    update(GenerationSchedule)
+                    .where(
+                        GenerationSchedule.id == schedule.id,
+                        GenerationSchedule.next_run_at == schedule.next_run_at,
+                    )
+                    .values(next_run_at=next_at, enabled=enabled, last_run_at=now)
+                )
+                await db.commit()
+                if won.rowcount == 1 and enabled:
+                    claimed.append(schedule.id)
+
+        for schedule_id in claimed:
+            task = asyncio.create_task(self._run(schedule_id, random.uniform(0, self._jitter)))
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+        return claimed
+
+    async def _run(self, schedule_id: str, delay: float) -> None:
+        # Jitter spreads schedules that share a slot (everyone's 06:00)
+        await asyncio.sleep(delay)
+        async with self._semaphore, self._session_factory() as db:
+            schedule = await db.get(GenerationSchedule, schedule_id)
+            if schedule is None:
+                return
+            run = ScheduleRun(schedule_id=schedule_id)
+            db.add(run)
+            await db.commit()
+
+            try:
+                target = await db.get(TargetPlaylist, schedule.target_id)
+                user = await db.get(User, schedule.user_id)
+                if target is None or user is None:
+                    raise LookupError("Target playlist no longer exists")
+                spotify = await get_spotify_client(user, db)
+                with rate_limit.background():
+                    result = await gen_service.execute(
+                        user_id=user.id,
+                        target_playlist_id=target.spotify_playlist_id,
+                        target_playlist_name=target.playlist_name,
+                        spotify=spotify,
+                        db=db,
+                        max_tracks=schedule.max_tracks_param,
+                        max_minutes=schedule.max_minutes_param,
+                        discovery_mode=schedule.discovery_mode,
+                        discovery_value=schedule.discovery_value,
+                    )
+            except Exception as e:
+                logger.exception("Scheduled generation %s failed", schedule_id)
+                await db.rollback()
+                await db.refresh(run)
+                run.status = "failed"
+                run.error = str(e) or type(e).__name__
+            else:
+                run.status = "succeeded"
+                run.generation_id = result.history_id
+                run.track_count = len(result.tracks)
+
+            run.finished_at = time.time()
+            await db.commit()
+            logger.info("Scheduled generation %s %s", schedule_id, run.status)
+
+
+scheduler = Scheduler()
@@ -4,7 +4,6 @@ Play history is persisted to the database and grows over time. Each sync
 fetches new plays from Spotify and appends them. Skip detection runs against
 the full accumulated history, not just the last 50 tracks.
 """
-import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -14,6 +13,7 @@ from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.models.track_cache import PlayHistory
+from playlist_generator.services import spotify_api
 from playlist_generator.services import track_cache as cache_service
 
 logger = logging.getLogger(__name__)
@@ -83,12 +83,12 @@ async def sync_play_history(
         try:
             if before_ms:
                 logger.info("Page %d: fetching plays before %d", page, before_ms)
-                results = await asyncio.to_thread(
+                results = await spotify_api.call(
                     spotify.current_user_recently_played, limit=50, before=before_ms
                 )
             else:
                 logger.info("Page %d: fetching latest plays", page)
-                results = await asyncio.to_thread(
+                results = await spotify_api.call(
                     spotify.current_user_recently_played, limit=50
                 )
         except Exception as e:
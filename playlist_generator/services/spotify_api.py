@@ -0,0 +1,318 @@
+"""Spotify Web API calls from async code.
+
+Services call `await call(spotify.method, ...)` for every Spotify request.
+With the blocking spotipy client that runs the method on the `spotify`
+thread pool; with `AsyncSpotify` (SPOTIFY_ASYNC_CLIENT) the coroutine is
+awaited directly, so no thread is used at all.
+
+`AsyncSpotify` mirrors the spotipy methods this app uses — same names,
+arguments and return values, error responses raised as `SpotifyException`
+and network failures as the `requests` exceptions spotipy lets through —
+on top of one shared, connection-pooled `httpx.AsyncClient`. Its requests go
+through the same process-wide rate limiter as the spotipy client.
+"""
+import asyncio
+import inspect
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import requests
+import spotipy
+from spotipy.exceptions import SpotifyException
+
+from playlist_generator import executors
+from playlist_generator.concurrency import SingleFlight
+from playlist_generator.config import settings
+from playlist_generator.services import rate_limit
+
+logger = logging.getLogger(__name__)
+
+_RETRY_STATUSES = {500, 502, 503, 504}  # retried with backoff, like spotipy does
+_BACKOFF_SECONDS = 0.3
+_TIMEOUT_SECONDS = 5.0
+
+_http: httpx.AsyncClient | None = None
+
+# Identical Spotify reads in flight at the same time
+flights = SingleFlight()
+
+# Reads that return the same for every user, so one request can serve all
+_CATALOGUE_READS = frozenset({"track", "tracks"})
+
+
+async def call(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run one Spotify client method without blocking the event loop.
+
+    A `RateLimitedSpotify` method takes its rate limit token here, before a
+    pool thread is used: calls waiting on the limiter would otherwise hold
+    threads, and interactive calls queued behind them in the pool would be
+    invisible to the limiter's priorities. A 429 pauses the limiter and the
+    call is retried from here.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args, **kwargs)
+    if not isinstance(getattr(fn, "__self__", None), rate_limit.RateLimitedSpotify):
+        return await executors.spotify.run(fn, *args, **kwargs)
+
+    attempts = settings.SPOTIFY_RATE_LIMIT_RETRIES + 1
+    for attempt in range(attempts):
+        await rate_limit.limiter.acquire(rate_limit.priority.get())
+        try:
+            return await executors.spotify.run(fn, *args, **kwargs)
+        except SpotifyException as e:
+            if e.http_status != 429:
+                raise
+            wait = rate_limit.retry_after(e.headers)
+            rate_limit.limiter.pause(wait)
+            if attempt == attempts - 1 or wait > rate_limit.MAX_RETRY_AFTER:
+                raise
+
+
+def client_key(client: Any) -> Any:
+    """Identifies whose token a client calls with, to keep shared work per user."""
+    return getattr(client, "_auth", None) or id(client)
+
+
+async def call_shared(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Like call(), but concurrent identical reads share one request.
+
+    Keyed by method name, (hashable) arguments and the calling user's token:
+    anything that needs authorization (a playlist may be private) is only
+    shared between calls made as the same user, or one user would get
+    another's result or error. Catalogue reads are shared between users.
+    The result is shared too: treat it as read-only.
+    """
+    name = getattr(fn, "__name__", fn)
+    owner = None if name in _CATALOGUE_READS else client_key(getattr(fn, "__self__", None))
+    key = (name, owner, args, tuple(sorted(kwargs.items())))
+    return await flights.do(key, lambda: call(fn, *args, **kwargs))
+
+
+def _shared_http() -> httpx.AsyncClient:
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            timeout=_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.SPOTIFY_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SPOTIFY_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return _http
+
+
+async def aclose() -> None:
+    """Close the shared connection pool (app shutdown)."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
+def _uri(kind: str, spotify_id: str) -> str:
+    return spotify_id if spotify_id.startswith("spotify:") else f"spotify:{kind}:{spotify_id}"
+
+
+def _transport_error(e: httpx.TransportError) -> requests.RequestException:
+    """The `requests` exception spotipy raises for the same network failure."""
+    if isinstance(e, httpx.ConnectTimeout):
+        cls = requests.exceptions.ConnectTimeout
+    elif isinstance(e, httpx.TimeoutException):
+        cls = requests.exceptions.ReadTimeout
+    else:
+        cls = requests.exceptions.ConnectionError
+    return cls(str(e) or type(e).__name__)
+
+
+def _error(response: httpx.Response) -> SpotifyException:
+    try:
+        error = response.json().get("error", {})
+        msg, reason = error.get("message"), error.get("reason")
+    except (ValueError, AttributeError):
+        msg, reason = response.text or None, None
+    return SpotifyException(
+        response.status_code, -1, f"{response.url}:\n {msg}",
+        reason=reason, headers=response.headers,
+    )
+
+
+class AsyncSpotify:
+    """Async counterpart of `spotipy.Spotify` for one user's access token."""
+
+    def __init__(self, auth: str, http: httpx.AsyncClient | None = None) -> None:
+        self._auth = auth
+        self._client = http
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Any = None,
+        content_type: str | None = None,
+        **params,
+    ) -> Any:
+        http = self._client or _shared_http()
+        if not url.startswith("http"):
+            url = settings.SPOTIFY_API_PREFIX + url
+        headers = {
+            "Authorization": f"Bearer {self._auth}",
+            "Content-Type": content_type or "application/json",
+        }
+        if payload is None:
+            body = None
+        elif content_type:
+            body = payload
+        else:
+            body = json.dumps(payload)
+        # None keeps the query string of a `next` URL; an empty dict would drop it
+        query = {k: v for k, v in params.items() if v is not None} or None
+
+        attempts = settings.SPOTIFY_RATE_LIMIT_RETRIES + 1
+        for attempt in range(attempts):
+            await rate_limit.limiter.acquire(rate_limit.priority.get())
+            last = attempt == attempts - 1
+            try:
+                response = await http.request(
+                    method, url, params=query, headers=headers, content=body
+                )
+            except httpx.TransportError as e:
+                # Like spotipy, retry only when the request never reached Spotify
+                if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)) and not last:
+                    await asyncio.sleep(_BACKOFF_SECONDS * 2 ** attempt)
+                    continue
+                raise _transport_error(e) from e
+            if response.status_code == 429:
+                wait = rate_limit.retry_after(response.headers)
+                rate_limit.limiter.pause(wait)
+                if last or wait > rate_limit.MAX_RETRY_AFTER:
+                    raise _error(response)
+                continue
+            if response.status_code in _RETRY_STATUSES and not last:
+                await asyncio.sleep(_BACKOFF_SECONDS * 2 ** attempt)
+                continue
+            if response.is_error:
+                logger.error(
+                    "HTTP Error for %s to %s returned %s", method, url, response.status_code
+                )
+                raise _error(response)
+            try:
+                return response.json()
+            except ValueError:
+                return None
+
+    # ── Reads ─────────────────────────────────────────
+
+    async def current_user(self) -> dict:
+        return await self._request("GET", "me")
+
+    async def track(self, track_id: str, market: str | None = None) -> dict:
+        return await self._request("GET", f"tracks/{track_id}", market=market)
+
+    async def tracks(self, tracks: list[str], market: str | None = None) -> dict:
+        return await self._request("GET", "tracks", ids=",".join(tracks), market=market)
+
+    async def playlist(
+        self, playlist_id: str, fields: str | None = None, market: str | None = None
+    ) -> dict:
+        return await self._request(
+            "GET", f"playlists/{playlist_id}",
+            fields=fields, market=market, additional_types="track",
+        )
+
+    async def playlist_tracks(
+        self,
+        playlist_id: str,
+        fields: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        market: str | None = None,
+    ) -> dict:
+        return await self._request(
+            "GET", f"playlists/{playlist_id}/items",
+            fields=fields, limit=limit, offset=offset, market=market,
+            additional_types="track",
+        )
+
+    async def next(self, result: dict) -> dict | None:
+        if result["next"]:
+            return await self._request("GET", result["next"])
+        return None
+
+    async def recommendations(
+        self, seed_tracks: list[str] | None = None, limit: int = 20, **kwargs
+    ) -> dict:
+        if seed_tracks:
+            kwargs["seed_tracks"] = ",".join(seed_tracks)
+        return await self._request("GET", "recommendations", limit=limit, **kwargs)
+
+    async def current_user_recently_played(
+        self, limit: int = 50, after: int | None = None, before: int | None = None
+    ) -> dict:
+        return await self._request(
+            "GET", "me/player/recently-played", limit=limit, after=after, before=before
+        )
+
+    async def current_user_playlists(self, limit: int = 50, offset: int = 0) -> dict:
+        return await self._request("GET", "me/playlists", limit=limit, offset=offset)
+
+    async def current_user_top_tracks(
+        self, limit: int = 20, offset: int = 0, time_range: str = "medium_term"
+    ) -> dict:
+        return await self._request(
+            "GET", "me/top/tracks", time_range=time_range, limit=limit, offset=offset
+        )
+
+    async def current_user_saved_tracks(
+        self, limit: int = 20, offset: int = 0, market: str | None = None
+    ) -> dict:
+        return await self._request(
+            "GET", "me/tracks", limit=limit, offset=offset, market=market
+        )
+
+    async def search(
+        self,
+        q: str,
+        limit: int = 10,
+        offset: int = 0,
+        type: str = "track",
+        market: str | None = None,
+    ) -> dict:
+        return await self._request(
+            "GET", "search", q=q, limit=limit, offset=offset, type=type, market=market
+        )
+
+    # ── Writes ────────────────────────────────────────
+
+    async def playlist_add_items(
+        self, playlist_id: str, items: list[str], position: int | None = None
+    ) -> dict:
+        return await self._request(
+            "POST", f"playlists/{playlist_id}/items",
+            payload=[_uri("track", t) for t in items], position=position,
+        )
+
+    async def playlist_replace_items(self, playlist_id: str, items: list[str]) -> dict:
+        return await self._request(
+            "PUT", f"playlists/{playlist_id}/items",
+            payload={"uris": [_uri("track", t) for t in items]},
+        )
+
+    async def playlist_remove_all_occurrences_of_items(
+        self, playlist_id: str, items: list[str], snapshot_id: str | None = None
+    ) -> dict:
+        payload: dict = {"items": [{"uri": _uri("track", t)} for t in items]}
+        if snapshot_id:
+            payload["snapshot_id"] = snapshot_id
+        return await self._request("DELETE", f"playlists/{playlist_id}/items", payload=payload)
+
+    async def playlist_upload_cover_image(self, playlist_id: str, image_b64: str) -> None:
+        return await self._request(
+            "PUT", f"playlists/{playlist_id}/images",
+            payload=image_b64, content_type="image/jpeg",
+        )
+
+
+SpotifyClient = spotipy.Spotify | AsyncSpotify
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import time
 
@@ -7,9 +6,13 @@ from spotipy.oauth2 import SpotifyOAuth
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from playlist_generator import executors
 from playlist_generator.config import settings
 from playlist_generator.encryption import encrypt, decrypt
 from playlist_generator.models.user import User
+from playlist_generator.services.rate_limit import RateLimitedSpotify
+from playlist_generator.services import spotify_api
+from playlist_generator.services.spotify_api import AsyncSpotify, SpotifyClient
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +37,11 @@ def get_auth_url() -> str:
 async def handle_callback(code: str, db: AsyncSession) -> User:
     """Exchange the auth code for tokens, upsert the user, and return the User."""
     auth_manager = _create_oauth_manager()
-    token_info = await asyncio.to_thread(auth_manager.get_access_token, code)
+    token_info = await executors.spotify.run(auth_manager.get_access_token, code)
 
     # Get the user's Spotify profile
-    sp = spotipy.Spotify(auth=token_info["access_token"])
-    profile = await asyncio.to_thread(sp.current_user)
+    sp = RateLimitedSpotify(auth=token_info["access_token"])
+    profile = await spotify_api.call(sp.current_user)
 
     spotify_user_id = profile["id"]
     display_name = profile.get("display_name")
@@ -93,7 +96,7 @@ async def refresh_token_if_needed(user: User, db: AsyncSession) -> str:
     logger.info("Refreshing expired Spotify token for user %s", user.spotify_user_id)
     auth_manager = _create_oauth_manager()
     refresh_token = decrypt(user.refresh_token)
-    new_token_info = await asyncio.to_thread(
+    new_token_info = await executors.spotify.run(
         auth_manager.refresh_access_token, refresh_token
     )
 
@@ -107,7 +110,12 @@ async def refresh_token_if_needed(user: User, db: AsyncSession) -> str:
     return new_token_info["access_token"]
 
 
-async def get_spotify_client(user: User, db: AsyncSession) -> spotipy.Spotify:
-    """Return a ready-to-use Spotify client with a valid access token."""
+async def get_spotify_client(user: User, db: AsyncSession) -> SpotifyClient:
+    """Return a ready-to-use Spotify client with a valid access token.
+
+    The native async client when SPOTIFY_ASYNC_CLIENT is set, spotipy otherwise.
+    """
     access_token = await refresh_token_if_needed(user, db)
-    return spotipy.Spotify(auth=access_token)
+    if settings.SPOTIFY_ASYNC_CLIENT:
+        return AsyncSpotify(auth=access_token)
+    return RateLimitedSpotify(auth=access_token)
@@ -1,5 +1,4 @@
 """Track metadata cache — stores every track we see to avoid repeat API calls."""
-import asyncio
 import logging
 import time
 
@@ -8,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.models.track_cache import TrackCache
+from playlist_generator.services import spotify_api
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +38,7 @@ async def get_or_fetch(
 
     # Fetch from Spotify
     try:
-        data = await asyncio.to_thread(spotify.track, spotify_track_id)
+        data = await spotify_api.call_shared(spotify.track, spotify_track_id)
         artists = data.get("artists", [])
         images = data.get("album", {}).get("images", [])
 
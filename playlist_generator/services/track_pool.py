@@ -0,0 +1,156 @@
+"""Compact candidate pool for generation.
+
+A preview can hold 50k+ candidate tracks. Instead of one object per track,
+`TrackPool` keeps parallel columns: interned IDs, artist strings shared
+between tracks, durations in a C array and discovery flags in a bytearray.
+`TrackInfo` objects are only built for the tracks that end up selected.
+"""
+import random
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class TrackInfo:
+    spotify_id: str
+    name: str
+    artist: str
+    duration_ms: int
+    is_discovery: bool = False
+
+
+class TrackPool:
+    """Deduplicated, ordered set of candidate tracks stored column-wise.
+
+    Adding a track whose ID is already present is a no-op, so the first
+    source to contribute a track wins.
+    """
+
+    __slots__ = ("ids", "names", "artists", "durations", "discovery", "_seen", "_artist_strings")
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.names: list[str] = []
+        self.artists: list[str] = []
+        self.durations = array("q")
+        self.discovery = bytearray()
+        self._seen: set[str] = set()
+        self._artist_strings: dict[str, str] = {}
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[TrackInfo]) -> "TrackPool":
+        pool = cls()
+        for t in tracks:
+            pool.add(t.spotify_id, t.name, t.artist, t.duration_ms, t.is_discovery)
+        return pool
+
+    def add(
+        self,
+        spotify_id: str,
+        name: str,
+        artist: str,
+        duration_ms: int,
+        is_discovery: bool = False,
+    ) -> bool:
+        """Append a track unless its ID is already in the pool. Returns whether it was added."""
+        if spotify_id in self._seen:
+            return False
+        spotify_id = sys.intern(spotify_id)
+        self._seen.add(spotify_id)
+        self.ids.append(spotify_id)
+        self.names.append(name)
+        self.artists.append(self._artist_strings.setdefault(artist, artist))
+        self.durations.append(duration_ms)
+        self.discovery.append(1 if is_discovery else 0)
+        return True
+
+    def add_spotify_track(self, track: dict, is_discovery: bool = False) -> bool:
+        """Append a Spotify track dict (id, name, artists, duration_ms)."""
+        artists = track.get("artists", [])
+        return self.add(
+            track["id"],
+            track.get("name", ""),
+            ", ".join(a["name"] for a in artists) if artists else "",
+            track.get("duration_ms", 0),
+            is_discovery,
+        )
+
+    def add_from(self, other: "TrackPool", i: int) -> bool:
+        """Append row `i` of another pool."""
+        return self.add(
+            other.ids[i], other.names[i], other.artists[i],
+            other.durations[i], bool(other.discovery[i]),
+        )
+
+    def exclude(self, blocked: set[str]) -> "TrackPool":
+        """A new pool without the blocked track IDs, in the same order."""
+        return self._take([i for i, tid in enumerate(self.ids) if tid not in blocked])
+
+    def total_duration_ms(self) -> int:
+        return sum(self.durations)
+
+    def discovery_count(self) -> int:
+        return sum(self.discovery)
+
+    def to_tracks(self) -> list[TrackInfo]:
+        return list(self)
+
+    def _take(self, indices: Iterable[int]) -> "TrackPool":
+        indices = list(indices)
+        pool = TrackPool()
+        pool.ids = [self.ids[i] for i in indices]
+        pool.names = [self.names[i] for i in indices]
+        pool.artists = [self.artists[i] for i in indices]
+        pool.durations = array("q", (self.durations[i] for i in indices))
+        pool.discovery = bytearray(self.discovery[i] for i in indices)
+        pool._seen = set(pool.ids)
+        pool._artist_strings = self._artist_strings
+        return pool
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, spotify_id: object) -> bool:
+        return spotify_id in self._seen
+
+    def __getitem__(self, i: int) -> TrackInfo:
+        return TrackInfo(
+            self.ids[i], self.names[i], self.artists[i],
+            self.durations[i], bool(self.discovery[i]),
+        )
+
+    def __iter__(self) -> Iterator[TrackInfo]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TrackPool):
+            return NotImplemented
+        return (
+            self.ids == other.ids
+            and self.names == other.names
+            and self.artists == other.artists
+            and self.durations == other.durations
+            and self.discovery == other.discovery
+        )
+
+    def __repr__(self) -> str:
+        return f"TrackPool({len(self)} tracks)"
+
+
+def lazy_shuffle(n: int) -> Iterator[int]:
+    """Yield a uniformly random permutation of range(n), one index at a time.
+
+    A partial Fisher–Yates shuffle with a sparse swap map: drawing k indices
+    costs O(k) time and memory however large n is.
+    """
+    swapped: dict[int, int] = {}
+    for i in range(n):
+        j = random.randrange(i, n)
+        drawn = swapped.get(j, j)
+        current = swapped.pop(i, i)
+        if j != i:
+            swapped[j] = current
+        yield drawn
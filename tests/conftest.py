@@ -27,6 +27,15 @@ def _reset_encryption_cache():
     enc._fernet = None
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_playlist_cache():
+    """Start every test with an empty in-memory playlist contents cache."""
+    from playlist_generator.services import playlist_cache
+    playlist_cache.shared.clear()
+    yield
+    playlist_cache.shared.clear()
+
+
 @pytest_asyncio.fixture
 async def db_session():
     """Provide an async SQLAlchemy session backed by an in-memory SQLite database."""
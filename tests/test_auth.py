@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.encryption import encrypt, decrypt
 from playlist_generator.models.user import User
-from playlist_generator.services import spotify_auth
+from playlist_generator.services import spotify_api, spotify_auth
 
 
 @pytest.mark.asyncio
@@ -26,10 +26,11 @@ async def test_handle_callback_creates_new_user(db_session: AsyncSession):
     }
 
     with (
-        patch.object(spotify_auth, "asyncio") as mock_asyncio,
+        patch.object(spotify_auth, "executors") as mock_executors,
+        patch.object(spotify_api, "executors", mock_executors),
     ):
-        # Make asyncio.to_thread return our fake data
-        mock_asyncio.to_thread = AsyncMock(side_effect=[fake_token_info, fake_profile])
+        # Make the Spotify executor return our fake data
+        mock_executors.spotify.run = AsyncMock(side_effect=[fake_token_info, fake_profile])
 
         user = await spotify_auth.handle_callback("fake_code", db_session)
 
@@ -64,8 +65,11 @@ async def test_handle_callback_updates_existing_user(
         "images": [],
     }
 
-    with patch.object(spotify_auth, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(side_effect=[fake_token_info, fake_profile])
+    with (
+        patch.object(spotify_auth, "executors") as mock_executors,
+        patch.object(spotify_api, "executors", mock_executors),
+    ):
+        mock_executors.spotify.run = AsyncMock(side_effect=[fake_token_info, fake_profile])
 
         user = await spotify_auth.handle_callback("fake_code", db_session)
 
@@ -99,8 +103,8 @@ async def test_refresh_token_if_expired(
         "refresh_token": "new_refresh_too",
     }
 
-    with patch.object(spotify_auth, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value=new_token_info)
+    with patch.object(spotify_auth, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value=new_token_info)
 
         token = await spotify_auth.refresh_token_if_needed(sample_user, db_session)
 
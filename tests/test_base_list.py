@@ -35,8 +35,8 @@ async def test_add_track(db_session: AsyncSession, sample_user: User):
         "album": {"images": [{"url": "https://img.spotify.com/album.jpg"}]},
     }
 
-    with patch("playlist_generator.services.base_list.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value=mock_spotify.track.return_value)
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value=mock_spotify.track.return_value)
 
         track = await base_list.add_track(
             sample_user.id, "4iV5W9uYEdYUVa79Axb7Rh", mock_spotify, db_session
@@ -53,8 +53,8 @@ async def test_add_track_duplicate(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
     mock_spotify.track.return_value = {"name": "Track", "artists": [], "album": {}}
 
-    with patch("playlist_generator.services.base_list.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value=mock_spotify.track.return_value)
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value=mock_spotify.track.return_value)
 
         first = await base_list.add_track(
             sample_user.id, "same_track", mock_spotify, db_session
@@ -72,8 +72,8 @@ async def test_delete_track(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
     mock_spotify.track.return_value = {"name": "Track", "artists": [], "album": {}}
 
-    with patch("playlist_generator.services.base_list.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value=mock_spotify.track.return_value)
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value=mock_spotify.track.return_value)
         track = await base_list.add_track(
             sample_user.id, "track_to_delete", mock_spotify, db_session
         )
@@ -91,8 +91,8 @@ async def test_delete_track_wrong_user(db_session: AsyncSession, sample_user: Us
     mock_spotify = MagicMock()
     mock_spotify.track.return_value = {"name": "Track", "artists": [], "album": {}}
 
-    with patch("playlist_generator.services.base_list.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value=mock_spotify.track.return_value)
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value=mock_spotify.track.return_value)
         track = await base_list.add_track(
             sample_user.id, "track123", mock_spotify, db_session
         )
@@ -106,8 +106,8 @@ async def test_delete_track_wrong_user(db_session: AsyncSession, sample_user: Us
 async def test_add_and_get_playlists(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
 
-    with patch("playlist_generator.services.base_list.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value={
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={
             "name": "Top Hits", "tracks": {"total": 50}, "images": []
         })
         playlist = await base_list.add_playlist(
@@ -5,14 +5,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.models.user import User
 from playlist_generator.services import blacklist
+from playlist_generator.services.playlist_cache import PlaylistContents
 
 
 @pytest.mark.asyncio
 async def test_add_and_get_blacklist_track(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
 
-    with patch("playlist_generator.services.blacklist.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value={
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={
             "name": "Bad Song", "artists": [{"name": "Bad Artist"}]
         })
         track = await blacklist.add_track(
@@ -30,8 +31,8 @@ async def test_add_and_get_blacklist_track(db_session: AsyncSession, sample_user
 async def test_add_blacklist_track_duplicate(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
 
-    with patch("playlist_generator.services.blacklist.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value={
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={
             "name": "Song", "artists": []
         })
         first = await blacklist.add_track(
@@ -49,8 +50,8 @@ async def test_add_blacklist_track_duplicate(db_session: AsyncSession, sample_us
 async def test_delete_blacklist_track(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
 
-    with patch("playlist_generator.services.blacklist.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value={
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={
             "name": "Song", "artists": []
         })
         track = await blacklist.add_track(
@@ -69,8 +70,8 @@ async def test_delete_blacklist_track(db_session: AsyncSession, sample_user: Use
 async def test_add_and_get_blacklist_playlist(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
 
-    with patch("playlist_generator.services.blacklist.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value={"name": "Bad Vibes"})
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={"name": "Bad Vibes"})
         playlist = await blacklist.add_playlist(
             sample_user.id, "blocked_pl", mock_spotify, db_session
         )
@@ -86,8 +87,8 @@ async def test_add_and_get_blacklist_playlist(db_session: AsyncSession, sample_u
 async def test_delete_blacklist_playlist(db_session: AsyncSession, sample_user: User):
     mock_spotify = MagicMock()
 
-    with patch("playlist_generator.services.blacklist.asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock(return_value={"name": "Playlist"})
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={"name": "Playlist"})
         playlist = await blacklist.add_playlist(
             sample_user.id, "pl_delete", mock_spotify, db_session
         )
@@ -98,3 +99,50 @@ async def test_delete_blacklist_playlist(db_session: AsyncSession, sample_user:
 
     playlists = await blacklist.get_playlists(sample_user.id, db_session)
     assert len(playlists) == 0
+
+
+@pytest.mark.asyncio
+async def test_compiled_blacklist_follows_track_edits(db_session: AsyncSession, sample_user: User):
+    mock_spotify = MagicMock()
+
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={"name": "Song", "artists": []})
+        first = await blacklist.add_track(sample_user.id, "bad_1", mock_spotify, db_session)
+        await blacklist.add_track(sample_user.id, "bad_2", mock_spotify, db_session)
+
+    compiled = await blacklist.load_compiled(sample_user.id, db_session)
+    assert compiled.blocked_ids() == {"bad_1", "bad_2"}
+
+    assert first is not None
+    await blacklist.delete_track(sample_user.id, first.id, db_session)
+    compiled = await blacklist.load_compiled(sample_user.id, db_session)
+    assert compiled.blocked_ids() == {"bad_2"}
+
+
+@pytest.mark.asyncio
+async def test_compiled_blacklist_follows_playlist_edits(db_session: AsyncSession, sample_user: User):
+    mock_spotify = MagicMock()
+
+    with patch("playlist_generator.services.spotify_api.executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={"name": "Playlist"})
+        playlist = await blacklist.add_playlist(
+            sample_user.id, "bad_pl", mock_spotify, db_session
+        )
+
+    # New playlists are compiled lazily: no snapshot until generation fetches them
+    compiled = await blacklist.load_compiled(sample_user.id, db_session)
+    assert set(compiled.playlists) == {"bad_pl"}
+    assert compiled.playlists["bad_pl"].snapshot_id is None
+
+    await blacklist.save_playlist_sources(sample_user.id, [
+        PlaylistContents("bad_pl", "snap_1", [{"id": "x"}, {"id": "y"}]),
+    ], db_session)
+    compiled = await blacklist.load_compiled(sample_user.id, db_session)
+    assert compiled.playlists["bad_pl"].snapshot_id == "snap_1"
+    assert compiled.blocked_ids() == {"x", "y"}
+
+    assert playlist is not None
+    await blacklist.delete_playlist(sample_user.id, playlist.id, db_session)
+    compiled = await blacklist.load_compiled(sample_user.id, db_session)
+    assert compiled.playlists == {}
+    assert compiled.blocked_ids() == set()
@@ -0,0 +1,170 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from playlist_generator.config import settings
+from playlist_generator.models.base_list import BaseTrack, BasePlaylist
+from playlist_generator.models.candidate_pool import CandidatePoolState
+from playlist_generator.models.user import User
+from playlist_generator.services import base_list as base_list_service
+from playlist_generator.services import blacklist as blacklist_service
+from playlist_generator.services import candidate_pool, spotify_api
+from playlist_generator.services import generation as gen
+from playlist_generator.services import pool_refresher
+from playlist_generator.services.track_pool import TrackInfo, TrackPool
+
+
+async def _add_base_tracks(db: AsyncSession, user_id: str, count: int) -> None:
+    for i in range(count):
+        db.add(BaseTrack(
+            user_id=user_id,
+            spotify_track_id=f"track_{i}",
+            track_name=f"Track {i}",
+            artist_name="Artist",
+            duration_ms=200_000,
+        ))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_round_trip(db_session: AsyncSession, sample_user: User):
+    pool = TrackPool.from_tracks([
+        TrackInfo("b", "Bee", "Artist B", 1000),
+        TrackInfo("a", "Ay", "Artist A", 2000),
+    ])
+    await candidate_pool.save(sample_user.id, pool, time.time(), db_session)
+
+    assert await candidate_pool.load(sample_user.id, db_session) == pool
+    assert await candidate_pool.load("someone-else", db_session) is None
+
+
+@pytest.mark.asyncio
+async def test_pool_is_outdated_by_edits_and_age(db_session: AsyncSession, sample_user: User):
+    built_at = time.time()
+    await candidate_pool.save(sample_user.id, TrackPool(), built_at, db_session)
+    assert await candidate_pool.load(sample_user.id, db_session) is not None
+
+    too_late = built_at + settings.CANDIDATE_POOL_MAX_AGE_SECONDS + 1
+    assert await candidate_pool.load(sample_user.id, db_session, now=too_late) is None
+
+    await blacklist_service.delete_track(sample_user.id, "missing", db_session)  # no edit
+    assert await candidate_pool.load(sample_user.id, db_session) is not None
+
+    mock_spotify = MagicMock()
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={"name": "Blocked"})
+        await blacklist_service.add_track(sample_user.id, "t9", mock_spotify, db_session)
+    assert await candidate_pool.load(sample_user.id, db_session) is None
+
+
+@pytest.mark.asyncio
+async def test_preview_reads_the_stored_pool_without_spotify_calls(
+    db_session: AsyncSession, sample_user: User
+):
+    await _add_base_tracks(db_session, sample_user.id, 3)
+    db_session.add(BasePlaylist(user_id=sample_user.id, spotify_playlist_id="pl"))
+    await db_session.commit()
+    mock_spotify = MagicMock()
+    calls = 0
+
+    async def mock_run(fn, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": "snap_1", "tracks": {"total": 1}}
+        return {
+            "items": [{"track": {"id": "p1", "name": "P", "artists": [], "duration_ms": 1000}}],
+            "next": None,
+            "total": 1,
+        }
+
+    progress = AsyncMock()
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        first = await gen.preview(sample_user.id, mock_spotify, db_session)
+        first_calls = calls
+        second = await gen.preview(sample_user.id, mock_spotify, db_session, progress=progress)
+
+    assert first_calls > 0
+    assert calls == first_calls
+    assert {t.spotify_id for t in second.tracks} == {t.spotify_id for t in first.tracks}
+    assert len(second.tracks) == 4
+    assert [c.args[0] for c in progress.await_args_list] == ["pool_loaded"]
+
+
+@pytest.mark.asyncio
+async def test_pool_missing_a_failed_playlist_is_not_stored(
+    db_session: AsyncSession, sample_user: User
+):
+    await _add_base_tracks(db_session, sample_user.id, 3)
+    db_session.add(BasePlaylist(user_id=sample_user.id, spotify_playlist_id="pl"))
+    await db_session.commit()
+    mock_spotify = MagicMock()
+    spotify_down = True
+
+    async def mock_run(fn, *args, **kwargs):
+        if spotify_down:
+            raise RuntimeError("spotify down")
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": "snap_1", "tracks": {"total": 1}}
+        return {
+            "items": [{"track": {"id": "p1", "name": "P", "artists": [], "duration_ms": 1000}}],
+            "next": None,
+            "total": 1,
+        }
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        first = await gen.preview(sample_user.id, mock_spotify, db_session)
+        assert await candidate_pool.load(sample_user.id, db_session) is None
+
+        spotify_down = False
+        second = await gen.preview(sample_user.id, mock_spotify, db_session)
+
+    assert "p1" not in {t.spotify_id for t in first.tracks}
+    assert "p1" in {t.spotify_id for t in second.tracks}
+    assert len(await candidate_pool.load(sample_user.id, db_session)) == 4
+
+
+@pytest.mark.asyncio
+async def test_base_list_edit_rebuilds_pool_on_next_preview(
+    db_session: AsyncSession, sample_user: User
+):
+    await _add_base_tracks(db_session, sample_user.id, 3)
+    mock_spotify = MagicMock()
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock(return_value={"name": "New", "duration_ms": 1000})
+        await gen.preview(sample_user.id, mock_spotify, db_session)
+        await base_list_service.add_track(sample_user.id, "fresh", mock_spotify, db_session)
+        result = await gen.preview(sample_user.id, mock_spotify, db_session)
+
+    assert "fresh" in {t.spotify_id for t in result.tracks}
+
+
+@pytest.mark.asyncio
+async def test_refresher_rebuilds_changed_pools_of_active_users(
+    db_session: AsyncSession, sample_user: User
+):
+    await _add_base_tracks(db_session, sample_user.id, 2)
+    await candidate_pool.save(sample_user.id, TrackPool(), time.time(), db_session)
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    refresher = pool_refresher.PoolRefresher(session_factory=factory)
+
+    with patch.object(pool_refresher, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        assert await refresher.tick() == []  # fresh
+
+        await candidate_pool.mark_changed(sample_user.id, db_session)
+        await db_session.commit()
+        assert await refresher.tick() == [sample_user.id]
+
+    assert len(await candidate_pool.load(sample_user.id, db_session)) == 2
+
+    # Idle users' pools are left to expire
+    state = await db_session.get(CandidatePoolState, sample_user.id)
+    state.used_at = time.time() - settings.CANDIDATE_POOL_IDLE_SECONDS - 1
+    state.changed_at = time.time()
+    await db_session.commit()
+    assert await candidate_pool.due_for_refresh(db_session) == []
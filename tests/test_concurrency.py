@@ -0,0 +1,148 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from playlist_generator.concurrency import SingleFlight, gather_bounded, iter_completed
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_preserves_order():
+    async def work(i: int) -> int:
+        await asyncio.sleep(0.01 * (5 - i))
+        return i
+
+    result = await gather_bounded((work(i) for i in range(5)), limit=2)
+    assert result == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def work() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await gather_bounded((work() for _ in range(10)), limit=3)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_return_exceptions():
+    async def ok() -> str:
+        return "ok"
+
+    async def fail() -> str:
+        raise ValueError("boom")
+
+    result = await gather_bounded([ok(), fail(), ok()], limit=2, return_exceptions=True)
+    assert result[0] == "ok"
+    assert isinstance(result[1], ValueError)
+    assert result[2] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_empty():
+    assert await gather_bounded([], limit=4) == []
+
+
+@pytest.mark.asyncio
+async def test_iter_completed_yields_in_completion_order():
+    async def work(i: int) -> int:
+        await asyncio.sleep(0.01 * (3 - i))
+        return i
+
+    results = [r async for r in iter_completed([lambda i=i: work(i) for i in range(3)])]
+    assert results == [2, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_iter_completed_stops_starting_work_after_break():
+    started: list[int] = []
+
+    async def work(i: int) -> int:
+        started.append(i)
+        await asyncio.sleep(0.01)
+        return i
+
+    async with aclosing(iter_completed([lambda i=i: work(i) for i in range(10)], limit=2)) as results:
+        async for result in results:
+            break
+
+    assert started == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_iter_completed_yields_exceptions():
+    async def fail() -> int:
+        raise ValueError("boom")
+
+    async def ok() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    results = [r async for r in iter_completed([fail, ok], limit=1)]
+    assert isinstance(results[0], ValueError)
+    assert results[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    flights = SingleFlight()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert flights.coalesced == 4
+    assert flights.in_flight() == 0
+
+    # Nothing is cached once the call has finished
+    await flights.do("key", fetch)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions_and_keeps_keys_apart():
+    flights = SingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def ok() -> str:
+        return "ok"
+
+    results = await asyncio.gather(
+        flights.do("a", fail), flights.do("a", fail), flights.do("b", ok),
+        return_exceptions=True,
+    )
+    assert [type(r) for r in results[:2]] == [ValueError, ValueError]
+    assert results[2] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waiter_cancel_does_not_cancel_others():
+    flights = SingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("key", fetch))
+    second = asyncio.ensure_future(flights.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
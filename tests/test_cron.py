@@ -0,0 +1,54 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from playlist_generator import cron
+
+UTC = ZoneInfo("UTC")
+
+
+def test_daily_schedule_next_slot():
+    c = cron.parse("0 6 * * *")
+    assert c.next_after(datetime(2026, 3, 1, 5, 59, tzinfo=UTC)) == datetime(2026, 3, 1, 6, 0, tzinfo=UTC)
+    # Strictly after: the current slot rolls to tomorrow
+    assert c.next_after(datetime(2026, 3, 1, 6, 0, tzinfo=UTC)) == datetime(2026, 3, 2, 6, 0, tzinfo=UTC)
+
+
+def test_steps_ranges_and_lists():
+    c = cron.parse("*/15 9-17 * * 1-5")
+    assert c.minutes == (0, 15, 30, 45)
+    assert c.hours == tuple(range(9, 18))
+    # Saturday 2026-03-07 -> Monday 09:00
+    assert c.next_after(datetime(2026, 3, 7, 12, 0, tzinfo=UTC)) == datetime(2026, 3, 9, 9, 0, tzinfo=UTC)
+    assert cron.parse("0 0 1,15 * *").days == frozenset({1, 15})
+
+
+def test_day_of_month_or_weekday_when_both_restricted():
+    c = cron.parse("0 0 13 * 5")  # the 13th, or any Friday
+    after = datetime(2026, 3, 1, tzinfo=UTC)  # Sunday
+    assert c.next_after(after) == datetime(2026, 3, 6, tzinfo=UTC)  # Friday before the 13th
+
+
+def test_shortcuts_and_sunday_as_seven():
+    assert cron.parse("@daily") == cron.parse("0 0 * * *")
+    assert cron.parse("0 0 * * 7").weekdays == frozenset({0})
+
+
+def test_respects_timezone():
+    amsterdam = ZoneInfo("Europe/Amsterdam")
+    c = cron.parse("0 6 * * *")
+    nxt = c.next_after(datetime(2026, 7, 1, 7, 0, tzinfo=amsterdam))
+    assert nxt == datetime(2026, 7, 2, 6, 0, tzinfo=amsterdam)
+    assert nxt.astimezone(UTC).hour == 4
+
+
+@pytest.mark.parametrize("expression", ["", "* * * *", "60 * * * *", "a * * * *", "*/0 * * * *", "5-1 * * * *"])
+def test_invalid_expressions(expression):
+    with pytest.raises(cron.CronError):
+        cron.parse(expression)
+
+
+def test_impossible_date_raises():
+    with pytest.raises(cron.CronError):
+        cron.parse("0 0 31 2 *").next_after(datetime(2026, 1, 1, tzinfo=UTC))
@@ -0,0 +1,65 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from playlist_generator.executors import BoundedExecutor
+
+_var: contextvars.ContextVar[str] = contextvars.ContextVar("_var", default="unset")
+
+
+@pytest.fixture
+def pool():
+    executor = BoundedExecutor("test", max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_in_a_named_thread(pool: BoundedExecutor):
+    name = await pool.run(lambda: threading.current_thread().name)
+    assert name.startswith("test")
+    assert await pool.run(sum, [1, 2, 3]) == 6
+
+
+@pytest.mark.asyncio
+async def test_run_carries_context_variables(pool: BoundedExecutor):
+    _var.set("caller")
+    assert await pool.run(_var.get) == "caller"
+
+
+@pytest.mark.asyncio
+async def test_work_beyond_max_workers_is_queued(pool: BoundedExecutor):
+    release = threading.Event()
+    first = asyncio.ensure_future(pool.run(release.wait))
+    second = asyncio.ensure_future(pool.run(lambda: "second"))
+    await asyncio.sleep(0.05)
+
+    metrics = pool.metrics()
+    assert metrics["running"] == 1
+    assert metrics["queued"] == 1
+
+    release.set()
+    assert await second == "second"
+    await first
+    metrics = pool.metrics()
+    assert (metrics["running"], metrics["queued"], metrics["completed"]) == (0, 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_work_leaves_the_queue(pool: BoundedExecutor):
+    release = threading.Event()
+    ran = []
+    first = asyncio.ensure_future(pool.run(release.wait))
+    second = asyncio.ensure_future(pool.run(ran.append, "second"))
+    await asyncio.sleep(0.05)
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert pool.metrics()["queued"] == 0
+
+    release.set()
+    await first
+    assert ran == []
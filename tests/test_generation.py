@@ -1,53 +1,93 @@
+import asyncio
+import math
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import spotipy
+from spotipy.exceptions import SpotifyException
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from playlist_generator.models.base_list import BaseTrack, BasePlaylist
 from playlist_generator.models.blacklist import BlacklistTrack, BlacklistPlaylist
+from playlist_generator.models.history import GenerationHistory, GenerationHistoryTrack
 from playlist_generator.models.user import User
 from playlist_generator.services import generation as gen
-from playlist_generator.services.generation import TrackInfo, _apply_limits
+from playlist_generator.services import playlist_cache, spotify_api
+from playlist_generator.services.generation import TrackInfo
+from playlist_generator.services.track_pool import TrackPool
+from playlist_generator.services.playlist_cache import PlaylistContents
 
 
-# ── Unit tests for _apply_limits ─────────────────────
+# ── Unit tests for the limits applied by _select_tracks ──
 
-def test_apply_limits_no_limits():
-    tracks = [TrackInfo(f"t{i}", f"Track {i}", "Artist", 180_000) for i in range(10)]
-    result = _apply_limits(tracks, None, None)
+async def _no_discovery(count: int) -> TrackPool:
+    return TrackPool()
+
+
+async def _limit(tracks: TrackPool, max_tracks: int | None, max_minutes: int | None) -> TrackPool:
+    return await gen._select_tracks(
+        tracks, 0, _no_discovery, max_tracks, max_minutes * 60_000 if max_minutes else None
+    )
+
+
+@pytest.mark.asyncio
+async def test_limits_no_limits():
+    tracks = TrackPool.from_tracks(TrackInfo(f"t{i}", f"Track {i}", "Artist", 180_000) for i in range(10))
+    result = await _limit(tracks, None, None)
     assert len(result) == 10
 
 
-def test_apply_limits_max_tracks():
-    tracks = [TrackInfo(f"t{i}", f"Track {i}", "Artist", 180_000) for i in range(10)]
-    result = _apply_limits(tracks, 5, None)
+@pytest.mark.asyncio
+async def test_limits_max_tracks():
+    tracks = TrackPool.from_tracks(TrackInfo(f"t{i}", f"Track {i}", "Artist", 180_000) for i in range(10))
+    result = await _limit(tracks, 5, None)
     assert len(result) == 5
 
 
-def test_apply_limits_max_minutes():
-    tracks = [TrackInfo(f"t{i}", f"Track {i}", "Artist", 180_000) for i in range(10)]
+@pytest.mark.asyncio
+async def test_limits_max_minutes():
+    tracks = TrackPool.from_tracks(TrackInfo(f"t{i}", f"Track {i}", "Artist", 180_000) for i in range(10))
     # 3 minutes each, max 10 minutes = 3 tracks (9 min), 4th would exceed
-    result = _apply_limits(tracks, None, 10)
+    result = await _limit(tracks, None, 10)
     assert len(result) == 3
 
 
-def test_apply_limits_both_limits_tracks_first():
-    tracks = [TrackInfo(f"t{i}", f"Track {i}", "Artist", 60_000) for i in range(100)]
+@pytest.mark.asyncio
+async def test_limits_both_limits_tracks_first():
+    tracks = TrackPool.from_tracks(TrackInfo(f"t{i}", f"Track {i}", "Artist", 60_000) for i in range(100))
     # max 5 tracks (5 min) or 60 min — tracks limit hit first
-    result = _apply_limits(tracks, 5, 60)
+    result = await _limit(tracks, 5, 60)
     assert len(result) == 5
 
 
-def test_apply_limits_both_limits_minutes_first():
-    tracks = [TrackInfo(f"t{i}", f"Track {i}", "Artist", 300_000) for i in range(100)]
+@pytest.mark.asyncio
+async def test_limits_both_limits_minutes_first():
+    tracks = TrackPool.from_tracks(TrackInfo(f"t{i}", f"Track {i}", "Artist", 300_000) for i in range(100))
     # 5 min each, max 100 tracks or 12 min — minutes limit hit first (2 tracks = 10 min)
-    result = _apply_limits(tracks, 100, 12)
+    result = await _limit(tracks, 100, 12)
     assert len(result) == 2
 
 
-def test_apply_limits_empty():
-    result = _apply_limits([], 10, 60)
-    assert result == []
+@pytest.mark.asyncio
+async def test_limits_empty():
+    result = await _limit(TrackPool(), 10, 60)
+    assert len(result) == 0
+
+
+async def _collect(user_id: str, spotify, db: AsyncSession) -> TrackPool:
+    """Base collection as the pipeline runs it: load, gather, then store."""
+    sources = await gen._load_sources(user_id, db)
+    pool = await gen._gather_base_pool(sources, spotify)
+    await gen._store_sources(sources, db)
+    return pool
+
+
+async def _blacklist(user_id: str, spotify, db: AsyncSession) -> set[str]:
+    sources = await gen._load_sources(user_id, db)
+    blocked = await gen._gather_blacklist(sources, spotify)
+    await gen._store_sources(sources, db)
+    return blocked
 
 
 # ── Integration tests for the generation pipeline ────
@@ -68,8 +108,8 @@ async def test_preview_basic(db_session: AsyncSession, sample_user: User):
 
     mock_spotify = MagicMock()
 
-    with patch.object(gen, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock()
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock()
 
         result = await gen.preview(
             user_id=sample_user.id,
@@ -103,8 +143,8 @@ async def test_preview_filters_blacklisted(db_session: AsyncSession, sample_user
 
     mock_spotify = MagicMock()
 
-    with patch.object(gen, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock()
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock()
 
         result = await gen.preview(
             user_id=sample_user.id,
@@ -130,8 +170,8 @@ async def test_preview_with_max_tracks(db_session: AsyncSession, sample_user: Us
 
     mock_spotify = MagicMock()
 
-    with patch.object(gen, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock()
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock()
 
         result = await gen.preview(
             user_id=sample_user.id,
@@ -165,7 +205,7 @@ async def test_preview_with_discovery(db_session: AsyncSession, sample_user: Use
 
     call_count = 0
 
-    async def mock_to_thread(fn, *args, **kwargs):
+    async def mock_run(fn, *args, **kwargs):
         nonlocal call_count
         call_count += 1
         if fn == mock_spotify.recommendations:
@@ -173,8 +213,8 @@ async def test_preview_with_discovery(db_session: AsyncSession, sample_user: Use
         # For _fetch_playlist_tracks calls — not applicable here
         return {"items": [], "next": None}
 
-    with patch.object(gen, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = mock_to_thread
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
 
         result = await gen.preview(
             user_id=sample_user.id,
@@ -209,7 +249,7 @@ async def test_preview_deduplicates(db_session: AsyncSession, sample_user: User)
 
     mock_spotify = MagicMock()
 
-    async def mock_to_thread(fn, *args, **kwargs):
+    async def mock_run(fn, *args, **kwargs):
         # Return playlist_tracks response with the same track
         return {
             "items": [
@@ -219,8 +259,8 @@ async def test_preview_deduplicates(db_session: AsyncSession, sample_user: User)
             "next": None,
         }
 
-    with patch.object(gen, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = mock_to_thread
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
 
         result = await gen.preview(
             user_id=sample_user.id,
@@ -240,8 +280,8 @@ async def test_preview_empty_base_list(db_session: AsyncSession, sample_user: Us
     """Empty base list should produce empty result."""
     mock_spotify = MagicMock()
 
-    with patch.object(gen, "asyncio") as mock_asyncio:
-        mock_asyncio.to_thread = AsyncMock()
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = AsyncMock()
         result = await gen.preview(
             user_id=sample_user.id,
             spotify=mock_spotify,
@@ -250,3 +290,716 @@ async def test_preview_empty_base_list(db_session: AsyncSession, sample_user: Us
 
     assert len(result.tracks) == 0
     assert result.total_duration_ms == 0
+
+
+@pytest.mark.asyncio
+async def test_gather_base_pool_concurrent_keeps_source_order(
+    db_session: AsyncSession, sample_user: User
+):
+    """Playlists are fetched concurrently but dedup still favours the first source."""
+    for i in range(3):
+        db_session.add(BasePlaylist(
+            user_id=sample_user.id,
+            spotify_playlist_id=f"pl_{i}",
+            added_at=1000.0 + i,
+        ))
+    await db_session.commit()
+
+    async def fake_fetch(playlist_id, spotify, cached=None):
+        # Later playlists finish first
+        idx = int(playlist_id.split("_")[1])
+        await asyncio.sleep(0.01 * (3 - idx))
+        return PlaylistContents(playlist_id, None, [
+            {"id": "shared", "name": f"Shared from {playlist_id}", "artists": [], "duration_ms": 1000},
+            {"id": f"own_{idx}", "name": f"Own {idx}", "artists": [], "duration_ms": 1000},
+        ])
+
+    with patch.object(gen, "_fetch_playlist_contents", fake_fetch):
+        pool = await _collect(sample_user.id, MagicMock(), db_session)
+
+    assert [t.spotify_id for t in pool] == ["shared", "own_0", "own_1", "own_2"]
+    assert pool[0].name == "Shared from pl_0"
+
+
+@pytest.mark.asyncio
+async def test_gather_base_pool_skips_failed_playlist(
+    db_session: AsyncSession, sample_user: User
+):
+    for i in range(2):
+        db_session.add(BasePlaylist(
+            user_id=sample_user.id,
+            spotify_playlist_id=f"pl_{i}",
+            added_at=1000.0 + i,
+        ))
+    await db_session.commit()
+
+    async def fake_fetch(playlist_id, spotify, cached=None):
+        if playlist_id == "pl_0":
+            raise RuntimeError("spotify down")
+        return PlaylistContents(playlist_id, None, [
+            {"id": "ok_track", "name": "Ok", "artists": [], "duration_ms": 1000},
+        ])
+
+    with patch.object(gen, "_fetch_playlist_contents", fake_fetch):
+        pool = await _collect(sample_user.id, MagicMock(), db_session)
+
+    assert [t.spotify_id for t in pool] == ["ok_track"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_playlist_tracks_parallel_offsets():
+    """With a known total, remaining pages are fetched by offset and reassembled in order."""
+    mock_spotify = MagicMock()
+    total = 250
+    requested_offsets: list[int] = []
+
+    async def mock_run(fn, *args, offset=0, limit=100, **kwargs):
+        assert fn == mock_spotify.playlist_tracks
+        requested_offsets.append(offset)
+        # Later pages return first to make sure order does not depend on timing
+        await asyncio.sleep(0.001 * (total - offset) / 100)
+        end = min(offset + limit, total)
+        return {
+            "items": [{"track": {"id": f"t{i}"}} for i in range(offset, end)],
+            "next": "more" if end < total else None,
+            "total": total,
+        }
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        tracks = await gen._fetch_playlist_tracks("big_pl", mock_spotify)
+
+    assert [t["id"] for t in tracks] == [f"t{i}" for i in range(total)]
+    assert sorted(requested_offsets) == [0, 100, 200]
+    mock_spotify.next.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_playlist_fetches_share_one_request():
+    """Two previews of the same source playlist page through it only once."""
+    mock_spotify = MagicMock()
+    page_calls = 0
+
+    async def mock_run(fn, *args, **kwargs):
+        nonlocal page_calls
+        await asyncio.sleep(0.01)
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": "snap", "tracks": {"total": 1}}
+        page_calls += 1
+        return {"items": [{"track": {"id": "a"}}], "next": None}
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        first, second = await asyncio.gather(
+            gen._fetch_playlist_contents("shared_pl", mock_spotify),
+            gen._fetch_playlist_contents("shared_pl", mock_spotify),
+        )
+
+    assert page_calls == 1
+    assert first.tracks == second.tracks == [{"id": "a"}]
+
+
+@pytest.mark.asyncio
+async def test_playlist_fetches_are_not_shared_with_users_who_cannot_read_it():
+    """Another user's concurrent fetch of a private playlist gets its own 404."""
+    # Real clients: their methods share a name, as in production
+    owner, other = spotipy.Spotify(auth="owner"), spotipy.Spotify(auth="other")
+    playlist_calls = 0
+
+    async def mock_run(fn, *args, **kwargs):
+        nonlocal playlist_calls
+        await asyncio.sleep(0.01)
+        if fn == other.playlist:
+            raise SpotifyException(404, -1, "Not found")
+        if fn == owner.playlist:
+            playlist_calls += 1
+            return {"snapshot_id": "snap", "tracks": {"total": 1}}
+        return {"items": [{"track": {"id": "a"}}], "next": None}
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        mine, theirs = await asyncio.gather(
+            gen._fetch_playlist_contents("private_pl", owner),
+            gen._fetch_playlist_contents("private_pl", other),
+            return_exceptions=True,
+        )
+        # The owner's snapshot is now in the shared cache; still not for them
+        with pytest.raises(SpotifyException):
+            await gen._fetch_playlist_contents("private_pl", other)
+
+    assert mine.tracks == [{"id": "a"}]
+    assert isinstance(theirs, SpotifyException) and theirs.http_status == 404
+    assert playlist_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_playlist_contents_reads_shared_cache():
+    """A snapshot loaded for another user is served without paging through it."""
+    mock_spotify = MagicMock()
+    playlist_cache.shared.put(PlaylistContents("public_pl", "snap", [{"id": "a"}]))
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": "snap", "tracks": {"total": 1}}
+        raise AssertionError("pages should not be fetched")
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        contents = await gen._fetch_playlist_contents("public_pl", mock_spotify)
+
+    assert contents.tracks == [{"id": "a"}]
+    assert contents.from_cache
+
+
+@pytest.mark.asyncio
+async def test_fetch_playlist_tracks_follows_next_without_total():
+    mock_spotify = MagicMock()
+    pages = [
+        {"items": [{"track": {"id": "a"}}, {"track": None}], "next": "page2"},
+        {"items": [{"track": {"id": "b"}}], "next": None},
+    ]
+
+    async def mock_run(fn, *args, **kwargs):
+        return pages.pop(0)
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        tracks = await gen._fetch_playlist_tracks("small_pl", mock_spotify)
+
+    assert [t["id"] for t in tracks] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_gather_base_pool_uses_snapshot_cache(db_session: AsyncSession, sample_user: User):
+    """An unchanged snapshot is served from the DB without paging through Spotify."""
+    db_session.add(BasePlaylist(user_id=sample_user.id, spotify_playlist_id="pl"))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    snapshot = {"id": "snap_1"}
+    page_calls = 0
+
+    async def mock_run(fn, *args, **kwargs):
+        nonlocal page_calls
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": snapshot["id"], "tracks": {"total": 2}}
+        page_calls += 1
+        return {
+            "items": [
+                {"track": {"id": "a", "name": "A", "artists": [{"name": "X"}], "duration_ms": 1000}},
+                {"track": {"id": "b", "name": "B", "artists": [], "duration_ms": 2000}},
+            ],
+            "next": None,
+            "total": 2,
+        }
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        first = await _collect(sample_user.id, mock_spotify, db_session)
+        second = await _collect(sample_user.id, mock_spotify, db_session)
+        snapshot["id"] = "snap_2"
+        third = await _collect(sample_user.id, mock_spotify, db_session)
+
+    assert page_calls == 2  # first and third; second hit the cache
+    assert first == second == third
+    assert second[0] == TrackInfo("a", "A", "X", 1000)
+    assert second[1] == TrackInfo("b", "B", "", 2000)
+
+    cached = await playlist_cache.load(["pl"], db_session)
+    assert cached["pl"].snapshot_id == "snap_2"
+
+
+@pytest.mark.asyncio
+async def test_preview_runs_collect_and_blacklist_concurrently(
+    db_session: AsyncSession, sample_user: User
+):
+    """Base and blacklist playlists are in flight at the same time."""
+    db_session.add(BasePlaylist(user_id=sample_user.id, spotify_playlist_id="base_pl"))
+    db_session.add(BlacklistPlaylist(user_id=sample_user.id, spotify_playlist_id="black_pl"))
+    await db_session.commit()
+
+    in_flight: set[str] = set()
+    overlapped = False
+
+    async def fake_fetch(playlist_id, spotify, cached=None, ids_only=False):
+        nonlocal overlapped
+        in_flight.add(playlist_id)
+        await asyncio.sleep(0.01)
+        overlapped = overlapped or in_flight == {"base_pl", "black_pl"}
+        in_flight.discard(playlist_id)
+        return PlaylistContents(playlist_id, None, [
+            {"id": "shared", "name": "Shared", "artists": [], "duration_ms": 1000},
+            {"id": f"only_{playlist_id}", "name": "Own", "artists": [], "duration_ms": 1000},
+        ])
+
+    with patch.object(gen, "_fetch_playlist_contents", fake_fetch):
+        result = await gen.preview(sample_user.id, MagicMock(), db_session)
+
+    assert overlapped
+    assert [t.spotify_id for t in result.tracks] == ["only_base_pl"]
+
+
+@pytest.mark.asyncio
+async def test_blacklist_playlist_only_refetched_when_snapshot_changes(
+    db_session: AsyncSession, sample_user: User
+):
+    """The compiled blacklist is reused until a recheck finds a new snapshot."""
+    db_session.add(BlacklistPlaylist(user_id=sample_user.id, spotify_playlist_id="black_pl"))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    snapshot = {"id": "snap_1"}
+    contents = {"ids": ["x", "y"]}
+    calls: list[str] = []
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            calls.append("meta")
+            return {"snapshot_id": snapshot["id"], "tracks": {"total": len(contents["ids"])}}
+        calls.append("page")
+        return {"items": [{"track": {"id": i}} for i in contents["ids"]], "next": None}
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        first = await _blacklist(sample_user.id, mock_spotify, db_session)
+        assert calls == ["meta", "page"]
+
+        # Within the recheck window: one DB query, no Spotify calls
+        second = await _blacklist(sample_user.id, mock_spotify, db_session)
+        assert calls == ["meta", "page"]
+
+        # Recheck due, snapshot unchanged: metadata only
+        with patch.object(gen.settings, "BLACKLIST_SNAPSHOT_TTL_SECONDS", 0):
+            third = await _blacklist(sample_user.id, mock_spotify, db_session)
+            assert calls == ["meta", "page", "meta"]
+
+            snapshot["id"] = "snap_2"
+            contents["ids"] = ["y", "z"]
+            fourth = await _blacklist(sample_user.id, mock_spotify, db_session)
+            assert calls == ["meta", "page", "meta", "meta", "page"]
+
+    assert first == second == third == {"x", "y"}
+    assert fourth == {"y", "z"}
+
+
+@pytest.mark.asyncio
+async def test_blacklist_keeps_ids_of_a_newer_snapshot_from_the_shared_cache(
+    db_session: AsyncSession, sample_user: User
+):
+    """A recheck served from another user's cached snapshot updates the stored IDs too."""
+    db_session.add(BlacklistPlaylist(user_id=sample_user.id, spotify_playlist_id="black_pl"))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    snapshot = {"id": "snap_1"}
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": snapshot["id"], "tracks": {"total": 2}}
+        return {"items": [{"track": {"id": "x"}}, {"track": {"id": "y"}}], "next": None}
+
+    with (
+        patch.object(spotify_api, "executors") as mock_executors,
+        patch.object(gen.settings, "BLACKLIST_SNAPSHOT_TTL_SECONDS", 0),
+    ):
+        mock_executors.spotify.run = mock_run
+        first = await _blacklist(sample_user.id, mock_spotify, db_session)
+
+        snapshot["id"] = "snap_2"
+        playlist_cache.shared.put(PlaylistContents("black_pl", "snap_2", [{"id": "x"}, {"id": "z"}]))
+        second = await _blacklist(sample_user.id, mock_spotify, db_session)
+        third = await _blacklist(sample_user.id, mock_spotify, db_session)
+
+    assert first == {"x", "y"}
+    assert second == third == {"x", "z"}
+
+
+@pytest.mark.asyncio
+async def test_blacklist_playlists_are_fetched_ids_only(
+    db_session: AsyncSession, sample_user: User
+):
+    """Blacklist pages ask for track IDs at the maximum page size, base pages for full tracks."""
+    db_session.add(BasePlaylist(user_id=sample_user.id, spotify_playlist_id="shared_pl"))
+    db_session.add(BlacklistPlaylist(user_id=sample_user.id, spotify_playlist_id="shared_pl"))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    page_requests: list[tuple[str, int]] = []
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": "snap_1", "tracks": {"total": 150}}
+        page_requests.append((kwargs["fields"], kwargs["limit"]))
+        await asyncio.sleep(0)
+        return {"items": [{"track": {"id": f"t{kwargs.get('offset', 0)}"}}], "next": None}
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        blocked = await _blacklist(sample_user.id, mock_spotify, db_session)
+        await _collect(sample_user.id, mock_spotify, db_session)
+
+    assert blocked == {"t0", "t100"}
+    # The lean fetch is not shared with (or cached for) the full one
+    assert sorted(page_requests) == sorted([
+        ("items(track(id)),next,total", 100),
+        ("items(track(id)),next,total", 100),
+        ("items(track(id,uri,name,artists,duration_ms)),next,total", 100),
+        ("items(track(id,uri,name,artists,duration_ms)),next,total", 100),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_execute_writes_without_clearing_and_skips_unchanged(
+    db_session: AsyncSession, sample_user: User
+):
+    """The first chunk replaces the playlist directly; identical output writes nothing."""
+    for i in range(150):
+        db_session.add(BaseTrack(
+            user_id=sample_user.id,
+            spotify_track_id=f"track_{i}",
+            duration_ms=200_000,
+        ))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    writes: list[tuple[str, list[str]]] = []
+    state = {"snapshot": "s0", "uris": []}
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": state["snapshot"], "tracks": {"total": len(state["uris"])}}
+        if fn == mock_spotify.playlist_tracks:
+            return {"items": [], "next": None}
+        if fn == mock_spotify.playlist_replace_items:
+            writes.append(("replace", args[1]))
+            state["uris"] = list(args[1])
+        elif fn == mock_spotify.playlist_add_items:
+            writes.append(("add", args[1]))
+            state["uris"] += args[1]
+        state["snapshot"] = f"s{len(writes)}"
+        return {"snapshot_id": state["snapshot"]}
+
+    with patch.object(spotify_api, "executors") as mock_executors, \
+            patch.object(gen.random, "randrange", lambda start, stop: start):  # no shuffle
+        mock_executors.spotify.run = mock_run
+        first = await gen.execute(sample_user.id, "target_pl", "Target", mock_spotify, db_session)
+        assert [kind for kind, _ in writes] == ["replace", "add"]
+        assert all(uris for _, uris in writes)
+        assert state["uris"] == [f"spotify:track:{t.spotify_id}" for t in first.tracks]
+
+        writes.clear()
+        await gen.execute(sample_user.id, "target_pl", "Target", mock_spotify, db_session)
+        assert writes == []
+
+
+@pytest.mark.asyncio
+async def test_execute_replaces_target_holding_items_it_cannot_diff(
+    db_session: AsyncSession, sample_user: User
+):
+    """Local files have no ID and episodes no track URI; neither may survive a write."""
+    for i in range(150):
+        db_session.add(BaseTrack(
+            user_id=sample_user.id, spotify_track_id=f"track_{i:03d}", duration_ms=200_000,
+        ))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    writes: list[tuple[str, list[str]]] = []
+    generated = [f"spotify:track:track_{i:03d}" for i in range(150)]
+    target = [{"track": {"id": uri.rsplit(":", 1)[1], "uri": uri}} for uri in generated]
+    target.append({"track": {"id": None, "uri": "spotify:local:Artist:Album:Song:180"}})
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            playlist_id = args[0]
+            total = len(target) if playlist_id == "target_pl" else 0
+            return {"snapshot_id": f"snap_{len(writes)}", "tracks": {"total": total}}
+        if fn == mock_spotify.playlist_tracks:
+            items = target if args[0] == "target_pl" else []
+            offset = kwargs.get("offset", 0)
+            return {"items": items[offset:offset + kwargs["limit"]], "next": None}
+        if fn == mock_spotify.playlist_remove_all_occurrences_of_items:
+            writes.append(("remove", args[1]))
+        else:
+            writes.append(("replace" if fn == mock_spotify.playlist_replace_items else "add", args[1]))
+        return {"snapshot_id": f"snap_{len(writes)}"}
+
+    with patch.object(spotify_api, "executors") as mock_executors, \
+            patch.object(gen.random, "randrange", lambda start, stop: start):  # no shuffle
+        mock_executors.spotify.run = mock_run
+        await gen.execute(sample_user.id, "target_pl", "Target", mock_spotify, db_session)
+        assert [kind for kind, _ in writes] == ["replace", "add"]
+        assert writes[0][1] + writes[1][1] == generated
+
+        # An episode is diffed by its own URI and removed
+        writes.clear()
+        playlist_cache.shared.clear()
+        target[-1] = {"track": {"id": "ep1", "uri": "spotify:episode:ep1"}}
+        await gen.execute(sample_user.id, "target_pl", "Target", mock_spotify, db_session)
+        assert writes == [("remove", ["spotify:episode:ep1"])]
+
+
+@pytest.mark.asyncio
+async def test_persist_history_bulk_inserts_tracks(db_session: AsyncSession, sample_user: User):
+    tracks = [
+        TrackInfo(f"t{i}", f"Track {i}", "Artist", 1000, is_discovery=i % 10 == 0)
+        for i in range(1200)
+    ]
+    history = GenerationHistory(
+        user_id=sample_user.id,
+        target_playlist_id="target_pl",
+        track_count=len(tracks),
+    )
+    await gen._persist_history(history, tracks, db_session)
+
+    result = await db_session.execute(
+        select(GenerationHistoryTrack)
+        .where(GenerationHistoryTrack.generation_id == history.id)
+        .order_by(GenerationHistoryTrack.position)
+    )
+    rows = result.scalars().all()
+    assert len(rows) == 1200
+    assert len({r.id for r in rows}) == 1200
+    assert [r.spotify_track_id for r in rows[:3]] == ["t0", "t1", "t2"]
+    assert sum(r.is_discovery for r in rows) == 120
+
+
+@pytest.mark.asyncio
+async def test_execute_reports_progress_per_stage(db_session: AsyncSession, sample_user: User):
+    for i in range(150):
+        db_session.add(BaseTrack(
+            user_id=sample_user.id,
+            spotify_track_id=f"track_{i}",
+            duration_ms=200_000,
+        ))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    events: list[tuple[str, dict]] = []
+
+    async def on_progress(stage: str, data: dict) -> None:
+        events.append((stage, data))
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            raise Exception("not found")  # target contents unknown -> replace plan
+        return {"snapshot_id": "s1"}
+
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        await gen.execute(
+            sample_user.id, "target_pl", "Target", mock_spotify, db_session,
+            progress=on_progress,
+        )
+
+    stages = dict(events[:2])
+    assert stages["playlists_fetched"] == {"playlists": 0, "tracks": 150}
+    assert stages["blacklist_built"] == {"blocked": 0}
+    assert events[2:] == [
+        ("chunk_written", {"chunk": 1, "chunks": 2}),
+        ("chunk_written", {"chunk": 2, "chunks": 2}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_writes_previewed_tracks_without_rerunning(
+    db_session: AsyncSession, sample_user: User
+):
+    previewed = gen.GenerationResult(
+        tracks=[TrackInfo("b", "B", "X", 1000), TrackInfo("a", "A", "X", 2000)],
+        total_duration_ms=3000,
+        discovery_count=0,
+    )
+    mock_spotify = MagicMock()
+    written: list[list[str]] = []
+
+    async def mock_run(fn, *args, **kwargs):
+        if fn == mock_spotify.playlist:
+            raise Exception("not found")
+        if fn == mock_spotify.playlist_replace_items:
+            written.append(args[1])
+        return {"snapshot_id": "s1"}
+
+    with patch.object(spotify_api, "executors") as mock_executors, \
+            patch.object(gen, "preview", AsyncMock()) as mock_preview:
+        mock_executors.spotify.run = mock_run
+        result = await gen.execute(
+            sample_user.id, "target_pl", "Target", mock_spotify, db_session,
+            previewed=previewed,
+        )
+
+    mock_preview.assert_not_awaited()
+    assert written == [["spotify:track:b", "spotify:track:a"]]
+    assert result.history_id is not None
+
+
+@pytest.mark.asyncio
+async def test_get_recommendations_retries_failed_batch_and_stops_early():
+    seed_pool = TrackPool.from_tracks(TrackInfo(f"s{i}", "", "", 1000) for i in range(10))
+    mock_spotify = MagicMock()
+    calls = 0
+
+    async def mock_run(fn, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        batch = calls
+        if batch == 1:
+            raise Exception("rate limited")
+        await asyncio.sleep(0.001 * batch)
+        return {"tracks": [
+            {"id": f"rec_{batch}_{i}", "name": "R", "artists": [], "duration_ms": 1}
+            for i in range(5)
+        ] + [{"id": "s0"}]}  # seed tracks are never recommended back
+
+    with patch.object(spotify_api, "executors") as mock_executors, \
+            patch.object(gen.settings, "RECOMMENDATION_CONCURRENCY", 2):
+        mock_executors.spotify.run = mock_run
+        discovery = await gen._get_recommendations(seed_pool, {"rec_2_0"}, 8, mock_spotify)
+
+    assert len(discovery) == 8
+    assert discovery.discovery_count() == 8
+    assert "rec_2_0" not in discovery and "s0" not in discovery
+    # The failed first batch was retried rather than ending discovery, and
+    # at most the 3 planned batches plus that one retry were requested
+    assert 3 <= calls <= math.ceil(8 / 20) + 2 + 1
+
+
+@pytest.mark.asyncio
+async def test_select_tracks_only_fetches_discovery_that_fits():
+    pool = TrackPool.from_tracks(TrackInfo(f"t{i}", "", "", 1000) for i in range(40_000))
+    requested: list[int] = []
+
+    async def fetch_discovery(count: int) -> TrackPool:
+        requested.append(count)
+        return TrackPool.from_tracks(
+            TrackInfo(f"d{i}", "", "", 1000, is_discovery=True) for i in range(count)
+        )
+
+    selection = await gen._select_tracks(pool, 40_000, fetch_discovery, 100, None)
+
+    assert len(selection) == 100
+    assert len(set(selection.ids)) == 100
+    # About half the draw lands on discovery slots; only those are requested
+    assert requested == [selection.discovery_count()]
+    assert 20 < requested[0] < 80
+
+
+@pytest.mark.asyncio
+async def test_select_tracks_respects_minutes_when_discovery_runs_short():
+    pool = TrackPool.from_tracks(TrackInfo(f"t{i}", "", "", 60_000) for i in range(50))
+
+    async def fetch_discovery(count: int) -> TrackPool:
+        return TrackPool()  # no recommendations available
+
+    selection = await gen._select_tracks(pool, 50, fetch_discovery, None, 10 * 60_000)
+
+    assert len(selection) == 10
+    assert selection.total_duration_ms() == 10 * 60_000
+    assert selection.discovery_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_select_tracks_without_limits_takes_everything():
+    pool = TrackPool.from_tracks(TrackInfo(f"t{i}", "", "", 1000) for i in range(20))
+
+    async def fetch_discovery(count: int) -> TrackPool:
+        return TrackPool.from_tracks(
+            TrackInfo(f"d{i}", "", "", 1000, is_discovery=True) for i in range(count)
+        )
+
+    selection = await gen._select_tracks(pool, 5, fetch_discovery, None, None)
+    assert sorted(selection.ids) == sorted([f"t{i}" for i in range(20)] + [f"d{i}" for i in range(5)])
+
+
+@pytest.mark.asyncio
+async def test_compare_collects_pool_once_for_all_variants(
+    db_session: AsyncSession, sample_user: User
+):
+    for i in range(10):
+        db_session.add(BaseTrack(
+            user_id=sample_user.id,
+            spotify_track_id=f"track_{i}",
+            track_name=f"Track {i}",
+            duration_ms=60_000,
+        ))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    build = AsyncMock(wraps=gen._build_candidate_pool)
+
+    with patch.object(spotify_api, "executors") as mock_executors, \
+            patch.object(gen, "_build_candidate_pool", build):
+        mock_executors.spotify.run = AsyncMock()
+        results = await gen.compare(
+            sample_user.id, mock_spotify, db_session,
+            [
+                {"max_tracks": 3},
+                {"max_minutes": 5},
+                {"max_tracks": None, "max_minutes": None},
+            ],
+        )
+
+    assert build.await_count == 1
+    assert [len(r.tracks) for r in results] == [3, 5, 10]
+    assert results[1].total_duration_ms == 300_000
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_shares_pool_and_writes_targets_concurrently(
+    db_session: AsyncSession, sample_user: User
+):
+    for i in range(10):
+        db_session.add(BaseTrack(
+            user_id=sample_user.id,
+            spotify_track_id=f"track_{i}",
+            duration_ms=60_000,
+        ))
+    await db_session.commit()
+
+    mock_spotify = MagicMock()
+    in_flight: set[str] = set()
+    overlapped = False
+    written: dict[str, list[str]] = {}
+
+    async def mock_run(fn, *args, **kwargs):
+        nonlocal overlapped
+        if fn == mock_spotify.playlist:
+            return {"snapshot_id": None, "tracks": {"total": 0}}
+        if fn == mock_spotify.playlist_tracks:
+            return {"items": [], "next": None}
+        playlist_id = args[0]
+        if playlist_id == "broken_pl":
+            raise RuntimeError("Spotify said no")
+        in_flight.add(playlist_id)
+        await asyncio.sleep(0.01)
+        overlapped = overlapped or len(in_flight) > 1
+        in_flight.discard(playlist_id)
+        written[playlist_id] = list(args[1])
+        return {"snapshot_id": f"snap_{playlist_id}"}
+
+    build = AsyncMock(wraps=gen._build_candidate_pool)
+    with patch.object(spotify_api, "executors") as mock_executors, \
+            patch.object(gen, "_build_candidate_pool", build):
+        mock_executors.spotify.run = mock_run
+        results = await gen.execute_batch(
+            sample_user.id,
+            [
+                gen.BatchTarget("gym_pl", "Gym", max_tracks=3),
+                gen.BatchTarget("focus_pl", "Focus", max_minutes=5),
+                gen.BatchTarget("broken_pl", "Broken", max_tracks=1),
+            ],
+            mock_spotify, db_session,
+        )
+
+    assert build.await_count == 1
+    assert overlapped
+    gym, focus, broken = results
+    assert isinstance(broken, RuntimeError)
+    assert len(written["gym_pl"]) == len(gym.tracks) == 3
+    assert len(written["focus_pl"]) == len(focus.tracks) == 5
+
+    history = (await db_session.execute(select(GenerationHistory))).scalars().all()
+    assert sorted((h.target_playlist_name, h.track_count) for h in history) == [
+        ("Focus", 5), ("Gym", 3),
+    ]
+    assert {h.id for h in history} == {gym.history_id, focus.history_id}
@@ -0,0 +1,168 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from playlist_generator.models.job import GenerationJob
+from playlist_generator.models.user import User
+from playlist_generator.services import jobs
+from playlist_generator.services.generation import GenerationResult, TrackInfo
+
+
+def _queue(db_session: AsyncSession) -> jobs.JobQueue:
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    return jobs.JobQueue(workers=2, session_factory=factory)
+
+
+async def _fake_execute(**kwargs) -> GenerationResult:
+    await kwargs["progress"]("playlists_fetched", {"playlists": 1, "tracks": 2})
+    await kwargs["progress"]("chunk_written", {"chunk": 1, "chunks": 2})
+    await kwargs["progress"]("chunk_written", {"chunk": 2, "chunks": 2})
+    return GenerationResult(
+        tracks=[TrackInfo("t1", "One", "A", 60_000), TrackInfo("t2", "Two", "B", 60_000)],
+        total_duration_ms=120_000,
+        discovery_count=0,
+        history_id="history-1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_queued_job_and_worker_runs_it(
+    db_session: AsyncSession, sample_user: User
+):
+    queue = _queue(db_session)
+    execute = AsyncMock(side_effect=_fake_execute)
+
+    with patch.object(jobs.gen_service, "execute", execute), \
+            patch.object(jobs, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        job = await queue.submit(
+            sample_user.id, "target_pl", "Target", db_session, max_tracks=10
+        )
+        assert job.status == jobs.QUEUED
+
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+    await db_session.refresh(job)
+    assert job.status == jobs.SUCCEEDED
+    assert job.track_count == 2
+    assert job.generation_id == "history-1"
+    assert execute.await_args.kwargs["max_tracks"] == 10
+
+    timings = json.loads(job.stage_timings)
+    assert list(timings) == ["playlists_fetched", "chunk_written", "total"]
+    assert timings["total"] >= timings["chunk_written"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error(db_session: AsyncSession, sample_user: User):
+    queue = _queue(db_session)
+
+    with patch.object(jobs.gen_service, "execute", AsyncMock(side_effect=RuntimeError("boom"))), \
+            patch.object(jobs, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        job = await queue.submit(sample_user.id, "target_pl", "Target", db_session)
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+    await db_session.refresh(job)
+    assert job.status == jobs.FAILED
+    assert job.error == "boom"
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_start_resumes_queued_and_fails_interrupted_jobs(
+    db_session: AsyncSession, sample_user: User
+):
+    queued = GenerationJob(user_id=sample_user.id, target_playlist_id="a", status=jobs.QUEUED)
+    running = GenerationJob(user_id=sample_user.id, target_playlist_id="b", status=jobs.RUNNING)
+    db_session.add_all([queued, running])
+    await db_session.commit()
+
+    queue = _queue(db_session)
+    with patch.object(jobs.gen_service, "execute", AsyncMock(side_effect=_fake_execute)), \
+            patch.object(jobs, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+    await db_session.refresh(queued)
+    await db_session.refresh(running)
+    assert queued.status == jobs.SUCCEEDED
+    assert running.status == jobs.FAILED
+    assert running.error == "Interrupted by a restart"
+
+
+@pytest.mark.asyncio
+async def test_batch_jobs_run_together_with_one_execute_batch(
+    db_session: AsyncSession, sample_user: User
+):
+    queue = _queue(db_session)
+    result = GenerationResult(
+        tracks=[TrackInfo("t1", "One", "A", 60_000)],
+        total_duration_ms=60_000,
+        discovery_count=0,
+        history_id="history-gym",
+    )
+    execute_batch = AsyncMock(return_value=[result, RuntimeError("Spotify said no")])
+
+    with patch.object(jobs.gen_service, "execute_batch", execute_batch), \
+            patch.object(jobs, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        gym, focus = await queue.submit_batch(sample_user.id, [
+            jobs.gen_service.BatchTarget("gym_pl", "Gym", max_tracks=3),
+            jobs.gen_service.BatchTarget("focus_pl", "Focus", max_minutes=5),
+        ], db_session)
+        assert gym.status == focus.status == jobs.QUEUED
+        assert gym.batch_id == focus.batch_id
+
+        await queue.start()
+        await queue.join()
+        # Restart recovery may queue the other jobs of a batch; they are not rerun
+        await queue._run(focus.id)
+        await queue.stop()
+
+    execute_batch.assert_awaited_once()
+    targets = execute_batch.await_args.args[1]
+    assert [(t.playlist_id, t.max_tracks, t.max_minutes) for t in targets] == [
+        ("gym_pl", 3, None), ("focus_pl", None, 5),
+    ]
+
+    await db_session.refresh(gym)
+    await db_session.refresh(focus)
+    assert gym.status == jobs.SUCCEEDED
+    assert gym.generation_id == "history-gym"
+    assert focus.status == jobs.FAILED
+    assert focus.error == "Spotify said no"
+    assert gym.stage_timings == focus.stage_timings
+
+
+@pytest.mark.asyncio
+async def test_jobs_of_a_deleted_user_are_failed(db_session: AsyncSession, sample_user: User):
+    queue = _queue(db_session)
+    execute = AsyncMock(side_effect=_fake_execute)
+    execute_batch = AsyncMock()
+
+    with patch.object(jobs.gen_service, "execute", execute), \
+            patch.object(jobs.gen_service, "execute_batch", execute_batch):
+        job = await queue.submit(sample_user.id, "target_pl", "Target", db_session)
+        batch = await queue.submit_batch(sample_user.id, [
+            jobs.gen_service.BatchTarget("gym_pl", "Gym"),
+            jobs.gen_service.BatchTarget("focus_pl", "Focus"),
+        ], db_session)
+        await db_session.delete(sample_user)
+        await db_session.commit()
+
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+    execute.assert_not_awaited()
+    execute_batch.assert_not_awaited()
+    for j in [job, *batch]:
+        await db_session.refresh(j)
+        assert j.status == jobs.FAILED
+        assert j.error == "User no longer exists"
+        assert j.finished_at is not None
@@ -0,0 +1,97 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from playlist_generator.models.track_cache import PlaylistSnapshot, PlaylistSnapshotTrack
+from playlist_generator.services import playlist_cache
+from playlist_generator.services.playlist_cache import PlaylistContents, SharedContents
+
+
+def _contents(playlist_id: str, snapshot_id: str, n: int = 1) -> PlaylistContents:
+    tracks = [
+        {"id": f"{playlist_id}_{i}", "name": "Song", "artists": [{"name": "A"}], "duration_ms": 1}
+        for i in range(n)
+    ]
+    return PlaylistContents(playlist_id, snapshot_id, tracks)
+
+
+def test_shared_get_is_keyed_by_snapshot():
+    cache = SharedContents(max_bytes=1_000_000, ttl_seconds=60)
+    cache.put(_contents("pl", "s1"))
+
+    hit = cache.get("pl", "s1")
+    assert hit is not None and hit.from_cache
+    assert cache.get("pl", "s2") is None
+    assert cache.latest("pl").snapshot_id == "s1"
+
+
+def test_shared_evicts_least_recently_used_beyond_byte_budget():
+    one = playlist_cache._estimate_bytes(_contents("a", "s", 10).tracks)
+    cache = SharedContents(max_bytes=one * 2, ttl_seconds=60)
+    cache.put(_contents("a", "s", 10))
+    cache.put(_contents("b", "s", 10))
+    cache.get("a", "s")  # a is now the most recently used
+    cache.put(_contents("c", "s", 10))
+
+    assert cache.get("b", "s") is None
+    assert cache.get("a", "s") is not None
+    assert cache.get("c", "s") is not None
+    assert cache.bytes <= cache.max_bytes
+    assert cache.latest("b") is None
+
+
+def test_shared_entries_expire():
+    cache = SharedContents(max_bytes=1_000_000, ttl_seconds=60)
+    cache.put(_contents("pl", "s1"))
+
+    with patch.object(playlist_cache.time, "time", return_value=time.time() + 61):
+        assert cache.get("pl", "s1") is None
+    assert cache.metrics()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_store_fills_memory_and_load_skips_the_database(db_session: AsyncSession):
+    await playlist_cache.store([_contents("pl", "s1", 3)], db_session)
+    await db_session.execute(delete(PlaylistSnapshotTrack))
+    await db_session.execute(delete(PlaylistSnapshot))
+
+    loaded = await playlist_cache.load(["pl"], db_session)
+    assert loaded["pl"].snapshot_id == "s1"
+    assert len(loaded["pl"].tracks) == 3
+
+
+@pytest.mark.asyncio
+async def test_load_from_database_is_kept_in_memory(db_session: AsyncSession):
+    await playlist_cache.store([_contents("pl", "s1", 2)], db_session)
+    playlist_cache.shared.clear()
+
+    await playlist_cache.load(["pl"], db_session)
+    assert playlist_cache.shared.get("pl", "s1") is not None
+
+
+@pytest.mark.asyncio
+async def test_store_skips_a_snapshot_another_build_already_stored(db_session: AsyncSession):
+    """Two builds storing the same snapshot must not fail on the unique constraint."""
+    # Another build inserted this snapshot after ours read the cache
+    db_session.add(PlaylistSnapshot(spotify_playlist_id="pl", snapshot_id="s2", track_count=2))
+    await db_session.flush()
+
+    await playlist_cache.store(
+        [_contents("pl", "s2", 2), _contents("pl", "s2", 2), _contents("other", "s1")],
+        db_session,
+    )
+
+    snapshots = (await db_session.execute(select(PlaylistSnapshot))).scalars().all()
+    assert sorted((s.spotify_playlist_id, s.snapshot_id) for s in snapshots) == [
+        ("other", "s1"), ("pl", "s2"),
+    ]
+
+    # A newer snapshot still replaces the old one
+    await playlist_cache.store([_contents("pl", "s3", 1)], db_session)
+    playlist_cache.shared.clear()
+    loaded = await playlist_cache.load(["pl"], db_session)
+    assert loaded["pl"].snapshot_id == "s3"
+    assert len(loaded["pl"].tracks) == 1
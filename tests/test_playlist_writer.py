@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from playlist_generator.services import playlist_writer, spotify_api
+from playlist_generator.services.playlist_writer import WriteOp, plan_writes
+
+
+def _uris(n: int, prefix: str = "t") -> list[str]:
+    return [f"spotify:track:{prefix}{i}" for i in range(n)]
+
+
+def test_plan_identical_is_noop():
+    assert plan_writes(_uris(250), _uris(250)) == []
+
+
+def test_plan_unknown_current_replaces_without_empty_window():
+    ops = plan_writes(None, _uris(250))
+    assert [op.kind for op in ops] == ["replace", "add", "add"]
+    assert ops[0].uris == _uris(250)[:100]
+    assert all(op.uris for op in ops)
+
+
+def test_plan_shuffled_contents_replaces():
+    current = _uris(300)
+    desired = list(reversed(current))
+    ops = plan_writes(current, desired)
+    assert [op.kind for op in ops] == ["replace", "add", "add"]
+
+
+def test_plan_append_only_adds_tail():
+    ops = plan_writes(_uris(200), _uris(250))
+    assert ops == [WriteOp("add", _uris(250)[200:])]
+
+
+def test_plan_shrink_only_removes_tail():
+    ops = plan_writes(_uris(250), _uris(240))
+    assert ops == [WriteOp("remove", _uris(250)[240:])]
+
+
+def test_plan_removal_never_touches_kept_prefix():
+    # "t0" is kept at the front but also sits in the tail, so removal by URI is unsafe
+    current = _uris(150) + ["spotify:track:t0"]
+    ops = plan_writes(current, _uris(150))
+    assert ops[0].kind == "replace"
+
+
+def test_plan_empty_desired_clears():
+    assert plan_writes(None, []) == [WriteOp("replace", [])]
+
+
+@pytest.mark.asyncio
+async def test_apply_writes_threads_snapshot_id():
+    mock_spotify = MagicMock()
+    calls = []
+
+    async def mock_run(fn, *args, **kwargs):
+        calls.append((fn, args, kwargs))
+        return {"snapshot_id": f"snap_{len(calls)}"}
+
+    ops = [WriteOp("remove", ["spotify:track:a"]), WriteOp("remove", ["spotify:track:b"])]
+    with patch.object(spotify_api, "executors") as mock_executors:
+        mock_executors.spotify.run = mock_run
+        snapshot_id = await playlist_writer.apply_writes("pl", ops, mock_spotify, "snap_0")
+
+    assert snapshot_id == "snap_2"
+    assert calls[0][2]["snapshot_id"] == "snap_0"
+    assert calls[1][2]["snapshot_id"] == "snap_1"
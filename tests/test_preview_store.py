@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+import pytest
+
+from playlist_generator.services import preview_store
+from playlist_generator.services.generation import GenerationResult, TrackInfo
+
+
+@pytest.fixture(autouse=True)
+def _empty_store():
+    preview_store._previews.clear()
+    yield
+    preview_store._previews.clear()
+
+
+def _result() -> GenerationResult:
+    return GenerationResult([TrackInfo("t1", "One", "A", 1000)], 1000, 0)
+
+
+def test_get_returns_stored_preview_for_owner_only():
+    result = _result()
+    token = preview_store.put("user-1", result, {"max_tracks": 10})
+
+    stored = preview_store.get(token, "user-1")
+    assert stored is not None
+    assert stored.result is result
+    assert stored.params == {"max_tracks": 10}
+    assert preview_store.get(token, "user-2") is None
+    assert preview_store.get(None, "user-1") is None
+
+
+def test_expired_previews_are_dropped():
+    with patch.object(preview_store.time, "time", return_value=1000.0):
+        token = preview_store.put("user-1", _result(), {})
+    expires = 1000.0 + preview_store.settings.PREVIEW_TTL_SECONDS
+
+    with patch.object(preview_store.time, "time", return_value=expires - 1):
+        assert preview_store.get(token, "user-1") is not None
+    with patch.object(preview_store.time, "time", return_value=expires):
+        assert preview_store.get(token, "user-1") is None
+    assert not preview_store._previews
+
+
+def test_oldest_previews_evicted_beyond_size_cap():
+    with patch.object(preview_store.settings, "PREVIEW_MAX_ENTRIES", 2):
+        tokens = [preview_store.put("user-1", _result(), {}) for _ in range(3)]
+
+        assert preview_store.get(tokens[0], "user-1") is None
+        assert preview_store.get(tokens[1], "user-1") is not None
+        assert preview_store.get(tokens[2], "user-1") is not None
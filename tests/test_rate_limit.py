@@ -0,0 +1,188 @@
+from unittest.mock import patch
+
+import pytest
+import spotipy
+from spotipy.exceptions import SpotifyException
+
+from playlist_generator.services import rate_limit, spotify_api
+from playlist_generator.services.rate_limit import (
+    BACKGROUND,
+    INTERACTIVE,
+    RateLimitedSpotify,
+    RateLimiter,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, **kwargs) -> RateLimiter:
+    return RateLimiter(**{"rate": 10.0, "burst": 5, **kwargs}, clock=clock)
+
+
+def test_burst_then_refill():
+    """Tokens run out after the burst and come back at the configured rate."""
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    assert [limiter._try_take(INTERACTIVE) for _ in range(5)] == [0.0] * 5
+    assert limiter._try_take(INTERACTIVE) == pytest.approx(0.1)
+
+    clock.now += 0.1
+    assert limiter._try_take(INTERACTIVE) == 0.0
+
+
+def test_background_leaves_reserve_for_interactive():
+    clock = FakeClock()
+    limiter = _limiter(clock, background_reserve=2)
+
+    for _ in range(3):
+        assert limiter._try_take(BACKGROUND) == 0.0
+    assert limiter._try_take(BACKGROUND) > 0
+    # The reserved tokens are still there for interactive calls
+    assert limiter._try_take(INTERACTIVE) == 0.0
+    assert limiter._try_take(INTERACTIVE) == 0.0
+
+
+def test_background_yields_to_waiting_interactive_calls():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    limiter._enter(INTERACTIVE)
+    assert limiter._try_take(BACKGROUND) > 0
+    assert limiter._try_take(INTERACTIVE) == 0.0
+
+
+def test_pause_blocks_every_caller_until_retry_after():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.pause(3)
+    assert limiter._try_take(INTERACTIVE) == pytest.approx(3)
+    assert limiter._try_take(BACKGROUND) == pytest.approx(3)
+
+    clock.now += 3.1
+    assert limiter._try_take(INTERACTIVE) == 0.0
+    metrics = limiter.metrics()
+    assert metrics["throttled_total"] == 1
+    assert metrics["paused_for_seconds"] == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_records_wait_metrics():
+    clock = FakeClock()
+    limiter = _limiter(clock, burst=1)
+
+    async def fake_sleep(seconds):
+        clock.sleep(seconds)
+
+    with patch.object(rate_limit.asyncio, "sleep", fake_sleep):
+        await limiter.acquire(INTERACTIVE)
+        await limiter.acquire(INTERACTIVE)
+
+    stats = limiter.metrics()["priorities"][INTERACTIVE]
+    assert stats["calls"] == 2
+    assert stats["waiting"] == 0
+    assert stats["max_wait_ms"] == pytest.approx(100, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_client_pauses_globally_and_retries_on_429():
+    """A 429 pauses the shared limiter for Retry-After, then the call is retried."""
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    throttled = SpotifyException(429, -1, "slow down", headers={"Retry-After": "2"})
+
+    async def fake_sleep(seconds):
+        clock.sleep(seconds)
+
+    with (
+        patch.object(rate_limit, "limiter", limiter),
+        patch.object(rate_limit.asyncio, "sleep", fake_sleep),
+        patch.object(
+            spotipy.Spotify, "_internal_call", side_effect=[throttled, {"id": "t1"}]
+        ) as call,
+    ):
+        client = RateLimitedSpotify(auth="token")
+        result = await spotify_api.call(client.track, "t1")
+
+    assert result == {"id": "t1"}
+    assert call.call_count == 2
+    assert clock.now >= 1002.0
+    assert limiter.metrics()["throttled_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_gives_up_after_retries():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    throttled = SpotifyException(429, -1, "slow down", headers={"Retry-After": "1"})
+
+    async def fake_sleep(seconds):
+        clock.sleep(seconds)
+
+    with (
+        patch.object(rate_limit, "limiter", limiter),
+        patch.object(rate_limit.asyncio, "sleep", fake_sleep),
+        patch.object(rate_limit.settings, "SPOTIFY_RATE_LIMIT_RETRIES", 1),
+        patch.object(spotipy.Spotify, "_internal_call", side_effect=throttled) as call,
+    ):
+        client = RateLimitedSpotify(auth="token")
+        with pytest.raises(SpotifyException):
+            await spotify_api.call(client.track, "t1")
+
+    assert call.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_client_waits_for_its_token_before_taking_a_pool_thread():
+    """A background call held back by the reserve does not occupy the spotify pool."""
+    clock = FakeClock()
+    limiter = _limiter(clock, burst=2, background_reserve=1)
+    limiter._tokens = 1.0  # only the reserve is left
+    dispatched: list[float] = []
+
+    async def fake_sleep(seconds):
+        assert not dispatched
+        clock.sleep(seconds)
+
+    async def fake_run(fn, *args, **kwargs):
+        dispatched.append(clock.now)
+        return {"id": "t1"}
+
+    with (
+        patch.object(rate_limit, "limiter", limiter),
+        patch.object(rate_limit.asyncio, "sleep", fake_sleep),
+        patch.object(spotify_api, "executors") as mock_executors,
+        rate_limit.background(),
+    ):
+        mock_executors.spotify.run = fake_run
+        client = RateLimitedSpotify(auth="token")
+        assert await spotify_api.call(client.track, "t1") == {"id": "t1"}
+
+    assert dispatched == [pytest.approx(1000.1)]
+    assert limiter.metrics()["priorities"][BACKGROUND]["calls"] == 1
+
+
+def test_client_session_leaves_429_to_the_limiter():
+    """urllib3 must not sleep on Retry-After and retry a 429 inside the thread."""
+    client = RateLimitedSpotify(auth="token")
+    retry = client._session.get_adapter("https://api.spotify.com/").max_retries
+    assert 429 not in retry.status_forcelist
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+    assert retry.is_retry("GET", 503)
+
+
+def test_background_context_sets_priority():
+    assert rate_limit.priority.get() == INTERACTIVE
+    with rate_limit.background():
+        assert rate_limit.priority.get() == BACKGROUND
+    assert rate_limit.priority.get() == INTERACTIVE
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from playlist_generator.cron import CronError
+from playlist_generator.models.schedule import GenerationSchedule, ScheduleRun
+from playlist_generator.models.target import TargetPlaylist
+from playlist_generator.models.user import User
+from playlist_generator.services import scheduler as sched
+from playlist_generator.services.generation import GenerationResult, TrackInfo
+
+
+@pytest_asyncio.fixture
+async def target(db_session: AsyncSession, sample_user: User) -> TargetPlaylist:
+    target = TargetPlaylist(user_id=sample_user.id, spotify_playlist_id="target_pl", playlist_name="Morning")
+    db_session.add(target)
+    await db_session.commit()
+    return target
+
+
+def _scheduler(db_session: AsyncSession, **kwargs) -> sched.Scheduler:
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    return sched.Scheduler(session_factory=factory, jitter_seconds=0, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_save_schedule_validates_and_sets_next_run(
+    db_session: AsyncSession, sample_user: User, target: TargetPlaylist
+):
+    with pytest.raises(CronError):
+        await sched.save_schedule(sample_user.id, target.id, "not cron", "UTC", db_session)
+    with pytest.raises(CronError):
+        await sched.save_schedule(sample_user.id, target.id, "0 6 * * *", "Mars/Base", db_session)
+
+    schedule = await sched.save_schedule(
+        sample_user.id, target.id, "0 6 * * *", "UTC", db_session, max_tracks=50
+    )
+    assert schedule.next_run_at > time.time()
+    assert time.gmtime(schedule.next_run_at).tm_hour == 6
+
+    # Saving again replaces the target's schedule
+    await sched.save_schedule(sample_user.id, target.id, "30 7 * * *", "UTC", db_session)
+    assert len(await sched.get_schedules(sample_user.id, db_session)) == 1
+
+
+@pytest.mark.asyncio
+async def test_tick_runs_due_schedule_once_and_logs_run(
+    db_session: AsyncSession, sample_user: User, target: TargetPlaylist
+):
+    schedule = await sched.save_schedule(
+        sample_user.id, target.id, "0 6 * * *", "UTC", db_session, max_tracks=20
+    )
+    due_at = schedule.next_run_at
+    execute = AsyncMock(return_value=GenerationResult(
+        [TrackInfo("t1", "", "", 1000)], 1000, 0, history_id="h1"
+    ))
+    scheduler = _scheduler(db_session)
+
+    with patch.object(sched.gen_service, "execute", execute), \
+            patch.object(sched, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        assert await scheduler.tick(now=due_at - 1) == []
+        assert await scheduler.tick(now=due_at) == [schedule.id]
+        assert await scheduler.tick(now=due_at) == []  # slot already claimed
+        await scheduler.drain()
+
+    assert execute.await_args.kwargs["target_playlist_id"] == "target_pl"
+    assert execute.await_args.kwargs["max_tracks"] == 20
+
+    await db_session.refresh(schedule)
+    assert schedule.next_run_at == due_at + 24 * 3600
+    runs = (await db_session.execute(select(ScheduleRun))).scalars().all()
+    assert [(r.status, r.track_count, r.generation_id) for r in runs] == [("succeeded", 1, "h1")]
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_logged(
+    db_session: AsyncSession, sample_user: User, target: TargetPlaylist
+):
+    schedule = await sched.save_schedule(sample_user.id, target.id, "@hourly", "UTC", db_session)
+    scheduler = _scheduler(db_session)
+
+    with patch.object(sched.gen_service, "execute", AsyncMock(side_effect=RuntimeError("429"))), \
+            patch.object(sched, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        await scheduler.tick(now=schedule.next_run_at)
+        await scheduler.drain()
+
+    runs = await sched.get_runs(schedule.id, db_session)
+    assert [(r.status, r.error) for r in runs] == [("failed", "429")]
+
+
+@pytest.mark.asyncio
+async def test_runs_are_bounded_by_concurrency(db_session: AsyncSession, sample_user: User):
+    for i in range(4):
+        target = TargetPlaylist(user_id=sample_user.id, spotify_playlist_id=f"pl_{i}")
+        db_session.add(target)
+        await db_session.flush()
+        db_session.add(GenerationSchedule(
+            user_id=sample_user.id, target_id=target.id, cron="@hourly", next_run_at=0.0,
+        ))
+    await db_session.commit()
+
+    in_flight = 0
+    peak = 0
+
+    async def execute(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return GenerationResult([], 0, 0)
+
+    scheduler = _scheduler(db_session, concurrency=2)
+    with patch.object(sched.gen_service, "execute", execute), \
+            patch.object(sched, "get_spotify_client", AsyncMock(return_value=MagicMock())):
+        assert len(await scheduler.tick(now=10.0)) == 4
+        await scheduler.drain()
+
+    assert peak == 2
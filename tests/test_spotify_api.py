@@ -0,0 +1,205 @@
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+from spotipy.exceptions import SpotifyException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from playlist_generator.models.user import User
+from playlist_generator.services import rate_limit, spotify_api, spotify_auth
+from playlist_generator.services.rate_limit import RateLimiter
+from playlist_generator.services.spotify_api import AsyncSpotify
+
+
+def _client(handler) -> AsyncSpotify:
+    return AsyncSpotify("token", http=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiter():
+    with patch.object(rate_limit, "limiter", RateLimiter(rate=1000.0, burst=100)):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_call_runs_sync_methods_in_a_thread_and_awaits_async_ones():
+    sync_client = MagicMock()
+    sync_client.track.return_value = {"id": "sync"}
+    assert await spotify_api.call(sync_client.track, "t1") == {"id": "sync"}
+    sync_client.track.assert_called_once_with("t1")
+
+    async_client = _client(lambda request: httpx.Response(200, json={"id": "async"}))
+    assert await spotify_api.call(async_client.track, "t1") == {"id": "async"}
+
+
+@pytest.mark.asyncio
+async def test_playlist_tracks_sends_params_and_token():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"items": [], "next": None})
+
+    client = _client(handler)
+    result = await client.playlist_tracks("pl1", fields="items(track(id))", limit=100, offset=200)
+
+    assert result == {"items": [], "next": None}
+    request = seen[0]
+    assert request.url.path == "/v1/playlists/pl1/items"
+    assert request.url.params["limit"] == "100"
+    assert request.url.params["offset"] == "200"
+    assert request.url.params["fields"] == "items(track(id))"
+    assert "market" not in request.url.params
+    assert request.headers["Authorization"] == "Bearer token"
+
+
+@pytest.mark.asyncio
+async def test_next_follows_the_next_url():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == "https://api.spotify.com/v1/playlists/pl1/items?offset=100"
+        return httpx.Response(200, json={"items": [1], "next": None})
+
+    client = _client(handler)
+    page = await client.next({"next": "https://api.spotify.com/v1/playlists/pl1/items?offset=100"})
+    assert page == {"items": [1], "next": None}
+    assert await client.next({"next": None}) is None
+
+
+@pytest.mark.asyncio
+async def test_writes_send_track_uris():
+    bodies: list[tuple[str, dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.method, json.loads(request.content)))
+        return httpx.Response(201, json={"snapshot_id": "s2"})
+
+    client = _client(handler)
+    await client.playlist_replace_items("pl1", ["a", "spotify:track:b"])
+    await client.playlist_add_items("pl1", ["c"])
+    await client.playlist_remove_all_occurrences_of_items("pl1", ["d"])
+
+    assert bodies == [
+        ("PUT", {"uris": ["spotify:track:a", "spotify:track:b"]}),
+        ("POST", ["spotify:track:c"]),
+        ("DELETE", {"items": [{"uri": "spotify:track:d"}]}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_429_pauses_the_shared_limiter_and_retries():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"id": "t1"}),
+    ]
+    client = _client(lambda request: responses.pop(0))
+
+    assert await client.track("t1") == {"id": "t1"}
+    assert rate_limit.limiter.metrics()["throttled_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_raise_spotify_exception():
+    client = _client(
+        lambda request: httpx.Response(404, json={"error": {"status": 404, "message": "Not found"}})
+    )
+    with pytest.raises(SpotifyException) as exc:
+        await client.playlist("missing")
+    assert exc.value.http_status == 404
+    assert "Not found" in exc.value.msg
+
+
+@pytest.mark.asyncio
+async def test_network_errors_raise_what_spotipy_raises():
+    attempts = 0
+
+    def refuse(request):
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    with patch.object(spotify_api, "_BACKOFF_SECONDS", 0):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            await _client(refuse).track("t1")
+    assert attempts == spotify_api.settings.SPOTIFY_RATE_LIMIT_RETRIES + 1
+
+    def time_out(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    with pytest.raises(requests.exceptions.Timeout):
+        await _client(time_out).track("t1")
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_are_retried():
+    responses: list = [httpx.ConnectError("reset"), httpx.Response(200, json={"id": "t1"})]
+
+    def handler(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    with patch.object(spotify_api, "_BACKOFF_SECONDS", 0):
+        assert await _client(handler).track("t1") == {"id": "t1"}
+
+
+@pytest.mark.asyncio
+async def test_call_shared_does_not_share_between_users():
+    """A concurrent read of a private playlist is not answered with another user's result."""
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.headers["Authorization"])
+        await asyncio.sleep(0.01)
+        if request.headers["Authorization"] == "Bearer owner":
+            return httpx.Response(200, json={"id": "pl", "snapshot_id": "s1"})
+        return httpx.Response(404, json={"error": {"status": 404, "message": "Not found"}})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    owner, other = AsyncSpotify("owner", http=http), AsyncSpotify("other", http=http)
+
+    for first, second in ((owner, other), (other, owner)):
+        results = await asyncio.gather(
+            spotify_api.call_shared(first.playlist, "pl"),
+            spotify_api.call_shared(second.playlist, "pl"),
+            return_exceptions=True,
+        )
+        by_client = dict(zip((first, second), results))
+        assert by_client[owner]["snapshot_id"] == "s1"
+        assert isinstance(by_client[other], SpotifyException)
+        assert by_client[other].http_status == 404
+
+    assert sorted(requests) == ["Bearer other"] * 2 + ["Bearer owner"] * 2
+
+
+@pytest.mark.asyncio
+async def test_call_shared_shares_catalogue_reads_between_users():
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "t1"})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    first, second = AsyncSpotify("a", http=http), AsyncSpotify("b", http=http)
+    results = await asyncio.gather(
+        spotify_api.call_shared(first.track, "t1"),
+        spotify_api.call_shared(second.track, "t1"),
+    )
+
+    assert results == [{"id": "t1"}] * 2
+    assert requests == 1
+
+
+@pytest.mark.asyncio
+async def test_get_spotify_client_honours_async_setting(
+    db_session: AsyncSession, sample_user: User
+):
+    with patch.object(spotify_auth.settings, "SPOTIFY_ASYNC_CLIENT", True):
+        client = await spotify_auth.get_spotify_client(sample_user, db_session)
+    assert isinstance(client, AsyncSpotify)
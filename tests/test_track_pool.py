@@ -0,0 +1,63 @@
+import random
+from collections import Counter
+from itertools import islice
+
+from playlist_generator.services.track_pool import TrackInfo, TrackPool, lazy_shuffle
+
+
+def _pool(n: int, duration_ms: int = 1000) -> TrackPool:
+    pool = TrackPool()
+    for i in range(n):
+        pool.add(f"t{i}", f"Track {i}", f"Artist {i % 3}", duration_ms)
+    return pool
+
+
+def test_add_dedupes_and_first_source_wins():
+    pool = TrackPool()
+    assert pool.add("a", "First", "X", 1000)
+    assert not pool.add("a", "Second", "Y", 2000)
+    assert pool.add_spotify_track({"id": "b", "name": "B", "artists": [{"name": "Z"}], "duration_ms": 5})
+
+    assert list(pool) == [TrackInfo("a", "First", "X", 1000), TrackInfo("b", "B", "Z", 5)]
+    assert "a" in pool and "c" not in pool
+
+
+def test_artist_strings_are_shared():
+    pool = TrackPool()
+    pool.add("a", "A", "".join(["Sa", "me"]), 1)
+    pool.add("b", "B", "".join(["Sa", "me"]), 1)
+    assert pool.artists[0] is pool.artists[1]
+
+
+def test_exclude_keeps_order():
+    pool = _pool(5).exclude({"t1", "t3"})
+    assert pool.ids == ["t0", "t2", "t4"]
+    assert "t1" not in pool
+
+
+def test_add_from_and_discovery_count():
+    pool = _pool(3)
+    extra = TrackPool()
+    extra.add("t0", "dup", "", 1, is_discovery=True)
+    extra.add("d1", "D", "", 1, is_discovery=True)
+    for i in range(len(extra)):
+        pool.add_from(extra, i)
+
+    assert pool.ids == ["t0", "t1", "t2", "d1"]
+    assert pool.discovery_count() == 1
+
+
+def test_lazy_shuffle_is_a_permutation():
+    random.seed(3)
+    assert sorted(lazy_shuffle(100)) == list(range(100))
+    assert list(lazy_shuffle(0)) == []
+
+
+def test_lazy_shuffle_first_draws_are_uniform():
+    random.seed(5)
+    counts = Counter(next(lazy_shuffle(4)) for _ in range(4000))
+    assert set(counts) == {0, 1, 2, 3}
+    assert all(800 < c < 1200 for c in counts.values())
+
+    # Drawing a few indices from a huge range is cheap
+    assert len(set(islice(lazy_shuffle(10**12), 5))) == 5